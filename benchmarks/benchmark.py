@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Model Benchmarks
+================
+
+:Date:
+    2026-10-18
+:File:
+    benchmark.py
+
+Builds and runs models of synthetic transcriptional regulatory networks of
+increasing size and density and reports the time and peak memory of every
+phase as JSON. With the package installed or on the PYTHONPATH run, e.g.,
+
+    python benchmarks/benchmark.py --sizes 10,100,1000 --output results.json
+
+Every configuration is built in its own registry from a fixed seed, so two
+versions of the package can be compared on identical models and each
+configuration runs in a fresh worker process. Peak memory is measured with
+`tracemalloc` where available (Python 3). Otherwise it is the amount by which
+a phase raised the resident set size high-water mark of the worker, i.e.,
+the memory a phase needed beyond the peak of the phases before it.
+"""
+
+
+import sys
+import json
+import time
+import logging
+import platform
+import argparse
+import itertools
+import multiprocessing
+
+from timeit import default_timer
+
+import numpy
+import networkx as nx
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+    import resource
+
+from regpy.model.misc import ModelParameters
+from regpy.model.registry import Registry
+from regpy.model.sequence import Sequence, GeneSite, EmptySite, network2trn
+
+
+logger = logging.getLogger("benchmark")
+
+
+parameters = ModelParameters()
+
+
+def peak_rss():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on Mac OS X
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class Measurement(object):
+    """
+    Times a block and records its peak memory use.
+    """
+
+    def __init__(self, results, name, *args, **kw_args):
+        object.__init__(self)
+        self.results = results
+        self.name = name
+
+    def __enter__(self):
+        if tracemalloc is not None:
+            tracemalloc.start()
+        else:
+            self.base = peak_rss()
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = default_timer() - self.start
+        if tracemalloc is not None:
+            (current, peak) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            peak = peak_rss() - self.base
+        self.results[self.name] = {"time": elapsed, "peak_memory": peak}
+        return False
+
+
+def synthetic_network(num_genes, degree, seed):
+    """
+    Random directed network with on average `degree` regulators per gene.
+    """
+    prob = min(float(degree) / max(num_genes - 1, 1), 1.0)
+    return nx.fast_gnp_random_graph(num_genes, prob, seed=seed, directed=True)
+
+
+def introduce(model, load, rng):
+    if rng.random_sample() < load:
+        model.introduce_polymerase()
+
+
+def edit(seq, rng):
+    """
+    Inserts and deletes a spacer and moves an element back and forth, four
+    edits that leave the sequence as it was.
+    """
+    index = rng.randint(len(seq) + 1)
+    seq.insert_sites(index, [EmptySite()])
+    seq.delete_sites(index)
+    (index, target) = rng.randint(len(seq), size=2)
+    seq.move_sites(index, 1, target)
+    seq.move_sites(target, 1, index)
+
+
+def run_configuration(num_genes, degree, nap_fraction, nap_sites, load, steps,
+        edits, seed):
+    """
+    Builds and runs one model and measures each phase.
+
+    Parameters
+    ----------
+    num_genes: int
+        Number of genes.
+    degree: float
+        Mean number of regulators per gene.
+    nap_fraction: float
+        Fraction of the genes without TF product that encode NAPs instead.
+    nap_sites: float
+        Mean number of binding sites per NAP.
+    load: float
+        Probability of introducing a polymerase in each step.
+    steps: int
+        Number of steps of each engine.
+    edits: int
+        Number of edits of the sequence after stepping, a multiple of four.
+    seed: int
+        Seed of the network and the model's random numbers.
+    """
+    numpy.random.seed(seed)
+    rng = numpy.random.RandomState(seed)
+    parameters.sequence.nap.mean = nap_sites
+    phases = dict()
+    rates = dict()
+    with Registry():
+        network = synthetic_network(num_genes, degree, seed)
+        with Measurement(phases, "network2trn"):
+            trn = network2trn(network)
+        seq = Sequence()
+        with Measurement(phases, "linearise_trn"):
+            seq.linearise_trn(trn)
+        genes = [site for site in seq if isinstance(site, GeneSite)]
+        with Measurement(phases, "initialise_promoters"):
+            seq.initialise_promoters(genes)
+        candidates = [gene for gene in genes if gene.product is None]
+        nap_genes = candidates[:int(round(nap_fraction * len(candidates)))]
+        with Measurement(phases, "initialise_naps"):
+            if nap_genes and nap_sites > 0:
+                seq.initialise_naps(nap_genes)
+        with Measurement(phases, "initialise"):
+            seq.initialise()
+        with Measurement(phases, "compile"):
+            compiled = seq.compile()
+        with Measurement(phases, "next"):
+            for i in range(steps):
+                introduce(seq, load, rng)
+                seq.next()
+        rates["next"] = steps / phases["next"]["time"]
+        with Measurement(phases, "compiled_next"):
+            for i in range(steps):
+                introduce(compiled, load, rng)
+                compiled.next()
+        rates["compiled_next"] = steps / phases["compiled_next"]["time"]
+        with Measurement(phases, "edits"):
+            for i in range(edits // 4):
+                edit(seq, rng)
+        rates["edits"] = (edits // 4) * 4 / phases["edits"]["time"]
+        polymerases = len(compiled.polymerases)
+        sites = len(seq)
+    return {
+        "genes": num_genes,
+        "degree": degree,
+        "nap_fraction": nap_fraction,
+        "nap_sites": nap_sites,
+        "load": load,
+        "steps": steps,
+        "edits": edits,
+        "seed": seed,
+        "edges": network.number_of_edges(),
+        "elements": sites,
+        "polymerases": polymerases,
+        "phases": phases,
+        "steps_per_second": rates
+    }
+
+
+def _run_task(args):
+    return run_configuration(*args)
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "networkx": nx.__version__,
+        "platform": platform.platform(),
+        "memory": "tracemalloc" if tracemalloc is not None else\
+                "ru_maxrss increase",
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+
+def parse_list(cast):
+    return lambda text: [cast(item) for item in text.split(",") if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures building and"\
+            " stepping of synthetic models.")
+    parser.add_argument("--sizes", type=parse_list(int),
+            default=[10, 100, 1000, 10000], help="numbers of genes")
+    parser.add_argument("--degrees", type=parse_list(float), default=[1.0, 3.0],
+            help="mean numbers of regulators per gene")
+    parser.add_argument("--nap-fractions", type=parse_list(float),
+            default=[0.0, 0.1], help="fractions of non-TF genes encoding NAPs")
+    parser.add_argument("--nap-sites", type=float, default=5.0,
+            help="mean number of binding sites per NAP")
+    parser.add_argument("--loads", type=parse_list(float), default=[0.1, 0.9],
+            help="probabilities of introducing a polymerase per step")
+    parser.add_argument("--steps", type=int, default=100,
+            help="steps per engine")
+    parser.add_argument("--edits", type=int, default=20,
+            help="insertions, deletions and moves of sequence elements")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None,
+            help="file to write the JSON results to (default: stdout)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    tasks = [(size, degree, nap_fraction, args.nap_sites, load, args.steps,
+            args.edits, args.seed) for (size, degree, nap_fraction, load) in\
+            itertools.product(args.sizes, args.degrees, args.nap_fractions,
+            args.loads)]
+    results = list()
+    # a new process for every configuration so that memory peaks of one do
+    # not hide those of the next
+    pool = multiprocessing.Pool(1, maxtasksperchild=1)
+    try:
+        for record in pool.imap(_run_task, tasks, 1):
+            logger.info("genes %d, degree %g, NAP fraction %g, load %g:"\
+                    " %.1f steps/s, compiled %.1f steps/s, %.1f edits/s",
+                    record["genes"], record["degree"], record["nap_fraction"],
+                    record["load"], record["steps_per_second"]["next"],
+                    record["steps_per_second"]["compiled_next"],
+                    record["steps_per_second"]["edits"])
+            results.append(record)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    report = {
+        "version": 1,
+        "environment": environment(),
+        "results": results
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=1, sort_keys=True)
+    else:
+        with open(args.output, "w") as file_h:
+            json.dump(report, file_h, indent=1, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
+
@@ -2,4 +2,10 @@
 
 from .model.misc import ModelParameters
 from .model.sequence import Sequence, network2trn
+from .model.ingest import edges2sequence, adjacency2sequence
+from .model.compiled import CompiledSequence
+from .model.stochastic import StochasticSequence
+from .model.genome import Genome
 
+from .model.ensemble import EnsembleSequence
+from .model.registry import Registry
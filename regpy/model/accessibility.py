@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+======================
+Sequence Accessibility
+======================
+
+:Date:
+    2026-10-18
+:File:
+    accessibility.py
+
+Bound NAPs change the super-coiling of the sequence around them and thereby
+how accessible genes in that domain are to polymerases. The level of a gene
+is the summed regulation (-2 to 2) of all bound NAP sites within a window of
+base pairs around it, its accessibility is
+
+    max(1 + effect * level, 0)
+
+and scales the rate at which the gene is transcribed. The parameters
+`threshold`, `window` and `effect` live in `parameters.sequence.nap`, with the
+default effect of zero accessibility is always one.
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+from .coordinates import CoordinateIndex
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class NAPLayout(object):
+    """
+    NAP binding sites of a sequence and the genes within their reach.
+
+    Occupancy of all sites is computed from the concentration vector in one
+    operation like for a `regpy.model.promoters.PromoterMatrix`. The levels
+    of all genes come from prefix sums over the regulation of bound sites in
+    sequence order, every gene covers a fixed range of sites that is looked
+    up once when the layout is built.
+    """
+
+    def __init__(self, position, ligand, factor, regulation, gene_position,
+            window, effect, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        position: sequence
+            Base pair coordinate of each NAP site.
+        ligand: sequence
+            Index of the product binding each site.
+        factor: sequence
+            Binding factor of each site.
+        regulation: sequence
+            Regulation level of each site.
+        gene_position: sequence
+            Base pair coordinate of each gene.
+        window: int
+            Greatest distance in base pairs between a gene and the NAP sites
+            affecting it.
+        effect: float
+            Change in accessibility per regulation level.
+        """
+        object.__init__(self)
+        self.position = numpy.asarray(position, dtype=int)
+        self.ligand = numpy.asarray(ligand, dtype=numpy.intp)
+        self.factor = numpy.asarray(factor, dtype=float)
+        self.regulation = numpy.asarray(regulation, dtype=int)
+        self.window = int(window)
+        self.effect = float(effect)
+        self.relocate(self.position, gene_position)
+
+    def relocate(self, position, gene_position):
+        """
+        Moves sites and genes to new coordinates, e.g., after an edit of the
+        sequence, and looks up the range of sites of every gene again.
+        """
+        self.position = numpy.asarray(position, dtype=int)
+        self.gene_position = numpy.asarray(gene_position, dtype=int)
+        self.order = numpy.argsort(self.position, kind="mergesort")
+        ordered = self.position[self.order]
+        self.lower = numpy.searchsorted(ordered,
+                self.gene_position - self.window, side="left")
+        self.upper = numpy.searchsorted(ordered,
+                self.gene_position + self.window, side="right")
+
+    def __len__(self):
+        """
+        Number of NAP sites.
+        """
+        return len(self.ligand)
+
+    def occupancy(self, concentrations):
+        """
+        Binding factor times ligand concentration for every site.
+
+        Parameters
+        ----------
+        concentrations: numpy.ndarray
+            Concentration vector indexed by product, optionally with a leading
+            replicate axis.
+        """
+        return self.factor * numpy.asarray(concentrations)[..., self.ligand]
+
+    def bind(self, concentrations, threshold):
+        """
+        Bound state of all sites given the concentrations of their ligands.
+        """
+        return self.occupancy(concentrations) >= threshold
+
+    def levels(self, bound):
+        """
+        Summed regulation of the bound sites in the window of every gene.
+
+        Parameters
+        ----------
+        bound: numpy.ndarray
+            Bound flags of the sites, optionally with a leading replicate
+            axis.
+        """
+        weights = numpy.where(bound, self.regulation, 0)[..., self.order]
+        sums = numpy.zeros(weights.shape[:-1] + (len(self) + 1,), dtype=int)
+        numpy.cumsum(weights, axis=-1, out=sums[..., 1:])
+        return sums[..., self.upper] - sums[..., self.lower]
+
+    def accessibility(self, bound):
+        """
+        Factor on the transcription rate of every gene.
+        """
+        return numpy.maximum(1.0 + self.effect * self.levels(bound), 0.0)
+
+
+def nap_layout(elements, index, window, effect, coordinates=None):
+    """
+    Collects the NAP binding sites among the elements of a sequence.
+
+    Parameters
+    ----------
+    elements: iterable
+        Sequence elements in order.
+    index: callable
+        Maps a ligand to its index in the concentration vector.
+    window: int
+        See `NAPLayout`.
+    effect: float
+        See `NAPLayout`.
+    coordinates: CoordinateIndex (optional)
+        Coordinates of the elements, computed if not given.
+
+    Returns
+    -------
+    A `NAPLayout`, the list of NAP sites and their element indices.
+    """
+    # circular import
+    from .sequence import GeneSite, NAPBindingSite
+    elements = list(elements)
+    if coordinates is None or len(coordinates) != len(elements):
+        coordinates = CoordinateIndex(elements)
+    sites = list()
+    positions = list()
+    genes = list()
+    for (i, site) in enumerate(elements):
+        if isinstance(site, NAPBindingSite):
+            sites.append(site)
+            positions.append(i)
+        elif isinstance(site, GeneSite):
+            genes.append(i)
+    positions = numpy.array(positions, dtype=numpy.intp)
+    layout = NAPLayout(coordinates[positions],
+            [index(site.ligand) for site in sites],
+            [site.factor for site in sites],
+            [site.regulation for site in sites],
+            coordinates[numpy.array(genes, dtype=numpy.intp)], window, effect)
+    return (layout, sites, positions)
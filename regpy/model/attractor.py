@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===================
+Attractor Detection
+===================
+
+:Date:
+    2026-10-18
+:File:
+    attractor.py
+
+A deterministic compiled sequence whose input is periodic must eventually
+revisit a state. From then on it follows the same sequence of states forever,
+so stepping further only repeats known results. Every state is reduced to a
+digest of its arrays, the first repeated digest ends the run.
+"""
+
+
+import hashlib
+import logging
+import numpy
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+def state_arrays(compiled):
+    """
+    The arrays that make up the full state of a `CompiledSequence`.
+    """
+    pool = compiled.polymerases
+    return (compiled.concentrations, compiled.tf_bound, compiled.gene_rate,
+            compiled.gene_active, compiled.occupied, pool.position, pool.bound,
+            pool.was_bound)
+
+
+def fingerprint(compiled, phase=0):
+    """
+    A compact digest of the state of a `CompiledSequence`.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        The model to inspect.
+    phase: int (optional)
+        Position within the period of the input driving the model.
+    """
+    digest = hashlib.sha1(numpy.int64(phase).tostring())
+    for arr in state_arrays(compiled):
+        if arr.dtype.kind == "f":
+            # do not tell apart -0.0 and 0.0
+            arr = arr + 0.0
+        digest.update(numpy.ascontiguousarray(arr).tostring())
+    return digest.digest()
+
+
+def snapshot(compiled):
+    """
+    Copies the state of a `CompiledSequence` into a dictionary.
+    """
+    pool = compiled.polymerases
+    return {
+        "concentrations": compiled.concentrations[:-1].copy(),
+        "tf_bound": compiled.tf_bound.copy(),
+        "rate": compiled.gene_rate.copy(),
+        "active": compiled.gene_active.copy(),
+        "polymerases": pool.position.copy(),
+        "rnap_bound": pool.bound.copy()
+    }
+
+
+class Attractor(object):
+    """
+    Outcome of a search for the attractor of a run.
+
+    Attributes
+    ----------
+    steps: int
+        Number of steps taken.
+    transient: int
+        Step at which the state first entered the cycle, `None` if no state
+        repeated within the budget.
+    period: int
+        Length of the cycle, 1 for a fixed point, `None` if none was found.
+    states: list
+        Snapshots of the states on the cycle starting at `transient`.
+    """
+
+    def __init__(self, steps, transient=None, period=None, states=None,
+            *args, **kw_args):
+        object.__init__(self)
+        self.steps = steps
+        self.transient = transient
+        self.period = period
+        self.states = list() if states is None else states
+
+    @property
+    def found(self):
+        return self.period is not None
+
+    @property
+    def fixed_point(self):
+        return self.period == 1
+
+    def __str__(self):
+        if not self.found:
+            return "no attractor within %d steps" % self.steps
+        return "cycle of length %d after %d steps" % (self.period,
+                self.transient)
+
+
+def find_attractor(compiled, steps, drive=None, period=1, collect=True):
+    """
+    Steps a compiled sequence until it revisits a state or the budget runs
+    out.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        A deterministic model, it is advanced in place.
+    steps: int
+        Maximum number of steps.
+    drive: callable (optional)
+        Called with the current step number before each step, e.g., to
+        introduce polymerases. It must only depend on the step number modulo
+        `period`.
+    period: int (optional)
+        Period of the input applied by `drive`.
+    collect: bool (optional)
+        Step once more around the cycle to collect snapshots of its states.
+
+    Returns
+    -------
+    An `Attractor`, on success the model is left in the state the cycle
+    started at (after another full cycle if `collect` is set).
+    """
+    if not getattr(compiled, "deterministic", False):
+        raise ValueError("attractors are only defined for deterministic"\
+                " models, not %s" % compiled.__class__.__name__)
+    period = max(int(period), 1)
+    seen = dict()
+    seen[fingerprint(compiled)] = 0
+    for step in range(int(steps)):
+        if drive is not None:
+            drive(step)
+        compiled.next()
+        key = fingerprint(compiled, (step + 1) % period)
+        first = seen.get(key)
+        if first is None:
+            seen[key] = step + 1
+            continue
+        result = Attractor(step + 1, first, step + 1 - first)
+        logger.debug("%s", result)
+        if collect:
+            for i in range(step + 1, step + 1 + result.period):
+                result.states.append(snapshot(compiled))
+                if drive is not None:
+                    drive(i)
+                compiled.next()
+        return result
+    return Attractor(int(steps))
+
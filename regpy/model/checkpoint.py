@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===========
+Checkpoints
+===========
+
+:Date:
+    2026-10-18
+:File:
+    checkpoint.py
+
+A checkpoint stores a built and running `Sequence` as a compressed numpy
+archive of flat arrays: products, sequence elements, promoter sites,
+concentrations, polymerases and the state of the random number generator.
+Objects are referred to by their row in the product or element tables, so no
+pickling is involved. Restoring re-creates the objects under their original
+names and leaves the sequence ready to step without running
+`Sequence.initialise` again. Objects are filled in from the stored arrays
+rather than built by their constructors, so restoring draws no random numbers
+and takes a fraction of the time building the model does.
+
+The model parameters are functions and are not part of a checkpoint, they
+have to be configured the same way before calling `Sequence.next`.
+"""
+
+
+import logging
+import numpy
+
+from . import mobile
+from .misc import NullHandler, ModelParameters
+from .registry import Registry
+from .streams import RandomStream
+from .compiled import (site_code, BASE_SITE, EMPTY_SITE, GENE_SITE, TF_SITE,
+        NAP_SITE)
+from .sequence import (Sequence, SequenceElement, EmptySite, GeneSite,
+        BindingSite, TFBindingSite, NAPBindingSite)
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+parameters = ModelParameters()
+
+
+FORMAT_VERSION = 1
+
+CONSTANTS = ("association_constant", "dissociation_constant",
+        "diffusion_constant", "degradation_constant")
+
+SITE_CLASSES = {
+    BASE_SITE: SequenceElement,
+    EMPTY_SITE: EmptySite,
+    GENE_SITE: GeneSite,
+    TF_SITE: TFBindingSite,
+    NAP_SITE: NAPBindingSite
+}
+
+BINDING_CODES = (TF_SITE, NAP_SITE)
+
+# the symbols the constructors assign
+SYMBOLS = {
+    SequenceElement: u"",
+    EmptySite: u"E",
+    GeneSite: u"G",
+    TFBindingSite: u"T",
+    NAPBindingSite: u"N"
+}
+
+
+def _names(objects):
+    return numpy.array([unicode(obj._name) for obj in objects], dtype=unicode)
+
+
+def _get_rng_state(rng):
+    state = rng.get_state()
+    (kind, keys, pos, has_gauss, cached) = state[:5]
+    # a `RandomStream` adds its buffered numbers and their position
+    (block, block_pos) = state[5:] if len(state) > 5 else ((), 0)
+    return (numpy.asarray(keys, dtype=numpy.uint32),
+            numpy.array([pos, has_gauss, block_pos], dtype=numpy.int64),
+            numpy.array([cached], dtype=float),
+            numpy.asarray(block, dtype=float))
+
+
+def save_checkpoint(path, sequence, rng=None):
+    """
+    Writes the complete state of an initialised sequence to a file.
+
+    Parameters
+    ----------
+    path: str
+        Location of the checkpoint file.
+    sequence: Sequence
+        The model, call `CompiledSequence.write_back` first to store the state
+        of a compiled one.
+    rng: numpy.random.RandomState (optional)
+        Generator whose state is stored, the generator of the model
+        parameters by default.
+    """
+    rng = parameters.rng if rng is None else rng
+    products = list()
+    index = dict()
+
+    def add(product):
+        if product is None:
+            raise ValueError("cannot store None as a product")
+        if product not in index:
+            index[product] = len(products)
+            products.append(product)
+        return index[product]
+
+    def add_optional(product):
+        # missing ligands and gene products are stored as -1
+        return -1 if product is None else add(product)
+
+    genes = [site for site in sequence if isinstance(site, GeneSite)]
+    promoters = [tf_site for gene in genes for tf_site in gene.promoters]
+    site_ligand = [add_optional(site.ligand) if isinstance(site, BindingSite)\
+            else -1 for site in sequence]
+    gene_product = [add_optional(gene.product) for gene in genes]
+    promoter_ligand = [add_optional(tf_site.ligand) for tf_site in promoters]
+    conc_product = [add(product) for product in sequence.concentrations]
+    rnaps = sorted(sequence.polymerases.iteritems(), key=lambda item: -item[1])
+    rnap_product = [add(rnap) for (rnap, pos) in rnaps]
+    constants = numpy.array([[getattr(product, name, numpy.nan) for name in\
+            CONSTANTS] for product in products], dtype=float).reshape(-1,
+            len(CONSTANTS))
+    binding = [site if isinstance(site, BindingSite) else None for site in\
+            sequence]
+    (rng_keys, rng_pos, rng_gauss, rng_block) = _get_rng_state(rng)
+    arrays = dict(
+        version=numpy.array([FORMAT_VERSION]),
+        rule=numpy.array([sequence.rule], dtype=unicode),
+        product_class=numpy.array([product.__class__.__name__ for product in\
+                products], dtype=unicode),
+        product_name=_names(products),
+        product_index=numpy.array([product._index for product in products],
+                dtype=numpy.intp),
+        product_location=numpy.array([product.location for product in\
+                products], dtype=numpy.intp),
+        product_constants=constants,
+        site_type=numpy.array([site_code(site) for site in sequence],
+                dtype=numpy.int8),
+        site_name=_names(sequence),
+        site_index=numpy.array([site._index for site in sequence],
+                dtype=numpy.intp),
+        site_length=numpy.array([site._length for site in sequence],
+                dtype=numpy.intp),
+        site_occupied=numpy.array([site.occupied for site in sequence],
+                dtype=bool),
+        site_ligand=numpy.array(site_ligand, dtype=numpy.intp),
+        site_regulation=numpy.array([0 if site is None else site.regulation\
+                for site in binding], dtype=int),
+        site_distance=numpy.array([0 if site is None else site.distance\
+                for site in binding], dtype=numpy.intp),
+        site_factor=numpy.array([0.0 if site is None else site.factor\
+                for site in binding], dtype=float),
+        site_bound=numpy.array([False if site is None else site.bound\
+                for site in binding], dtype=bool),
+        gene_product=numpy.array(gene_product, dtype=numpy.intp),
+        gene_rate=numpy.array([gene.rate for gene in genes], dtype=float),
+        gene_active=numpy.array([gene._active for gene in genes], dtype=bool),
+        promoter_gene=numpy.array([i for (i, gene) in enumerate(genes)\
+                for tf_site in gene.promoters], dtype=numpy.intp),
+        promoter_name=_names(promoters),
+        promoter_index=numpy.array([tf_site._index for tf_site in promoters],
+                dtype=numpy.intp),
+        promoter_length=numpy.array([tf_site._length for tf_site in promoters],
+                dtype=numpy.intp),
+        promoter_ligand=numpy.array(promoter_ligand, dtype=numpy.intp),
+        promoter_regulation=numpy.array([tf_site.regulation for tf_site in\
+                promoters], dtype=int),
+        promoter_distance=numpy.array([tf_site.distance for tf_site in\
+                promoters], dtype=numpy.intp),
+        promoter_factor=numpy.array([tf_site.factor for tf_site in promoters],
+                dtype=float),
+        promoter_bound=numpy.array([tf_site.bound for tf_site in promoters],
+                dtype=bool),
+        conc_product=numpy.array(conc_product, dtype=numpy.intp),
+        conc_value=numpy.array([sequence.concentrations[product] for product\
+                in sequence.concentrations], dtype=float),
+        rnap_product=numpy.array(rnap_product, dtype=numpy.intp),
+        rnap_position=numpy.array([pos for (rnap, pos) in rnaps],
+                dtype=numpy.intp),
+        rnap_bound=numpy.array([rnap.bound for (rnap, pos) in rnaps],
+                dtype=bool),
+        rnap_was_bound=numpy.array([getattr(rnap, "was_bound", False)\
+                for (rnap, pos) in rnaps], dtype=bool),
+        rng_keys=rng_keys,
+        rng_pos=rng_pos,
+        rng_gauss=rng_gauss,
+        rng_block=rng_block
+    )
+    with open(path, "wb") as file_h:
+        numpy.savez_compressed(file_h, **arrays)
+
+
+def _instance(registry, cls, name):
+    """
+    The instance of the class registered under the name or a new blank one,
+    no constructor is run since all attributes are restored from the
+    checkpoint. Pass None as the registry when it is known to be empty.
+    """
+    obj = None if registry is None else registry.get((cls, name))
+    if obj is None:
+        obj = object.__new__(cls)
+        obj._name = name
+    return obj
+
+
+def _reserve(registry, objects):
+    """
+    Lets the running indices of the registry continue after those of the
+    restored objects.
+    """
+    last = dict()
+    for obj in objects:
+        last[obj.__class__] = max(last.get(obj.__class__, 0), obj._index)
+    for (cls, index) in last.iteritems():
+        registry.reserve(cls, index)
+
+
+def _restore_products(data, registry, lookup):
+    products = list()
+    for (cls_name, name, index, location) in zip(
+            data["product_class"].tolist(), data["product_name"].tolist(),
+            data["product_index"].tolist(), data["product_location"].tolist()):
+        cls = getattr(mobile, str(cls_name))
+        product = _instance(lookup, cls, name)
+        product._index = index
+        product.location = location
+        registry.add(product)
+        products.append(product)
+    constants = data["product_constants"]
+    for (k, attr) in enumerate(CONSTANTS):
+        # constants a product does not have are stored as NaN
+        present = numpy.flatnonzero(~numpy.isnan(constants[:, k]))
+        for (i, value) in zip(present.tolist(),
+                constants[present, k].tolist()):
+            setattr(products[i], attr, value)
+    _reserve(registry, products)
+    return products
+
+
+def _restore_sites(data, prefix, classes, registry, lookup):
+    sites = list()
+    for (cls, name, index, length) in zip(classes,
+            data[prefix + "_name"].tolist(), data[prefix + "_index"].tolist(),
+            data[prefix + "_length"].tolist()):
+        site = _instance(lookup, cls, name)
+        site._index = index
+        site._length = length
+        site._symbol = SYMBOLS[cls]
+        registry.add(site)
+        sites.append(site)
+    _reserve(registry, sites)
+    return sites
+
+
+def _restore_binding(sites, ligands, regulation, distance, factor, bound):
+    """
+    Sets the attributes of binding sites behind the properties that count
+    changes, the caller bumps `BindingSite.revision` once.
+    """
+    for (site, ligand, reg, dist, fac, flag) in zip(sites, ligands,
+            regulation, distance, factor, bound):
+        site._ligand = ligand
+        site._regulation = reg
+        site.distance = dist
+        site._factor = fac
+        site.bound = flag
+
+
+def load_checkpoint(path, rng=None, registry=None):
+    """
+    Restores a sequence from a checkpoint file.
+
+    Parameters
+    ----------
+    path: str
+        Location of the checkpoint file.
+    rng: numpy.random.RandomState (optional)
+        Generator whose state is restored, the generator of the model
+        parameters by default.
+    registry: Registry (optional)
+        Registry to create the objects in, a new one by default. Objects
+        that already exist in it under the same name are reused and
+        overwritten.
+
+    Returns
+    -------
+    A `Sequence` in the stored state that can be stepped right away.
+    """
+    rng = parameters.rng if rng is None else rng
+    registry = Registry() if registry is None else registry
+    with numpy.load(path) as archive:
+        data = dict((key, archive[key]) for key in archive.files)
+    version = int(data["version"][0])
+    if version != FORMAT_VERSION:
+        raise ValueError("unsupported checkpoint format version %d" % version)
+    # only look for existing instances if there can be any
+    lookup = registry if len(registry) > 0 else None
+    products = _restore_products(data, registry, lookup)
+    # missing ligands and gene products are stored as -1
+    products.append(None)
+    sequence = Sequence()
+    if "rule" in data:
+        sequence.rule = unicode(data["rule"][0])
+    codes = data["site_type"].tolist()
+    sites = _restore_sites(data, "site", [SITE_CLASSES[code] for code in\
+            codes], registry, lookup)
+    for (site, flag) in zip(sites, data["site_occupied"].tolist()):
+        site.occupied = flag
+    binding = [i for (i, code) in enumerate(codes) if code in BINDING_CODES]
+    _restore_binding([sites[i] for i in binding],
+            [products[j] for j in data["site_ligand"][binding].tolist()],
+            data["site_regulation"][binding].tolist(),
+            data["site_distance"][binding].tolist(),
+            data["site_factor"][binding].tolist(),
+            data["site_bound"][binding].tolist())
+    genes = [site for (site, code) in zip(sites, codes) if code == GENE_SITE]
+    for (gene, product, rate, active) in zip(genes,
+            data["gene_product"].tolist(), data["gene_rate"].tolist(),
+            data["gene_active"].tolist()):
+        gene.product = products[product]
+        gene.rate = rate
+        gene._active = active
+        gene.promoters = list()
+    promoters = _restore_sites(data, "promoter",
+            [TFBindingSite] * len(data["promoter_gene"]), registry, lookup)
+    _restore_binding(promoters,
+            [products[j] for j in data["promoter_ligand"].tolist()],
+            data["promoter_regulation"].tolist(),
+            data["promoter_distance"].tolist(),
+            data["promoter_factor"].tolist(),
+            data["promoter_bound"].tolist())
+    for (i, tf_site) in zip(data["promoter_gene"].tolist(), promoters):
+        genes[i].promoters.append(tf_site)
+    BindingSite.revision += 1
+    sequence.extend(sites)
+    sequence.concentrations = dict((products[i], conc) for (i, conc) in\
+            zip(data["conc_product"].tolist(), data["conc_value"].tolist()))
+    for (i, pos, bound, was_bound) in zip(data["rnap_product"].tolist(),
+            data["rnap_position"].tolist(), data["rnap_bound"].tolist(),
+            data["rnap_was_bound"].tolist()):
+        rnap = products[i]
+        rnap.bound = bound
+        rnap.was_bound = was_bound
+        sequence.polymerases[rnap] = pos
+    sequence.index_binding_sites()
+    sequence.compile_promoters()
+    (pos, has_gauss) = data["rng_pos"][:2]
+    state = ("MT19937", data["rng_keys"], int(pos), int(has_gauss),
+            float(data["rng_gauss"][0]))
+    if isinstance(rng, RandomStream) and "rng_block" in data:
+        state += (data["rng_block"], int(data["rng_pos"][2]))
+    rng.set_state(state)
+    return sequence
+
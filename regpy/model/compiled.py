@@ -0,0 +1,509 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==================
+Compiled Sequences
+==================
+
+:Date:
+    2026-10-18
+:File:
+    compiled.py
+
+A built `Sequence` frozen into struct-of-arrays form. The stepping engine in
+this module reproduces `Sequence.next` with whole-array operations instead of
+walking the list of site objects.
+"""
+
+
+import logging
+import numpy
+
+from . import mobile
+from .misc import NullHandler, ModelParameters
+from .promoters import promoter_matrix
+from .logic import GeneLogic, PRODUCT
+from .accessibility import nap_layout
+from .polymerase import PolymerasePool
+from .sequence import (SequenceElement, EmptySite, GeneSite, BindingSite,
+        TFBindingSite, NAPBindingSite)
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+parameters = ModelParameters()
+
+
+# site type codes
+BASE_SITE = 0
+EMPTY_SITE = 1
+GENE_SITE = 2
+TF_SITE = 3
+NAP_SITE = 4
+
+
+def site_code(site):
+    """
+    Returns the integer type code of a sequence element.
+    """
+    if isinstance(site, GeneSite):
+        return GENE_SITE
+    elif isinstance(site, TFBindingSite):
+        return TF_SITE
+    elif isinstance(site, NAPBindingSite):
+        return NAP_SITE
+    elif isinstance(site, EmptySite):
+        return EMPTY_SITE
+    elif isinstance(site, SequenceElement):
+        return BASE_SITE
+    raise TypeError("unknown sequence element '%r'" % site)
+
+
+def product_table(products):
+    """
+    Indexes products in the order they first appear, None is skipped.
+
+    Returns
+    -------
+    The list of products, a dictionary mapping each to its index and the
+    degradation constants of all products followed by a zero for the sink
+    slot that collects the output of genes without a product.
+    """
+    table = list()
+    index = dict()
+    for product in products:
+        if product is None or product in index:
+            continue
+        index[product] = len(table)
+        table.append(product)
+    degradation = numpy.zeros(len(table) + 1, dtype=float)
+    for (i, product) in enumerate(table):
+        degradation[i] = product.degradation_constant
+    return (table, index, degradation)
+
+
+def degrade(concentrations, degradation, present):
+    """
+    Removes `ceil(degradation constant * concentration)` of every product in
+    place like `Sequence.next` and empties the sink slot.
+
+    Parameters
+    ----------
+    concentrations: numpy.ndarray
+        Concentration vector indexed by product, optionally with a leading
+        replicate axis.
+    degradation: numpy.ndarray
+        Degradation constant of each product.
+    present: numpy.ndarray
+        Flags of the products that have a concentration.
+    """
+    concentrations -= numpy.ceil(degradation * concentrations)
+    numpy.maximum(concentrations, 0.0, concentrations)
+    # discard what genes without a product transcribed
+    concentrations[..., -1] = 0.0
+    present[..., -1] = False
+
+
+def concentration_map(products, concentrations, present):
+    """
+    Returns the concentrations of the present products as a dictionary keyed
+    by product like `Sequence.concentrations`.
+    """
+    return dict((products[i], concentrations[i])\
+            for i in numpy.flatnonzero(present[:len(products)]))
+
+
+class CompiledSequence(object):
+    """
+    Struct-of-arrays representation of a built `Sequence`.
+
+    The layout (site types, factors, ligands, promoter structure) and the
+    mutable state (occupancy, bound flags, gene activity, concentrations and
+    polymerases) of the sequence are copied into numpy arrays. Calling `next`
+    advances the state exactly like `Sequence.next` would, `write_back`
+    transfers the state to the original objects.
+
+    Products are indexed by their position in `products`. The additional last
+    slot of the concentration vector collects the output of genes without a
+    product and is cleared every step.
+
+    Notes
+    -----
+    Rate and leakage of a gene are evaluated once at compile time rather than
+    on every call to `GeneSite.is_active`.
+    """
+
+    # the next state only depends on the current one
+    deterministic = True
+
+    def __init__(self, sequence, rule=None, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        sequence: Sequence
+            A fully initialised sequence.
+        rule: str (optional)
+            Gene logic, see `regpy.model.logic`, by default that of the
+            sequence.
+        """
+        object.__init__(self)
+        self.sequence = sequence
+        self.rule = getattr(sequence, "rule", PRODUCT) if rule is None else rule
+        self.threshold = parameters.sequence.tf.threshold
+        self.nap_threshold = parameters.sequence.nap.threshold
+        self.probe = None
+        self._compile_products()
+        self._compile_sites()
+        self._compile_promoters()
+        self._compile_polymerases()
+
+    def _compile_products(self):
+        seq = self.sequence
+
+        def candidates():
+            for site in seq:
+                if isinstance(site, GeneSite):
+                    yield site.product
+                    for tf_site in site.promoters:
+                        yield tf_site.ligand
+                elif isinstance(site, BindingSite):
+                    yield site.ligand
+            for product in seq.concentrations:
+                yield product
+
+        (self.products, self.product_index, self.degradation) =\
+                product_table(candidates())
+        num = len(self.products)
+        self.concentrations = numpy.zeros(num + 1, dtype=float)
+        self._present = numpy.zeros(num + 1, dtype=bool)
+        for (product, conc) in seq.concentrations.iteritems():
+            i = self.product_index[product]
+            self.concentrations[i] = conc
+            self._present[i] = True
+
+    def _index(self, product):
+        """
+        Index of a product in the concentration vector, products that do not
+        exist map to the trailing sink slot.
+        """
+        return self.product_index.get(product, len(self.products))
+
+    def _compile_sites(self):
+        seq = self.sequence
+        num = len(seq)
+        self.site_type = numpy.zeros(num, dtype=numpy.int8)
+        self.site_ligand = numpy.empty(num, dtype=numpy.intp)
+        self.site_ligand.fill(-1)
+        self.site_factor = numpy.zeros(num, dtype=float)
+        self.site_regulation = numpy.zeros(num, dtype=int)
+        self.site_bound = numpy.zeros(num, dtype=bool)
+        self.occupied = numpy.zeros(num, dtype=bool)
+        self.gene_of_site = numpy.empty(num, dtype=numpy.intp)
+        self.gene_of_site.fill(-1)
+        self.genes = list()
+        for (i, site) in enumerate(seq):
+            self.site_type[i] = site_code(site)
+            self.occupied[i] = site.occupied
+            if isinstance(site, BindingSite):
+                self.site_ligand[i] = self._index(site.ligand)
+                self.site_factor[i] = site.factor
+                self.site_regulation[i] = site.regulation
+                self.site_bound[i] = site.bound
+            elif isinstance(site, GeneSite):
+                self.gene_of_site[i] = len(self.genes)
+                self.genes.append(site)
+        num = len(self.genes)
+        self.gene_site = numpy.flatnonzero(self.gene_of_site >= 0)
+        # index of the first gene at or after each position
+        ahead = numpy.where(self.gene_of_site >= 0, numpy.arange(len(seq)),
+                len(seq))
+        self._next_gene = numpy.minimum.accumulate(ahead[::-1])[::-1]
+        self.gene_product = numpy.array([self._index(gene.product)\
+                for gene in self.genes], dtype=numpy.intp)
+        self.gene_rate = numpy.array([gene.rate for gene in self.genes],
+                dtype=float)
+        self.gene_active = numpy.array([gene._active for gene in self.genes],
+                dtype=bool)
+        self.gene_production = numpy.array([parameters.sequence.gene.production()\
+                for gene in self.genes], dtype=float)
+        self.gene_leakage = numpy.array([parameters.sequence.gene.leakage()\
+                for gene in self.genes], dtype=float)
+
+    def _compile_promoters(self):
+        (self.promoters, self.tf_sites) = promoter_matrix(self.genes,
+                self._index, len(self.concentrations))
+        self.tf_bound = numpy.array([tf_site.bound\
+                for tf_site in self.tf_sites], dtype=bool)
+        self.gene_logic = GeneLogic.from_matrix(self.promoters, self.rule)
+        (self.naps, sites, self.nap_site) = nap_layout(self.sequence,
+                self._index, parameters.sequence.nap.window,
+                parameters.sequence.nap.effect, self.sequence.coordinates)
+        self.gene_access = numpy.ones(len(self.genes), dtype=float)
+
+    def _compile_polymerases(self):
+        items = self.sequence.polymerases.items()
+        self.polymerases = PolymerasePool([pos for (rnap, pos) in items],
+                [rnap.bound for (rnap, pos) in items],
+                [getattr(rnap, "was_bound", False) for (rnap, pos) in items],
+                [rnap for (rnap, pos) in items])
+
+    def __len__(self):
+        """
+        Number of sequence elements.
+        """
+        return len(self.site_type)
+
+    def regulation_states(self):
+        """
+        Combined regulatory state of each gene's promoter from the current TF
+        bound flags according to the gene logic: 1 activated, -1 repressed, 0
+        neutral.
+        """
+        return self.gene_logic.states(self.tf_bound)
+
+    def _bind_transcription_factors(self):
+        self.tf_bound = self.promoters.bind(self.concentrations, self.threshold)
+
+    def _bind_nucleoid_proteins(self, concentrations=None):
+        """
+        Updates the bound state of NAP sites and the accessibility of genes.
+        """
+        if len(self.naps) == 0:
+            return
+        if concentrations is None:
+            concentrations = self.concentrations
+        bound = self.naps.bind(concentrations, self.nap_threshold)
+        self.site_bound[self.nap_site] = bound
+        self.gene_access = self.naps.accessibility(bound)
+
+    def _activate(self, genes):
+        """
+        Evaluates `GeneSite.is_active` for the given genes and returns the
+        resulting flags.
+        """
+        return self.gene_logic.evaluate(self.regulation_states()[genes], genes,
+                self.gene_rate, self.gene_active, self.gene_production,
+                self.gene_leakage)
+
+    def _transport(self):
+        pool = self.polymerases
+        # drop polymerases that left the sequence during the last step
+        pool.discard(len(self))
+        if len(pool) == 0:
+            return
+        pos = pool.position
+        bound = pool.bound
+        # bound polymerases transcribe and are released
+        genes = self.gene_of_site[pos[bound]]
+        products = self.gene_product[genes]
+        numpy.add.at(self.concentrations, products,
+                self.gene_rate[genes] * self.gene_access[genes])
+        self._present[products] = True
+        # unbound polymerases on genes may bind
+        on_gene = ~bound & (self.gene_of_site[pos] >= 0)
+        binds = numpy.zeros(len(pos), dtype=bool)
+        binds[on_gene] = self._activate(self.gene_of_site[pos[on_gene]]) &\
+                ~pool.was_bound[on_gene]
+        # the remaining ones try to move on
+        moves = pool.move(~bound & ~binds, self.occupied)
+        pool.was_bound[bound] = True
+        pool.bound = binds
+        if self.probe is not None:
+            self._count_events(bound, binds, moves, pos)
+
+    def _count_events(self, transcribed, binds, moves, previous):
+        """
+        Counts the events of the polymerases in one step.
+        """
+        probe = self.probe
+        left = numpy.count_nonzero(moves & (previous == len(self) - 1))
+        probe.count("transcribed", numpy.count_nonzero(transcribed))
+        probe.count("bound", numpy.count_nonzero(binds))
+        probe.count("moved", numpy.count_nonzero(moves) - left)
+        probe.count("left", left)
+
+    def _degrade(self):
+        degrade(self.concentrations, self.degradation, self._present)
+
+    def next(self):
+        """
+        Advance the state by one step like `Sequence.next`.
+        """
+        probe = self.probe
+        if probe is None:
+            self._bind_transcription_factors()
+            self._bind_nucleoid_proteins()
+            self._transport()
+            self._degrade()
+            return
+        probe.step()
+        start = probe.timer()
+        self._bind_transcription_factors()
+        self._bind_nucleoid_proteins()
+        start = probe.stop("binding", start)
+        self._transport()
+        start = probe.stop("transport", start)
+        self._degrade()
+        probe.stop("degradation", start)
+
+    def _quiet_steps(self, limit):
+        """
+        Number of upcoming steps (at most `limit`) in which nothing happens
+        but polymerases moving over elements other than genes and products
+        degrading.
+        """
+        pool = self.polymerases
+        # what the next step would do first anyway
+        pool.discard(len(self))
+        if pool.bound.any():
+            return 0
+        # an occupied element without polymerase would block
+        if numpy.count_nonzero(self.occupied) != len(pool):
+            return 0
+        if len(pool) == 0:
+            return limit
+        pos = pool.position
+        gene = self._next_gene[pos]
+        # polymerases without genes ahead simply run off the end
+        distance = numpy.where(gene < len(self), gene - pos, limit)
+        return min(int(distance.min()), limit)
+
+    def _skip(self, steps):
+        """
+        Applies a number of quiet steps at once.
+        """
+        conc = self.concentrations
+        before = conc
+        for i in range(steps):
+            if not ((conc > 0.0) & (self.degradation > 0.0)).any():
+                before = conc
+                break
+            before = conc.copy()
+            self._degrade()
+        # bound states as determined at the beginning of the last step
+        self.tf_bound = self.promoters.bind(before, self.threshold)
+        self._bind_nucleoid_proteins(before)
+        previous = self.polymerases.shift(steps, len(self))
+        self.occupied[previous] = False
+        pos = self.polymerases.position
+        self.occupied[pos[pos < len(self)]] = True
+        if self.probe is not None:
+            last = len(self) - 1
+            self.probe.count("moved", numpy.minimum(steps,
+                    last - previous).sum())
+            self.probe.count("left", numpy.count_nonzero(previous + steps >
+                    last))
+
+    def advance(self, steps):
+        """
+        Advance the state by a number of steps, same as calling `next` as
+        often, but jumps over stretches of steps in which the only events are
+        polymerases moving over non-gene elements and products degrading.
+        Bound TF sites only matter once a polymerase reaches a gene so they
+        are not tracked in between.
+        """
+        steps = int(steps)
+        while steps > 0:
+            quiet = self._quiet_steps(steps)
+            if quiet > 1:
+                if self.probe is None:
+                    self._skip(quiet)
+                else:
+                    start = self.probe.timer()
+                    self._skip(quiet)
+                    self.probe.stop("skip", start)
+                    self.probe.step(quiet)
+                steps -= quiet
+            else:
+                self.next()
+                steps -= 1
+
+    def introduce_polymerase(self):
+        """
+        Places a new polymerase at the beginning of the sequence if the first
+        site is free.
+        """
+        if len(self) == 0:
+            return False
+        return len(self.polymerases.insert([0], self.occupied)) > 0
+
+    def introduce_polymerases(self, positions):
+        """
+        Places new polymerases at all given free positions at once.
+
+        Returns
+        -------
+        The positions at which polymerases were placed.
+        """
+        return self.polymerases.insert(positions, self.occupied)
+
+    def fork(self):
+        """
+        Returns a copy of the model that shares all layout arrays with this
+        one and has its own copy of the state. Perturbations in
+        `regpy.model.perturb` replace layout arrays of a fork instead of
+        changing them, so that forks of one model do not affect each other.
+        """
+        clone = object.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        for name in ("concentrations", "_present", "tf_bound", "gene_rate",
+                "gene_active", "gene_access", "site_bound", "occupied"):
+            setattr(clone, name, getattr(self, name).copy())
+        clone.polymerases = self.polymerases.copy()
+        clone.probe = None
+        return clone
+
+    def ensemble(self, replicates):
+        """
+        Returns a `regpy.model.ensemble.EnsembleSequence` with the given
+        number of replicates of the current state.
+        """
+        from .ensemble import EnsembleSequence
+        return EnsembleSequence(self, replicates)
+
+    def find_attractor(self, steps, drive=None, period=1):
+        """
+        Steps until the state repeats, see
+        `regpy.model.attractor.find_attractor`.
+        """
+        from .attractor import find_attractor
+        return find_attractor(self, steps, drive, period)
+
+    def concentration_map(self):
+        """
+        Returns the current concentrations as a dictionary keyed by product
+        like `Sequence.concentrations`.
+        """
+        return concentration_map(self.products, self.concentrations,
+                self._present)
+
+    def write_back(self):
+        """
+        Transfers the current state to the objects of the compiled sequence.
+        """
+        seq = self.sequence
+        seq.concentrations = self.concentration_map()
+        for (site, flag) in zip(seq, self.occupied):
+            site.occupied = bool(flag)
+        for i in numpy.flatnonzero(self.site_ligand >= 0):
+            seq[i].bound = bool(self.site_bound[i])
+        for (tf_site, flag) in zip(self.tf_sites, self.tf_bound):
+            tf_site.bound = bool(flag)
+        for (gene, rate, flag) in zip(self.genes, self.gene_rate,
+                self.gene_active):
+            gene.rate = float(rate)
+            gene._active = bool(flag)
+        seq.polymerases = dict()
+        pool = self.polymerases
+        for (i, rnap) in enumerate(pool.objects):
+            if rnap is None:
+                rnap = mobile.RNAPolymerase()
+                pool.objects[i] = rnap
+            rnap.bound = bool(pool.bound[i])
+            rnap.was_bound = bool(pool.was_bound[i])
+            seq.polymerases[rnap] = int(pool.position[i])
+
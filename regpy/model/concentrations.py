@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Concentrations
+==============
+
+:Date:
+    2026-10-18
+:File:
+    concentrations.py
+"""
+
+
+import logging
+import numpy
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from .misc import NullHandler
+from .mobile import BaseProduct
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class Concentrations(MutableMapping):
+    """
+    Concentrations of gene products, a dictionary keyed by product backed by
+    numpy arrays.
+
+    Every product that is stored gets a fixed slot in two preallocated value
+    buffers. Degradation computes the next state of all slots into the spare
+    buffer in a few vectorised operations and swaps the buffers, no memory is
+    allocated unless the buffers have to grow for new products. Products that
+    have not been stored are not contained in the mapping even if they were
+    assigned a slot.
+
+    Notes
+    -----
+    The degradation constant of a product is read when it gets its slot and
+    again by `degrade` whenever that of any `BaseProduct` was assigned since,
+    see `refresh`.
+    """
+
+    def __init__(self, items=(), capacity=16, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        items: dict or iterable (optional)
+            Initial concentrations.
+        capacity: int (optional)
+            Initial number of slots.
+        """
+        self.products = list()
+        self._slot = dict()
+        capacity = max(int(capacity), 1)
+        self._values = numpy.zeros(capacity, dtype=float)
+        self._spare = numpy.zeros(capacity, dtype=float)
+        self._present = numpy.zeros(capacity, dtype=bool)
+        self._degradation = numpy.zeros(capacity, dtype=float)
+        self._revision = BaseProduct.revision
+        self.update(items)
+
+    def __copy__(self):
+        """
+        Returns a new instance with the same products and slots but buffers
+        of its own.
+        """
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other.products = list(self.products)
+        other._slot = dict(self._slot)
+        for name in ("_values", "_spare", "_present", "_degradation"):
+            setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def _grow(self, capacity):
+        num = len(self._values)
+        for name in ("_values", "_spare", "_present", "_degradation"):
+            old = getattr(self, name)
+            new = numpy.zeros(capacity, dtype=old.dtype)
+            new[:num] = old
+            setattr(self, name, new)
+
+    def slot(self, product):
+        """
+        Returns the slot of a product, assigning a new one if necessary.
+        """
+        index = self._slot.get(product)
+        if index is None:
+            if product is None:
+                raise ValueError("cannot store the concentration of None")
+            index = len(self.products)
+            if index == len(self._values):
+                self._grow(2 * index)
+            self._slot[product] = index
+            self.products.append(product)
+            self._degradation[index] = getattr(product, "degradation_constant",
+                    0.0)
+        return index
+
+    def slots(self, products):
+        """
+        Returns the slots of several products as an array.
+        """
+        return numpy.array([self.slot(product) for product in products],
+                dtype=numpy.intp)
+
+    def refresh(self):
+        """
+        Reads the degradation constants of all products again.
+        """
+        self._revision = BaseProduct.revision
+        for (index, product) in enumerate(self.products):
+            self._degradation[index] = getattr(product, "degradation_constant",
+                    0.0)
+
+    @property
+    def values_array(self):
+        """
+        Current values of all assigned slots.
+        """
+        return self._values[:len(self.products)]
+
+    def __getitem__(self, product):
+        index = self._slot.get(product)
+        if index is None or not self._present[index]:
+            raise KeyError(product)
+        return float(self._values[index])
+
+    def __setitem__(self, product, value):
+        index = self.slot(product)
+        self._values[index] = value
+        self._present[index] = True
+
+    def __delitem__(self, product):
+        index = self._slot.get(product)
+        if index is None or not self._present[index]:
+            raise KeyError(product)
+        self._values[index] = 0.0
+        self._present[index] = False
+
+    def __contains__(self, product):
+        index = self._slot.get(product)
+        return index is not None and bool(self._present[index])
+
+    def __iter__(self):
+        present = self._present
+        return (product for (index, product) in enumerate(self.products)\
+                if present[index])
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self._present))
+
+    def __repr__(self):
+        return repr(dict(self.iteritems()))
+
+    def __str__(self):
+        return str(dict(self.iteritems()))
+
+    def has_key(self, product):
+        return product in self
+
+    def iterkeys(self):
+        return iter(self)
+
+    def itervalues(self):
+        return (self[product] for product in self)
+
+    def iteritems(self):
+        return ((product, self[product]) for product in self)
+
+    def add(self, product, amount):
+        """
+        Increases the concentration of a product, missing ones start at zero.
+        """
+        index = self.slot(product)
+        self._values[index] += amount
+        self._present[index] = True
+
+    def vector(self, slots, out=None):
+        """
+        Concentrations at the given slots, zero for products not stored.
+        """
+        return numpy.take(self._values, slots, out=out)
+
+    def degrade(self):
+        """
+        Removes `ceil(degradation constant * concentration)` of every product
+        in one step, like `Sequence.next` did product by product.
+        """
+        if self._revision != BaseProduct.revision:
+            self.refresh()
+        num = len(self.products)
+        values = self._values[:num]
+        spare = self._spare[:num]
+        numpy.multiply(self._degradation[:num], values, out=spare)
+        numpy.ceil(spare, out=spare)
+        numpy.subtract(values, spare, out=spare)
+        numpy.maximum(spare, 0.0, out=spare)
+        (self._values, self._spare) = (self._spare, self._values)
+
+    def copy(self):
+        """
+        Returns a plain dictionary.
+        """
+        return dict(self.iteritems())
+
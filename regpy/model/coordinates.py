@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+====================
+Sequence Coordinates
+====================
+
+:Date:
+    2026-10-18
+:File:
+    coordinates.py
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class CoordinateIndex(object):
+    """
+    Cumulative base pair coordinates of the elements of a sequence.
+
+    The coordinate of element `i` is the summed length of all elements before
+    it, lengths of `GeneSite`s include their promoter regions. The distance
+    between two elements is thus the length of the sequence stretch that
+    `BindingSite.update_distance` sums over.
+
+    Insertions and deletions copy both arrays once. A tree of partial sums
+    would make them logarithmic, but every edit already touches the
+    distances of all binding sites spanning it, so the copies do not
+    matter.
+    """
+
+    def __init__(self, sequence, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        sequence: iterable
+            Sequence elements in order.
+        """
+        object.__init__(self)
+        self.lengths = numpy.array([len(site) for site in sequence], dtype=int)
+        self.offsets = numpy.zeros(len(self.lengths) + 1, dtype=int)
+        numpy.cumsum(self.lengths, out=self.offsets[1:])
+
+    def __len__(self):
+        """
+        Number of indexed elements.
+        """
+        return len(self.lengths)
+
+    def __getitem__(self, index):
+        """
+        Coordinate of the element(s) at `index`.
+        """
+        return self.offsets[index]
+
+    def coordinate(self, index):
+        """
+        Base pair offset of the element(s) at `index`. The index one past the
+        last element yields the total length.
+        """
+        return self.offsets[numpy.clip(index, 0, len(self.lengths))]
+
+    def total(self):
+        """
+        Total length of the sequence in base pairs.
+        """
+        return self.offsets[-1]
+
+    def locate(self, coordinate):
+        """
+        Index of the element(s) that cover the given base pair coordinate(s).
+        """
+        return numpy.searchsorted(self.offsets, coordinate, side="right") - 1
+
+    def distance(self, index, location):
+        """
+        Summed length of the elements between `index` and `location`
+        (exclusive of the later one) as in `BindingSite.update_distance`.
+
+        Both arguments may be arrays. Positions beyond the ends of the
+        sequence are clamped to it like slice bounds.
+        """
+        return numpy.abs(self.coordinate(index) - self.coordinate(location))
+
+    def insert(self, index, lengths):
+        """
+        Inserts elements of the given lengths before `index`.
+        """
+        lengths = numpy.asarray(lengths, dtype=int).reshape(-1)
+        start = self.offsets[index]
+        self.lengths = numpy.insert(self.lengths, index, lengths)
+        self.offsets = numpy.concatenate([self.offsets[:index + 1],
+                start + numpy.cumsum(lengths),
+                self.offsets[index + 1:] + lengths.sum()])
+
+    def delete(self, index, count=1):
+        """
+        Removes `count` elements starting at `index`.
+        """
+        removed = self.offsets[index + count] - self.offsets[index]
+        self.lengths = numpy.delete(self.lengths,
+                numpy.arange(index, index + count))
+        self.offsets = numpy.concatenate([self.offsets[:index + 1],
+                self.offsets[index + count + 1:] - removed])
+
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==================
+Ensemble Sequences
+==================
+
+:Date:
+    2026-10-18
+:File:
+    ensemble.py
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+from .compiled import degrade
+from .polymerase import PolymerasePool
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class EnsembleSequence(object):
+    """
+    Many replicates of one compiled sequence advanced together.
+
+    The layout arrays are shared with the `CompiledSequence` the ensemble was
+    created from. All state carries a leading replicate axis: concentrations
+    (replicates x products), TF bound flags (replicates x promoter sites),
+    gene rate and activity (replicates x genes) and occupancy as well as
+    polymerase flags (replicates x elements). Each replicate follows the same
+    rules as `CompiledSequence.next`.
+    """
+
+    def __init__(self, compiled, replicates, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        compiled: CompiledSequence
+            Source of the layout and the initial state of every replicate.
+        replicates: int
+            Number of replicates.
+        """
+        object.__init__(self)
+        if not getattr(compiled, "deterministic", False):
+            raise ValueError("ensembles follow the deterministic rules of"\
+                    " CompiledSequence.next only")
+        self.compiled = compiled
+        self.replicates = int(replicates)
+        # shared layout
+        self.threshold = compiled.threshold
+        self.nap_threshold = compiled.nap_threshold
+        self.products = compiled.products
+        self.degradation = compiled.degradation
+        self.gene_of_site = compiled.gene_of_site
+        self.gene_product = compiled.gene_product
+        self.gene_production = compiled.gene_production
+        self.gene_leakage = compiled.gene_leakage
+        self.promoters = compiled.promoters
+        self.gene_logic = compiled.gene_logic
+        self.naps = compiled.naps
+        # replicated state
+        shape = (self.replicates, 1)
+        self.concentrations = numpy.tile(compiled.concentrations, shape)
+        self._present = numpy.tile(compiled._present, shape)
+        self.tf_bound = numpy.tile(compiled.tf_bound, shape)
+        self.gene_rate = numpy.tile(compiled.gene_rate, shape)
+        self.gene_active = numpy.tile(compiled.gene_active, shape)
+        self.nap_bound = numpy.tile(compiled.site_bound[compiled.nap_site],
+                shape)
+        self.gene_access = numpy.tile(compiled.gene_access, shape)
+        self.occupied = numpy.tile(compiled.occupied, shape)
+        num = len(compiled)
+        rnap = numpy.zeros(num, dtype=bool)
+        rnap_bound = numpy.zeros(num, dtype=bool)
+        rnap_was_bound = numpy.zeros(num, dtype=bool)
+        # polymerases that already left the sequence have no further effect
+        pool = compiled.polymerases
+        inside = pool.position < num
+        pos = pool.position[inside]
+        rnap[pos] = True
+        rnap_bound[pos] = pool.bound[inside]
+        rnap_was_bound[pos] = pool.was_bound[inside]
+        self.rnap = numpy.tile(rnap, shape)
+        self.rnap_bound = numpy.tile(rnap_bound, shape)
+        self.rnap_was_bound = numpy.tile(rnap_was_bound, shape)
+
+    def __len__(self):
+        """
+        Number of replicates.
+        """
+        return self.replicates
+
+    def regulation_states(self):
+        """
+        Combined regulatory state of each gene's promoter in each replicate.
+        """
+        return self.gene_logic.states(self.tf_bound)
+
+    def _bind_transcription_factors(self):
+        self.tf_bound = self.promoters.bind(self.concentrations, self.threshold)
+
+    def _bind_nucleoid_proteins(self):
+        if len(self.naps) == 0:
+            return
+        self.nap_bound = self.naps.bind(self.concentrations, self.nap_threshold)
+        self.gene_access = self.naps.accessibility(self.nap_bound)
+
+    def _activate(self, rows, genes):
+        """
+        Evaluates `GeneSite.is_active` for the given replicate and gene pairs.
+        """
+        return self.gene_logic.evaluate(self.regulation_states()[rows, genes],
+                genes, self.gene_rate, self.gene_active, self.gene_production,
+                self.gene_leakage, rows)
+
+    def _transport(self):
+        (reps, num) = self.occupied.shape
+        bound = self.rnap & self.rnap_bound
+        # bound polymerases transcribe and are released
+        (rows, cols) = numpy.nonzero(bound)
+        genes = self.gene_of_site[cols]
+        products = self.gene_product[genes]
+        numpy.add.at(self.concentrations, (rows, products),
+                self.gene_rate[rows, genes] * self.gene_access[rows, genes])
+        self._present[rows, products] = True
+        # unbound polymerases on genes may bind
+        binds = numpy.zeros_like(bound)
+        (rows, cols) = numpy.nonzero(self.rnap & ~bound &\
+                (self.gene_of_site >= 0))
+        binds[rows, cols] = self._activate(rows, self.gene_of_site[cols]) &\
+                ~self.rnap_was_bound[rows, cols]
+        go = self.rnap & ~bound & ~binds
+        # a polymerase moves on if the next free element ahead of it comes
+        # before the next stationary occupant, a train reaching the end of
+        # the sequence moves since its front leaves
+        columns = numpy.arange(num)
+        free = numpy.where(self.occupied, num, columns)
+        stuck = numpy.where(self.occupied & ~go, columns, num)
+        next_free = numpy.empty_like(free)
+        next_free[:, -1] = num
+        next_free[:, :-1] = numpy.minimum.accumulate(free[:, :0:-1],
+                axis=1)[:, ::-1]
+        next_stuck = numpy.empty_like(stuck)
+        next_stuck[:, -1] = num
+        next_stuck[:, :-1] = numpy.minimum.accumulate(stuck[:, :0:-1],
+                axis=1)[:, ::-1]
+        moves = go & (next_stuck >= next_free)
+        stays = self.rnap & ~moves
+        arrive = numpy.zeros_like(moves)
+        arrive[:, 1:] = moves[:, :-1]
+        self.occupied = (self.occupied & ~moves) | arrive
+        self.rnap = stays | arrive
+        self.rnap_was_bound = (self.rnap_was_bound & stays) | bound
+        self.rnap_bound = binds
+
+    def _degrade(self):
+        degrade(self.concentrations, self.degradation, self._present)
+
+    def next(self):
+        """
+        Advance all replicates by one step.
+        """
+        self._bind_transcription_factors()
+        self._bind_nucleoid_proteins()
+        self._transport()
+        self._degrade()
+
+    def introduce_polymerase(self, replicates=None):
+        """
+        Places a new polymerase at the beginning of the sequence of each
+        selected replicate whose first site is free.
+
+        Parameters
+        ----------
+        replicates: numpy.ndarray (optional)
+            Boolean mask or indices of the replicates to consider, all by
+            default.
+
+        Returns
+        -------
+        A boolean array marking the replicates that received a polymerase.
+        """
+        if self.occupied.shape[1] == 0:
+            return numpy.zeros(self.replicates, dtype=bool)
+        mask = numpy.zeros(self.replicates, dtype=bool)
+        if replicates is None:
+            mask[:] = True
+        else:
+            mask[replicates] = True
+        mask &= ~self.occupied[:, 0]
+        self.occupied[mask, 0] = True
+        self.rnap[mask, 0] = True
+        self.rnap_bound[mask, 0] = False
+        self.rnap_was_bound[mask, 0] = False
+        return mask
+
+    def polymerase_positions(self, replicate):
+        """
+        Positions of the polymerases of one replicate from the front of the
+        sequence backwards.
+        """
+        return numpy.flatnonzero(self.rnap[replicate])[::-1]
+
+    def write_back(self, replicate):
+        """
+        Transfers the state of one replicate to the compiled sequence and
+        its objects.
+        """
+        compiled = self.compiled
+        compiled.concentrations[:] = self.concentrations[replicate]
+        compiled._present[:] = self._present[replicate]
+        compiled.tf_bound = self.tf_bound[replicate].copy()
+        compiled.gene_rate[:] = self.gene_rate[replicate]
+        compiled.gene_active[:] = self.gene_active[replicate]
+        compiled.site_bound[compiled.nap_site] = self.nap_bound[replicate]
+        compiled.gene_access[:] = self.gene_access[replicate]
+        compiled.occupied[:] = self.occupied[replicate]
+        pos = self.polymerase_positions(replicate)
+        compiled.polymerases = PolymerasePool(pos,
+                self.rnap_bound[replicate, pos],
+                self.rnap_was_bound[replicate, pos])
+        compiled.write_back()
+
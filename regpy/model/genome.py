@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+======
+Genome
+======
+
+:Date:
+    2026-10-18
+:File:
+    genome.py
+
+Several sequences, chromosomes and plasmids, in one cytoplasm. Each is
+compiled on its own and keeps its own polymerases, while all of them read
+from and produce into one shared concentration vector.
+
+A step of a `Genome` proceeds in two parts:
+
+1. Every chromosome binds TFs from the shared concentrations as they were at
+   the beginning of the step and moves its polymerases, transcripts are
+   collected in a production vector of the chromosome. Chromosomes do not
+   touch each other's state in this part, so they are stepped concurrently
+   in a pool of threads; the heavy lifting happens in numpy kernels that
+   release the interpreter lock.
+2. After all chromosomes are done, the production of every chromosome is
+   added to the shared concentrations which then degrade once.
+
+Diffusion factors of binding sites are those computed by `Sequence.initialise`
+of each chromosome on its own, `split_sequence` places TFs made on another
+chromosome at a fixed distance.
+"""
+
+
+import logging
+import multiprocessing
+import numpy
+
+from multiprocessing.pool import ThreadPool
+
+from .misc import NullHandler
+from .compiled import (CompiledSequence, product_table, degrade,
+        concentration_map)
+from .sequence import Sequence, GeneSite
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+def split_sequence(sequence, boundaries, distance=None):
+    """
+    Cuts a sequence into chromosomes at the given element indices and
+    initialises each of them.
+
+    The location of every gene product becomes the index of the gene that
+    makes it on that gene's chromosome. Binding sites of a product made on
+    another chromosome are given the fixed `distance` to their ligand instead.
+    Products that no gene of the sequence makes keep their location.
+
+    Parameters
+    ----------
+    sequence: Sequence
+        Sequence with all elements, e.g., from `linearise_trn`.
+    boundaries: iterable
+        Increasing indices at which a new chromosome begins.
+    distance: int (optional)
+        Distance in base pairs between a binding site and a ligand made on
+        another chromosome, by default the length of the whole sequence which
+        is farther than any ligand on the same chromosome.
+
+    Returns
+    -------
+    A list of new sequences.
+
+    Notes
+    -----
+    The locations only hold for the chromosome of each product, editing a
+    chromosome afterwards measures the distance to every ligand on it.
+    """
+    bounds = [0] + [int(i) for i in boundaries] + [len(sequence)]
+    if any(bounds[i] > bounds[i + 1] for i in range(len(bounds) - 1)):
+        raise ValueError("chromosome boundaries must be increasing and within"\
+                " the sequence")
+    if distance is None:
+        distance = sum(len(site) for site in sequence)
+    # chromosome and local index of the first gene making each product
+    origin = dict()
+    for (k, (start, end)) in enumerate(zip(bounds[:-1], bounds[1:])):
+        for i in range(start, end):
+            site = sequence[i]
+            if isinstance(site, GeneSite) and site.product is not None and\
+                    site.product not in origin:
+                origin[site.product] = (k, i - start)
+    for (product, (k, index)) in origin.iteritems():
+        product.location = index
+    chromosomes = list()
+    for (k, (start, end)) in enumerate(zip(bounds[:-1], bounds[1:])):
+        chromosome = Sequence(sequence[start:end])
+        chromosome.rule = sequence.rule
+        chromosome.index_binding_sites()
+        foreign = numpy.array([origin.get(site.ligand, (k,))[0] != k\
+                for site in chromosome._binding_sites], dtype=bool)
+        distances = chromosome._distances()
+        distances[foreign] = distance
+        if len(distances) > 0:
+            chromosome._update_factors(numpy.arange(len(distances)),
+                    distances)
+        chromosome.compile_promoters()
+        chromosomes.append(chromosome)
+    return chromosomes
+
+
+class Genome(object):
+    """
+    Several compiled sequences that share a concentration pool.
+
+    Products are indexed by their position in `products`, the additional last
+    slot of `concentrations` collects the output of genes without a product.
+    """
+
+    def __init__(self, chromosomes, threads=None, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        chromosomes: iterable
+            Fully initialised sequences, their concentrations are added up
+            to form the initial shared concentrations.
+        threads: int (optional)
+            Number of threads stepping the chromosomes, by default one per
+            chromosome up to the number of processors. With one thread the
+            chromosomes are stepped in turn.
+        """
+        object.__init__(self)
+        self.chromosomes = list(chromosomes)
+        self.compiled = [CompiledSequence(seq) for seq in self.chromosomes]
+        if threads is None:
+            threads = min(len(self.compiled), multiprocessing.cpu_count())
+        self.threads = max(int(threads), 1)
+        self._pool = None
+        self._compile_products()
+
+    def _compile_products(self):
+        (self.products, self.product_index, self.degradation) =\
+                product_table(product for compiled in self.compiled\
+                for product in compiled.products)
+        num = len(self.products)
+        self.concentrations = numpy.zeros(num + 1, dtype=float)
+        self._present = numpy.zeros(num + 1, dtype=bool)
+        # global index of the local product slots of each chromosome
+        self._maps = list()
+        for compiled in self.compiled:
+            mapping = numpy.array([self.product_index[product]\
+                    for product in compiled.products] + [num],
+                    dtype=numpy.intp)
+            self.concentrations[mapping] += compiled.concentrations
+            self._present[mapping] |= compiled._present
+            self._maps.append(mapping)
+        self.concentrations[-1] = 0.0
+        self._present[-1] = False
+
+    def __len__(self):
+        """
+        Number of chromosomes.
+        """
+        return len(self.compiled)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Shuts down the thread pool, a new one is started by the next step.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _step_chromosome(self, k):
+        """
+        Binding and transport on one chromosome, afterwards its concentration
+        vector holds what it produced in this step.
+        """
+        compiled = self.compiled[k]
+        numpy.take(self.concentrations, self._maps[k],
+                out=compiled.concentrations)
+        compiled._bind_transcription_factors()
+        compiled._bind_nucleoid_proteins()
+        compiled.concentrations.fill(0.0)
+        compiled._present.fill(False)
+        compiled._transport()
+
+    def next(self):
+        """
+        Advances all chromosomes by one step.
+        """
+        chromosomes = range(len(self.compiled))
+        if self.threads == 1 or len(self.compiled) == 1:
+            for k in chromosomes:
+                self._step_chromosome(k)
+        else:
+            if self._pool is None:
+                self._pool = ThreadPool(self.threads)
+            # returns once every chromosome is done
+            self._pool.map(self._step_chromosome, chromosomes)
+        for (mapping, compiled) in zip(self._maps, self.compiled):
+            # each product has one slot per chromosome
+            self.concentrations[mapping] += compiled.concentrations
+            self._present[mapping] |= compiled._present
+        degrade(self.concentrations, self.degradation, self._present)
+
+    def advance(self, steps):
+        """
+        Advances all chromosomes by a number of steps.
+        """
+        for i in range(int(steps)):
+            self.next()
+
+    def introduce_polymerase(self, chromosome=0):
+        """
+        Places a new polymerase at the beginning of a chromosome if its first
+        site is free.
+        """
+        return self.compiled[chromosome].introduce_polymerase()
+
+    def introduce_polymerases(self):
+        """
+        Places a new polymerase at the beginning of every chromosome whose
+        first site is free.
+
+        Returns
+        -------
+        The indices of the chromosomes that received one.
+        """
+        return [k for (k, compiled) in enumerate(self.compiled)\
+                if compiled.introduce_polymerase()]
+
+    def concentration_map(self):
+        """
+        Returns the shared concentrations as a dictionary keyed by product.
+        """
+        return concentration_map(self.products, self.concentrations,
+                self._present)
+
+    def write_back(self):
+        """
+        Transfers the current state to the objects of all chromosomes, each
+        of them receives the complete shared concentrations.
+        """
+        conc = self.concentration_map()
+        for (seq, compiled) in zip(self.chromosomes, self.compiled):
+            compiled.write_back()
+            seq.concentrations = conc
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Bulk Ingestion
+==============
+
+:Date:
+    2026-10-18
+:File:
+    ingest.py
+
+Builds sequences straight from arrays of regulatory interactions without
+going through networkx. Genes are identified by integers 0 to N - 1 and laid
+out in that order. The result is the same as that of `network2trn` followed by
+`Sequence.linearise_trn` for a network whose nodes are these integers in
+ascending order.
+"""
+
+
+import logging
+import numpy
+
+from . import mobile
+from .misc import NullHandler
+from .sequence import Sequence, GeneSite, TFBindingSite
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+def unique_edges(source, target, regulation):
+    """
+    Sorts edges by target and source and drops duplicates, the last
+    occurrence of an edge determines its regulation like adding it to a
+    `networkx.DiGraph` repeatedly would.
+    """
+    order = numpy.lexsort((source, target))
+    source = source[order]
+    target = target[order]
+    regulation = regulation[order]
+    last = numpy.ones(len(order), dtype=bool)
+    last[:-1] = (source[1:] != source[:-1]) | (target[1:] != target[:-1])
+    return (source[last], target[last], regulation[last])
+
+
+def edges2sequence(source, target, regulation=None, num_genes=None,
+        sequence=None):
+    """
+    Appends the genes of a regulatory network given as edge arrays to a
+    sequence.
+
+    Parameters
+    ----------
+    source: sequence
+        Index of the regulating gene of each interaction.
+    target: sequence
+        Index of the regulated gene of each interaction.
+    regulation: sequence (optional)
+        Regulation type of each interaction (-1, 0 or 1), all neutral by
+        default which `Sequence.initialise_promoters` turns into random
+        signs.
+    num_genes: int (optional)
+        Total number of genes, by default the largest index plus one.
+    sequence: Sequence (optional)
+        The sequence to extend, a new one by default.
+
+    Returns
+    -------
+    The sequence.
+    """
+    source = numpy.asarray(source, dtype=numpy.intp).ravel()
+    target = numpy.asarray(target, dtype=numpy.intp).ravel()
+    if regulation is None:
+        regulation = numpy.zeros(len(source), dtype=int)
+    else:
+        regulation = numpy.asarray(regulation, dtype=int).ravel()
+    if len(source) != len(target) or len(source) != len(regulation):
+        raise ValueError("edge arrays differ in length")
+    highest = max(source.max(), target.max()) if len(source) > 0 else -1
+    if num_genes is None:
+        num_genes = highest + 1
+    elif highest >= num_genes:
+        raise ValueError("gene index %d out of range" % highest)
+    if len(source) > 0 and min(source.min(), target.min()) < 0:
+        raise ValueError("negative gene index")
+    (source, target, regulation) = unique_edges(source, target, regulation)
+    regulates = numpy.bincount(source, minlength=num_genes) > 0
+    indptr = numpy.zeros(num_genes + 1, dtype=numpy.intp)
+    numpy.cumsum(numpy.bincount(target, minlength=num_genes), out=indptr[1:])
+    # same order of object creation as `network2trn` and `linearise_trn`
+    genes = list()
+    for flag in regulates.tolist():
+        tf = mobile.TranscriptionFactor() if flag else None
+        genes.append(GeneSite(product=tf))
+    if sequence is None:
+        sequence = Sequence()
+    source = source.tolist()
+    regulation = regulation.tolist()
+    indptr = indptr.tolist()
+    for (i, gene) in enumerate(genes):
+        for j in range(indptr[i], indptr[i + 1]):
+            gene.promoters.append(TFBindingSite(
+                    ligand=genes[source[j]].product,
+                    regulation=regulation[j]))
+        sequence.append(gene)
+    return sequence
+
+
+def adjacency2sequence(matrix, signed=True, sequence=None):
+    """
+    Appends the genes of a regulatory network given as an adjacency matrix to
+    a sequence.
+
+    Parameters
+    ----------
+    matrix: numpy.ndarray or scipy.sparse matrix
+        Square matrix whose entry (i, j) marks regulation of gene j by gene
+        i. All stored entries of a sparse matrix are interactions, for a
+        dense one the non-zero entries.
+    signed: bool (optional)
+        Use the sign of the entries as regulation type, otherwise all
+        interactions are neutral.
+    sequence: Sequence (optional)
+        The sequence to extend, a new one by default.
+
+    Returns
+    -------
+    The sequence.
+    """
+    if hasattr(matrix, "tocoo"):
+        coo = matrix.tocoo()
+        (source, target, values) = (coo.row, coo.col, coo.data)
+    else:
+        matrix = numpy.asarray(matrix)
+        (source, target) = numpy.nonzero(matrix)
+        values = matrix[source, target]
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("adjacency matrix is not square")
+    regulation = numpy.sign(values).astype(int) if signed else None
+    return edges2sequence(source, target, regulation, matrix.shape[0],
+            sequence)
+
+
+def load_edges(path, delimiter=None):
+    """
+    Reads a regulatory network from a text file with one interaction per
+    line: regulator, regulated gene and optionally the regulation type.
+    Lines starting with # are ignored.
+
+    Returns
+    -------
+    The sorted gene names and the arrays source, target and regulation as
+    expected by `edges2sequence`.
+    """
+    table = numpy.loadtxt(path, dtype=str, delimiter=delimiter, ndmin=2)
+    if table.shape[1] not in (2, 3):
+        raise ValueError("expected two or three columns in '%s'" % path)
+    (names, index) = numpy.unique(table[:, :2], return_inverse=True)
+    index = index.reshape(-1, 2)
+    if table.shape[1] == 3:
+        regulation = table[:, 2].astype(int)
+    else:
+        regulation = numpy.zeros(len(table), dtype=int)
+    return (names, index[:, 0], index[:, 1], regulation)
+
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===============
+Instrumentation
+===============
+
+:Date:
+    2026-10-18
+:File:
+    instrument.py
+
+Sequences and compiled sequences have a `probe` attribute that is `None` by
+default. Stepping only checks that attribute, attaching a `StepProbe` turns
+on timing of the phases of a step, counting of events and calls to hooks.
+
+    >>> probe = StepProbe()
+    >>> probe.connect("transcribed", lambda rnap, site: ...)
+    >>> sequence.probe = probe
+    >>> # run the model
+    >>> probe.stats()
+"""
+
+
+import logging
+
+from timeit import default_timer
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+PHASES = ("binding", "transport", "transcription", "degradation", "skip")
+
+EVENTS = ("transcribed", "bound", "moved", "left")
+
+
+class StepProbe(object):
+    """
+    Collects timings per phase and counts events of a running model.
+
+    Phases are TF binding, polymerase transport, transcription and
+    degradation. Transcription happens while polymerases are transported, its
+    time is included in that of transport and compiled sequences do not time
+    it separately. Stretches of steps skipped by
+    `CompiledSequence.advance` are timed as a whole in the phase skip. The
+    events and their hook arguments are:
+
+    transcribed(rnap, gene)
+        A bound polymerase produced the gene's product.
+    bound(rnap, gene)
+        A polymerase bound to an active gene.
+    moved(rnap, position)
+        A polymerase moved to the given element.
+    left(rnap)
+        A polymerase ran off the end of the sequence.
+
+    Compiled sequences count events in bulk and do not call hooks.
+    """
+
+    def __init__(self, timer=default_timer, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        timer: callable (optional)
+            Returns the current time in seconds.
+        """
+        object.__init__(self)
+        self.timer = timer
+        self._hooks = dict()
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all collected statistics but keeps the hooks.
+        """
+        self.steps = 0
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.time = dict.fromkeys(PHASES, 0.0)
+        self.events = dict.fromkeys(EVENTS, 0)
+
+    def connect(self, event, func):
+        """
+        Calls `func` on every occurrence of the event.
+        """
+        if event not in self.events:
+            raise ValueError("unknown event '%s'" % event)
+        self._hooks.setdefault(event, list()).append(func)
+
+    def disconnect(self, event, func):
+        self._hooks[event].remove(func)
+
+    def step(self, num=1):
+        self.steps += num
+
+    def stop(self, phase, start):
+        """
+        Adds the time since `start` to a phase and returns the current time.
+        """
+        now = self.timer()
+        self.time[phase] += now - start
+        self.calls[phase] += 1
+        return now
+
+    def emit(self, event, *args):
+        self.events[event] += 1
+        for func in self._hooks.get(event, ()):
+            func(*args)
+
+    def count(self, event, num):
+        """
+        Counts several occurrences of an event at once without calling hooks.
+        """
+        self.events[event] += int(num)
+
+    def stats(self):
+        """
+        Aggregated statistics of all steps since the last reset.
+
+        Returns
+        -------
+        A dictionary with the number of steps, total and mean time and number
+        of calls per phase, and the number of occurrences of each event.
+        """
+        phases = dict()
+        for name in PHASES:
+            calls = self.calls[name]
+            phases[name] = {
+                "calls": calls,
+                "total": self.time[name],
+                "mean": self.time[name] / calls if calls else 0.0
+            }
+        return {
+            "steps": self.steps,
+            "phases": phases,
+            "events": dict(self.events)
+        }
+
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==========
+Gene Logic
+==========
+
+:Date:
+    2026-10-18
+:File:
+    logic.py
+
+How the bound TF sites of a promoter combine into the regulatory state of its
+gene: 1 activated, -1 repressed or 0 neutral. The available rules are
+
+product
+    The sign of the product of the regulation of all sites, unbound sites
+    count as 0. This is what `GeneSite.is_active` does.
+sum
+    The sign of the summed regulation of the bound sites.
+majority
+    Activated if more than half of all sites are bound activators, repressed
+    if more than half are bound repressors, neutral otherwise.
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+from .promoters import promoter_states
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+PRODUCT = u"product"
+SUM = u"sum"
+MAJORITY = u"majority"
+
+RULES = (PRODUCT, SUM, MAJORITY)
+
+
+def per_gene(gene, values, num_genes):
+    """
+    Sums the values of all promoter sites per gene.
+
+    Parameters
+    ----------
+    gene: numpy.ndarray
+        Index of the gene each promoter site belongs to.
+    values: numpy.ndarray
+        Values of the sites, optionally with a leading replicate axis.
+    num_genes: int
+        Total number of genes.
+    """
+    values = numpy.asarray(values)
+    lead = values.shape[:-1]
+    rows = int(numpy.prod(lead))
+    # offset the gene index of each replicate to count in one go
+    index = (numpy.arange(rows)[:, numpy.newaxis] * num_genes + gene).ravel()
+    sums = numpy.bincount(index, weights=values.reshape(rows, -1).ravel(),
+            minlength=rows * num_genes)
+    return sums.reshape(lead + (num_genes,))
+
+
+class GeneLogic(object):
+    """
+    Promoters of all genes encoded as integer arrays, evaluated for all genes
+    at once from the bound flags of the promoter sites.
+    """
+
+    def __init__(self, gene, regulation, num_genes, rule=PRODUCT, *args,
+            **kw_args):
+        """
+        Parameters
+        ----------
+        gene: sequence
+            Index of the gene each promoter site belongs to.
+        regulation: sequence
+            Regulation type of each promoter site.
+        num_genes: int
+            Total number of genes.
+        rule: str (optional)
+            One of `RULES`.
+        """
+        object.__init__(self)
+        if rule not in RULES:
+            raise ValueError("unknown gene logic '%s'" % rule)
+        self.rule = rule
+        self.gene = numpy.asarray(gene, dtype=numpy.intp)
+        self.regulation = numpy.asarray(regulation, dtype=numpy.int8)
+        self.num_genes = int(num_genes)
+        self.sites_per_gene = numpy.bincount(self.gene,
+                minlength=self.num_genes)
+        self.naked = self.sites_per_gene == 0
+
+    @classmethod
+    def from_matrix(cls, matrix, rule=PRODUCT):
+        """
+        Takes the promoter layout of a
+        `regpy.model.promoters.PromoterMatrix`.
+        """
+        return cls(matrix.gene, matrix.regulation, matrix.num_genes, rule)
+
+    def states(self, bound):
+        """
+        Regulatory state of every gene, 0 for genes without promoter sites.
+
+        Parameters
+        ----------
+        bound: numpy.ndarray
+            Bound flags of the promoter sites, optionally with a leading
+            replicate axis.
+        """
+        bound = numpy.asarray(bound, dtype=bool)
+        if self.rule == PRODUCT:
+            states = promoter_states(self.gene, self.regulation, bound,
+                    self.num_genes)
+        elif self.rule == SUM:
+            states = numpy.sign(per_gene(self.gene,
+                    numpy.where(bound, self.regulation, 0), self.num_genes))
+        else:
+            half = self.sites_per_gene / 2.0
+            activators = per_gene(self.gene, bound & (self.regulation > 0),
+                    self.num_genes)
+            repressors = per_gene(self.gene, bound & (self.regulation < 0),
+                    self.num_genes)
+            states = numpy.where(activators > half, 1,
+                    numpy.where(repressors > half, -1, 0))
+        states = numpy.asarray(states, dtype=int)
+        states[..., self.naked] = 0
+        return states
+
+    def evaluate(self, states, genes, rate, active, production, leakage,
+            rows=None):
+        """
+        Sets rate and activity of the given genes as `GeneSite.is_active`
+        does: activated genes are active at production rate, neutral ones at
+        leakage rate and repressed ones are inactive and keep their rate.
+        Genes without promoter sites are at leakage rate and keep their
+        activity flag.
+
+        Parameters
+        ----------
+        states: numpy.ndarray
+            Regulatory states of the given genes, see `states`.
+        genes: numpy.ndarray
+            Indices of the genes.
+        rate: numpy.ndarray
+            Rate of every gene, changed in place.
+        active: numpy.ndarray
+            Activity flag of every gene, changed in place.
+        production: numpy.ndarray
+            Rate of every gene when activated.
+        leakage: numpy.ndarray
+            Rate of every gene when neutral.
+        rows: numpy.ndarray (optional)
+            Replicate of each of the given genes if `rate` and `active` have a
+            leading replicate axis.
+
+        Returns
+        -------
+        The flags returned by `GeneSite.is_active`, i.e., whether a
+        polymerase may bind each of the given genes.
+        """
+        def at(mask):
+            if rows is None:
+                return genes[mask]
+            return (rows[mask], genes[mask])
+
+        naked = self.naked[genes]
+        leaky = naked | (states == 0)
+        rate[at(leaky)] = leakage[genes[leaky]]
+        produce = (states > 0) & ~naked
+        rate[at(produce)] = production[genes[produce]]
+        covered = ~naked
+        active[at(covered)] = states[covered] >= 0
+        return naked | (states >= 0)
@@ -18,7 +18,9 @@ Miscellaneous
 """
 
 
+import math
 import logging
+import multiprocessing
 import numpy
 
 from meb.utils.classes import BasicOptionsManager
@@ -37,6 +39,98 @@ class NullHandler(logging.Handler):
         pass
 
 
+def zero_truncated_binomial(trials, prob, size):
+    """
+    Draws binomially distributed numbers conditioned on being positive, the
+    same distribution as drawing `rng.binomial(trials, prob)` until the result
+    is not zero, by inverting the cumulative distribution.
+
+    Parameters
+    ----------
+    trials: int
+        Number of trials.
+    prob: float
+        Success probability of each trial.
+    size: int
+        Number of draws.
+    """
+    trials = int(trials)
+    if trials < 1 or prob <= 0.0:
+        raise ValueError("binomial distribution with %d trials and success"\
+                " probability %g has no positive values" % (trials, prob))
+    k = numpy.arange(trials + 1)
+    if prob < 1.0:
+        log_pmf = numpy.array([math.lgamma(trials + 1) - math.lgamma(i + 1) -\
+                math.lgamma(trials - i + 1) for i in range(trials + 1)]) +\
+                k * math.log(prob) + (trials - k) * math.log1p(-prob)
+        pmf = numpy.exp(log_pmf)
+    else:
+        pmf = numpy.zeros(trials + 1)
+        pmf[-1] = 1.0
+    cdf = numpy.cumsum(pmf)
+    # uniform over the probability mass of positive values
+    draws = pmf[0] + (cdf[-1] - pmf[0]) * ModelParameters().rng.random_sample(size)
+    return numpy.minimum(numpy.searchsorted(cdf, draws, side="right"), trials)
+
+
+# state of a worker process in the pool of `map_tasks`
+_worker = dict()
+
+
+def _initialise_worker(function, shared):
+    _worker["function"] = function
+    _worker["shared"] = shared
+
+
+def _run_task(task):
+    return _worker["function"](task, *_worker["shared"])
+
+
+def map_tasks(function, tasks, shared=(), processes=None, chunksize=None):
+    """
+    Calls a function for every task in a pool of processes.
+
+    Parameters
+    ----------
+    function: callable
+        Module level function called as `function(task, *shared)`.
+    tasks: iterable
+        The argument that differs between calls.
+    shared: tuple (optional)
+        Further arguments of all calls, workers receive them once when they
+        start. This relies on the processes being forked from the current
+        one as is the default on Unix.
+    processes: int (optional)
+        Number of worker processes, all available cores by default. With a
+        single process the tasks are run in the current process.
+    chunksize: int (optional)
+        Number of tasks sent to a worker at a time, by default they are split
+        into about four chunks per worker.
+
+    Returns
+    -------
+    A list with one result per task in the order of the tasks.
+    """
+    tasks = list(tasks)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if processes == 1:
+        return [function(task, *shared) for task in tasks]
+    if chunksize is None:
+        chunksize = max(1, int(numpy.ceil(len(tasks) / (4.0 * processes))))
+    pool = multiprocessing.Pool(processes, _initialise_worker,
+            (function, tuple(shared)))
+    try:
+        results = list(pool.imap(_run_task, tasks, chunksize))
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+
 class ModelParameters(BasicOptionsManager):
     """
     Singleton container class for some global model parameters.
@@ -49,8 +143,23 @@ class ModelParameters(BasicOptionsManager):
         self.sequence = SequenceManager()
         self.mobile = MobileManager()
         # rng
-        self.rnd_float = numpy.random.random_sample
-        self.rnd_int = numpy.random.random_integers
+        self.use_rng(numpy.random)
+
+    def use_rng(self, rng):
+        """
+        Makes the model draw all random numbers from the given generator,
+        e.g., a `regpy.model.streams.RandomStream` per simulation, or
+        `numpy.random` for the global state.
+
+        Returns
+        -------
+        The previous generator.
+        """
+        previous = getattr(self, "rng", None)
+        self.rng = rng
+        self.rnd_float = rng.random_sample
+        self.rnd_int = rng.random_integers
+        return previous
 
 
 class SequenceManager(BasicOptionsManager):
@@ -78,7 +187,7 @@ class DefaultSequenceManager(BasicOptionsManager):
         Attributes contain default values for all sequence elements.
         """
         BasicOptionsManager.__init__(self, *args, **kw_args)
-        self.length = lambda : int(numpy.floor((numpy.random.exponential(1.0) + 1.0) * 1000.0))
+        self.length = lambda : int(numpy.floor((ModelParameters().rng.exponential(1.0) + 1.0) * 1000.0))
 
 
 class GeneSequenceManager(DefaultSequenceManager):
@@ -112,13 +221,44 @@ class NAPSequenceManager(DefaultSequenceManager):
             Call to this function returns the number of NAP binding sites per
             NAP. Currently follows a binomial distribution taking into account
             the mean and prob.
+        nums: method
+            Call with a number to draw that many positive numbers of NAP
+            binding sites at once, follows the distribution of `num` with
+            zeros rejected. If `num` was replaced it is called once per
+            number until it is positive.
+        threshold: float
+            Minimum product of NAP concentration and binding factor for a
+            site to be bound.
+        window: int
+            Distance in base pairs around a gene within which bound NAP sites
+            change its accessibility.
+        effect: float
+            Change in accessibility per regulation level of the bound NAP
+            sites in the window, see `regpy.model.accessibility`. At zero
+            NAPs do not affect transcription.
         """
         DefaultSequenceManager.__init__(self, *args, **kw_args)
         self.length = lambda : 10
         self.mean = 0
         self.prob = 0.2
-        self.num = lambda : numpy.random.binomial(self.mean / self.prob, self.prob)
+        self.num = self._binomial_num = lambda : ModelParameters().rng.binomial(self.mean / self.prob, self.prob)
+        self.nums = self._positive_nums
         self.states = lambda : 5
+        self.threshold = 1.0
+        self.window = 10000
+        self.effect = 0.0
+
+    def _positive_nums(self, size):
+        """
+        Default of `nums`.
+        """
+        if self.num is self._binomial_num:
+            return zero_truncated_binomial(self.mean / self.prob, self.prob, size)
+        nums = numpy.zeros(size, dtype=int)
+        for i in range(size):
+            while not nums[i]:
+                nums[i] = self.num()
+        return nums
 
 
 class TFSequenceManager(DefaultSequenceManager):
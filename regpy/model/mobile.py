@@ -18,11 +18,11 @@ Mobile Elements
 """
 
 
-import numpy
 #import random
 import logging
 
 from .misc import NullHandler, ModelParameters
+from .registry import current_registry
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -36,14 +36,15 @@ class BaseProduct(object):
     """
     """
 
-    _counter = 1
-    _memory = dict()
+    # counts assignments to the degradation constant of any product,
+    # concentrations compare it to notice that theirs are out of date
+    revision = 0
 
     def __new__(cls, name=u"", *args, **kw_args):
         """
         Ensures the unique instance policy of all gene products.
         """
-        return cls._memory.get((cls, name), object.__new__(cls))
+        return current_registry().get((cls, name), object.__new__(cls))
 
     def __init__(self, name=u"", *args, **kw_args):
         """
@@ -52,18 +53,17 @@ class BaseProduct(object):
         name: str (optional)
             A string uniquely identifying this element among its class.
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         object.__init__(self)
-        self._index = self.__class__._counter
-        self.__class__._counter += 1
+        self._index = current_registry().count(self.__class__)
         if name:
             self._name = name
         else:
             self._name = u"%s_%d" % (self.__class__.__name__, self._index)
         self.location = 0
         self.degradation_constant = 0
-        self.__class__._memory[(self.__class__, self._name)] = self
+        current_registry().add(self)
 
     def __str__(self):
         """
@@ -73,17 +73,26 @@ class BaseProduct(object):
     def __repr__(self):
         return u"<%s.%s, %d>" % (self.__module__, self.__class__.__name__, self._index)
 
+    @property
+    def degradation_constant(self):
+        return self._degradation_constant
+
+    @degradation_constant.setter
+    def degradation_constant(self, constant):
+        self._degradation_constant = constant
+        BaseProduct.revision += 1
+
     def degrade(self, concentration):
         """
         """
-        return numpy.random.binomial(concentration, self.degradation_constant)\
+        return parameters.rng.binomial(concentration, self.degradation_constant)\
                 if concentration > 0.0 else 0.0
 
 
 class Enzyme(BaseProduct):
 
     def __init__(self, name=u"", *args, **kw_args):
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BaseProduct.__init__(self, name, *args, **kw_args)
         self.diffusion_constant = parameters.mobile.tf.diffusion()
@@ -93,7 +102,7 @@ class Enzyme(BaseProduct):
 class TranscriptionFactor(BaseProduct):
 
     def __init__(self, name=u"", *args, **kw_args):
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BaseProduct.__init__(self, name, *args, **kw_args)
         self.association_constant = parameters.mobile.tf.association()
@@ -105,7 +114,7 @@ class TranscriptionFactor(BaseProduct):
 class NucleoidAssociatedProtein(BaseProduct):
 
     def __init__(self, name=u"", *args, **kw_args):
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BaseProduct.__init__(self, name, *args, **kw_args)
         self.association_constant = parameters.mobile.nap.association()
@@ -117,7 +126,7 @@ class NucleoidAssociatedProtein(BaseProduct):
 class RNAPolymerase(BaseProduct):
 
     def __init__(self, name=u"", *args, **kw_args):
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BaseProduct.__init__(self, name, *args, **kw_args)
         self.association_constant = parameters.mobile.rnap.association()
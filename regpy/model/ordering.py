@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==========
+Gene Order
+==========
+
+:Date:
+    2026-10-18
+:File:
+    ordering.py
+
+Searches over the order of the elements of a sequence for layouts of strong
+or weak regulatory coupling. The coupling of a layout is the sum of the
+diffusion factors
+
+    association * exp(-distance / diffusion)
+
+of all binding sites whose ligand is made by a gene of the sequence, where
+the distance is taken to the start of that gene, i.e., the location of a TF
+is the gene producing it.
+
+Swapping two elements or moving one elsewhere shifts every element in
+between, but only binding sites on or bound by a shifted element change their
+distance. The change in coupling of a move is computed from those sites
+alone, which makes local moves cheap enough for simulated annealing.
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler, ModelParameters
+from .sequence import GeneSite, BindingSite
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+parameters = ModelParameters()
+
+
+SWAP = u"swap"
+MOVE = u"move"
+
+
+class GeneOrder(object):
+    """
+    The order of a sequence's elements together with the binding sites that
+    couple them.
+
+    Element `order[p]` is at position `p`, `position` is the inverse and
+    `start` holds the base pair coordinate of each element. Each coupling
+    between a binding site's element and the element of the gene producing
+    its ligand is stored once and listed for both elements in a compressed
+    incidence table. Couplings of an element with itself do not depend on the
+    order and are left out.
+    """
+
+    def __init__(self, sequence, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        sequence: Sequence
+            The elements to arrange, it is not changed until `apply`.
+        """
+        object.__init__(self)
+        self.elements = list(sequence)
+        num = len(self.elements)
+        self.lengths = numpy.array([len(site) for site in self.elements],
+                dtype=int)
+        # the first gene making a product is its location
+        self.producer = producer = dict()
+        for (i, site) in enumerate(self.elements):
+            if isinstance(site, GeneSite) and site.product is not None and\
+                    site.product not in producer:
+                producer[site.product] = i
+        site_element = list()
+        gene_element = list()
+        association = list()
+        diffusion = list()
+        for (i, site) in enumerate(self.elements):
+            if isinstance(site, GeneSite):
+                found = site.promoters
+            elif isinstance(site, BindingSite):
+                found = [site]
+            else:
+                continue
+            for bsite in found:
+                j = producer.get(bsite.ligand)
+                if j is None or j == i:
+                    continue
+                site_element.append(i)
+                gene_element.append(j)
+                association.append(bsite.ligand.association_constant)
+                diffusion.append(bsite.ligand.diffusion_constant)
+        self.site_element = numpy.array(site_element, dtype=numpy.intp)
+        self.gene_element = numpy.array(gene_element, dtype=numpy.intp)
+        self.association = numpy.array(association, dtype=float)
+        self.diffusion = numpy.array(diffusion, dtype=float)
+        # incidence table: the couplings of each element and the other end
+        ends = numpy.concatenate([self.site_element, self.gene_element])
+        order = numpy.argsort(ends, kind="mergesort")
+        num_edges = len(self.site_element)
+        self._edge = numpy.tile(numpy.arange(num_edges), 2)[order]
+        self._other = numpy.concatenate([self.gene_element,
+                self.site_element])[order]
+        # each coupling is counted at its site end when both ends move
+        self._first = (numpy.arange(2 * num_edges) < num_edges)[order]
+        self._indptr = numpy.zeros(num + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(ends, minlength=num),
+                out=self._indptr[1:])
+        self._shift = numpy.zeros(num, dtype=int)
+        self.set_order(numpy.arange(num))
+
+    def __len__(self):
+        """
+        Number of elements.
+        """
+        return len(self.elements)
+
+    def set_order(self, order):
+        """
+        Arranges the elements in the given order of their original indices.
+        """
+        self.order = numpy.array(order, dtype=numpy.intp)
+        self.position = numpy.empty_like(self.order)
+        self.position[self.order] = numpy.arange(len(self.order))
+        self.start = numpy.zeros(len(self.order), dtype=int)
+        self.start[self.order] = numpy.cumsum(self.lengths[self.order]) -\
+                self.lengths[self.order]
+
+    def factors(self, start=None):
+        """
+        Diffusion factor of every coupling.
+        """
+        if start is None:
+            start = self.start
+        distance = numpy.abs(start[self.site_element] -\
+                start[self.gene_element])
+        return self.association * numpy.exp(-distance / self.diffusion)
+
+    def cost(self):
+        """
+        Total coupling of the current order.
+        """
+        return self.factors().sum()
+
+    def _segment(self, kind, p, q):
+        """
+        First position and new order of the stretch of positions a move
+        rearranges.
+        """
+        order = self.order
+        if kind == SWAP:
+            (lo, hi) = (min(p, q), max(p, q))
+            segment = order[lo:hi + 1].copy()
+            (segment[0], segment[-1]) = (segment[-1], segment[0])
+        elif kind == MOVE:
+            if p < q:
+                (lo, hi) = (p, q)
+                segment = numpy.concatenate([order[p + 1:q + 1], order[p:p + 1]])
+            else:
+                (lo, hi) = (q, p)
+                segment = numpy.concatenate([order[p:p + 1], order[q:p]])
+        else:
+            raise ValueError("unknown move '%s'" % kind)
+        return (lo, segment)
+
+    def _couplings(self, elements, lo, hi):
+        """
+        The couplings involving the given elements, those between two of
+        them listed once.
+        """
+        begin = self._indptr[elements]
+        counts = self._indptr[elements + 1] - begin
+        total = counts.sum()
+        offsets = numpy.cumsum(counts) - counts
+        index = numpy.repeat(begin - offsets, counts) + numpy.arange(total)
+        other = self.position[self._other[index]]
+        keep = (other < lo) | (other > hi) | self._first[index]
+        return self._edge[index[keep]]
+
+    def delta(self, kind, p, q):
+        """
+        Change in coupling if the move was made.
+
+        Parameters
+        ----------
+        kind: str
+            `SWAP` exchanges the elements at positions `p` and `q`, `MOVE`
+            takes the element at `p` out and inserts it such that it ends up
+            at `q`.
+        p: int
+            A position.
+        q: int
+            Another position.
+        """
+        if p == q:
+            return 0.0
+        (lo, segment) = self._segment(kind, p, q)
+        hi = lo + len(segment) - 1
+        edges = self._couplings(segment, lo, hi)
+        if len(edges) == 0:
+            return 0.0
+        lengths = self.lengths[segment]
+        shift = self._shift
+        shift[segment] = self.start[self.order[lo]] + numpy.cumsum(lengths) -\
+                lengths - self.start[segment]
+        u = self.site_element[edges]
+        v = self.gene_element[edges]
+        before = numpy.abs(self.start[u] - self.start[v])
+        after = numpy.abs(self.start[u] + shift[u] - self.start[v] - shift[v])
+        shift[segment] = 0
+        scale = -1.0 / self.diffusion[edges]
+        return (self.association[edges] * (numpy.exp(after * scale) -\
+                numpy.exp(before * scale))).sum()
+
+    def make(self, kind, p, q):
+        """
+        Makes a move, see `delta`.
+        """
+        if p == q:
+            return
+        (lo, segment) = self._segment(kind, p, q)
+        lengths = self.lengths[segment]
+        self.start[segment] = self.start[self.order[lo]] +\
+                numpy.cumsum(lengths) - lengths
+        self.order[lo:lo + len(segment)] = segment
+        self.position[segment] = numpy.arange(lo, lo + len(segment))
+
+    def anneal(self, steps, temperature=1.0, cooling=0.999, maximise=True,
+            reach=None, moves=(SWAP, MOVE), rng=None):
+        """
+        Simulated annealing over swaps and moves of elements. The best order
+        found is kept.
+
+        Parameters
+        ----------
+        steps: int
+            Number of proposed moves.
+        temperature: float (optional)
+            Initial temperature in units of coupling.
+        cooling: float (optional)
+            Factor by which the temperature drops after each proposal.
+        maximise: bool (optional)
+            Search for strong coupling, otherwise for weak.
+        reach: int (optional)
+            Greatest distance in positions between the two positions of a
+            move, by default any. Shorter moves are cheaper to evaluate.
+        moves: tuple (optional)
+            Kinds of moves to propose.
+        rng: numpy.random.RandomState (optional)
+            Source of random numbers, the generator of the model parameters
+            by default.
+
+        Returns
+        -------
+        The coupling of the best order.
+        """
+        rng = parameters.rng if rng is None else rng
+        num = len(self)
+        if num < 2:
+            return self.cost()
+        if reach is None:
+            reach = num - 1
+        reach = max(min(int(reach), num - 1), 1)
+        sign = 1.0 if maximise else -1.0
+        current = self.cost()
+        best = current
+        best_order = self.order.copy()
+        steps = int(steps)
+        kinds = rng.randint(len(moves), size=steps)
+        first = rng.randint(num, size=steps)
+        offsets = rng.randint(1, reach + 1, size=steps) *\
+                numpy.where(rng.random_sample(steps) < 0.5, -1, 1)
+        accept = rng.random_sample(steps)
+        for i in range(steps):
+            p = int(first[i])
+            q = p + int(offsets[i])
+            if q < 0 or q >= num:
+                q = p - int(offsets[i])
+                if q < 0 or q >= num:
+                    continue
+            kind = moves[kinds[i]]
+            gain = sign * self.delta(kind, p, q)
+            if gain >= 0.0 or (temperature > 0.0 and\
+                    accept[i] < numpy.exp(gain / temperature)):
+                self.make(kind, p, q)
+                current += sign * gain
+                if sign * (current - best) > 0.0:
+                    best = current
+                    best_order = self.order.copy()
+            temperature *= cooling
+        self.set_order(best_order)
+        return self.cost()
+
+    def apply(self, sequence):
+        """
+        Rearranges the sequence in the current order, places every TF at the
+        gene producing it and initialises the sequence again.
+        """
+        sequence[:] = [self.elements[i] for i in self.order]
+        for (product, i) in self.producer.iteritems():
+            product.location = int(self.position[i])
+        sequence.initialise()
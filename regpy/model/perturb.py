@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=============
+Perturbations
+=============
+
+:Date:
+    2026-10-18
+:File:
+    perturb.py
+
+Knockouts and regulation flips applied to forks of a built model, see
+`CompiledSequence.fork`, and screens that run one such perturbation per gene
+or promoter site in a pool of processes.
+
+A perturbation only ever replaces the layout arrays it changes with modified
+copies, the model it was forked from and all other forks keep theirs.
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler, map_tasks
+from .logic import GeneLogic
+from .promoters import PromoterMatrix
+from .attractor import snapshot
+from .streams import RandomStream
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+GENE = u"gene"
+SITE = u"site"
+FLIP = u"flip"
+
+
+def knockout_gene(compiled, gene):
+    """
+    Makes a gene produce nothing. Polymerases still bind and transcribe it,
+    its output goes to the sink slot of the concentration vector. Its
+    product is removed unless other genes make it too.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        A fork of the model, changed in place.
+    gene: int
+        Index of the gene in `compiled.genes`.
+    """
+    product = compiled.gene_product[gene]
+    gene_product = compiled.gene_product.copy()
+    gene_product[gene] = len(compiled.products)
+    compiled.gene_product = gene_product
+    if not (gene_product == product).any():
+        compiled.concentrations[product] = 0.0
+        compiled._present[product] = False
+
+
+def _replace_promoters(compiled, keep, regulation):
+    matrix = compiled.promoters
+    compiled.promoters = PromoterMatrix(matrix.gene[keep], matrix.ligand[keep],
+            matrix.factor[keep], regulation[keep], matrix.num_genes,
+            matrix.shape[0])
+    compiled.gene_logic = GeneLogic.from_matrix(compiled.promoters,
+            compiled.rule)
+    compiled.tf_bound = compiled.tf_bound[keep]
+    compiled.tf_sites = [site for (site, flag) in zip(compiled.tf_sites,
+            keep) if flag]
+
+
+def knockout_site(compiled, column):
+    """
+    Removes a TF binding site from the promoter of its gene.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        A fork of the model, changed in place.
+    column: int
+        Index of the site in `compiled.tf_sites`.
+    """
+    keep = numpy.ones(len(compiled.tf_sites), dtype=bool)
+    keep[column] = False
+    _replace_promoters(compiled, keep, compiled.promoters.regulation)
+
+
+def flip_regulation(compiled, column):
+    """
+    Turns an activating TF binding site into an inhibitory one and vice
+    versa.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        A fork of the model, changed in place.
+    column: int
+        Index of the site in `compiled.tf_sites`.
+    """
+    regulation = compiled.promoters.regulation.copy()
+    regulation[column] = -regulation[column]
+    _replace_promoters(compiled, numpy.ones(len(regulation), dtype=bool),
+            regulation)
+
+
+PERTURBATIONS = {
+    GENE: knockout_gene,
+    SITE: knockout_site,
+    FLIP: flip_regulation
+}
+
+
+def perturb(compiled, kind, target, rng=None):
+    """
+    Returns a fork of the model with one perturbation applied.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        The unperturbed model, it is not changed.
+    kind: str
+        One of `GENE`, `SITE` or `FLIP`, or None for an unperturbed fork.
+    target: int
+        Index of the gene or promoter site.
+    rng: numpy.random.RandomState (optional)
+        Source of random numbers of a fork of a `StochasticSequence`, by
+        default a copy of the model's generator.
+    """
+    fork = compiled.fork() if rng is None else compiled.fork(rng)
+    if kind is not None:
+        PERTURBATIONS[kind](fork, target)
+    return fork
+
+
+def run_perturbation(compiled, kind, target, introduce, measure=snapshot,
+        rng=None):
+    """
+    Runs a perturbed fork of the model.
+
+    Parameters
+    ----------
+    compiled: CompiledSequence
+        The unperturbed model, it is not changed.
+    kind: str
+        One of `GENE`, `SITE` or `FLIP`, or None for the unperturbed model.
+    target: int
+        Index of the gene or promoter site.
+    introduce: numpy.ndarray
+        Flag per step whether to try placing a new polymerase.
+    measure: callable (optional)
+        Module level function extracting a result from the model after the
+        run.
+    rng: numpy.random.RandomState (optional)
+        See `perturb`.
+    """
+    fork = perturb(compiled, kind, target, rng)
+    for flag in introduce:
+        if flag:
+            fork.introduce_polymerase()
+        fork.next()
+    return measure(fork)
+
+
+def _run_task(task, compiled, introduce, measure):
+    (kind, target, rng) = task
+    return run_perturbation(compiled, kind, target, introduce, measure, rng)
+
+
+class KnockoutScreen(object):
+    """
+    Runs a model once for every single perturbation of one kind in a process
+    pool.
+
+    All runs place polymerases in the same steps, drawn once from the
+    screen's seed, so that differences between the results are due to the
+    perturbations alone. Forks of a `StochasticSequence` draw from a stream
+    derived from the screen's seed and their target, so results do not
+    depend on the number of processes or the order of the tasks. Workers
+    receive the model when they start and fork it for every task.
+    """
+
+    def __init__(self, compiled, steps, kind=GENE, targets=None, seed=None,
+            introduction=1.0, measure=snapshot, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        compiled: CompiledSequence
+            The unperturbed model in its initial state.
+        steps: int
+            Number of simulation steps per run.
+        kind: str (optional)
+            Knock out genes (`GENE`), promoter sites (`SITE`) or flip the
+            regulation of promoter sites (`FLIP`).
+        targets: iterable (optional)
+            Indices of the genes or promoter sites to perturb, all by
+            default.
+        seed: int (optional)
+            Seed of the polymerase introduction.
+        introduction: float (optional)
+            Probability per step of trying to place a new polymerase.
+        measure: callable (optional)
+            Module level function extracting a result from the model after a
+            run, by default `regpy.model.attractor.snapshot`.
+        """
+        object.__init__(self)
+        if kind not in PERTURBATIONS:
+            raise ValueError("unknown perturbation '%s'" % kind)
+        self.compiled = compiled
+        self.kind = kind
+        if targets is None:
+            num = len(compiled.genes) if kind == GENE else\
+                    len(compiled.tf_sites)
+            targets = range(num)
+        self.targets = [int(target) for target in targets]
+        self.seed = RandomStream(seed).seed
+        self.introduce = RandomStream(self.seed).random_sample(int(steps)) <\
+                introduction
+        self.measure = measure
+
+    def __len__(self):
+        return len(self.targets)
+
+    def _stream(self, key):
+        # only stochastic models draw random numbers while running
+        if not hasattr(self.compiled, "rng"):
+            return None
+        return RandomStream(self.seed, key)
+
+    def baseline(self):
+        """
+        Runs the unperturbed model in the current process.
+        """
+        return run_perturbation(self.compiled, None, None, self.introduce,
+                self.measure, self._stream((0,)))
+
+    def run(self, processes=None, chunksize=None):
+        """
+        Parameters
+        ----------
+        processes: int (optional)
+            Number of worker processes, all available cores by default. With
+            a single process the perturbations are run in the current
+            process.
+        chunksize: int (optional)
+            Number of perturbations sent to a worker at a time, by default
+            they are split into about four chunks per worker.
+
+        Returns
+        -------
+        A list with one result per target.
+        """
+        tasks = [(self.kind, target, self._stream((1, target)))\
+                for target in self.targets]
+        return map_tasks(_run_task, tasks, (self.compiled, self.introduce,
+                self.measure), processes, chunksize)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Polymerase Pools
+================
+
+:Date:
+    2026-10-18
+:File:
+    polymerase.py
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class PolymerasePool(object):
+    """
+    Positions and flags of all polymerases on a sequence as arrays.
+
+    Polymerases are kept ordered from the front of the sequence backwards.
+    Since they cannot overtake each other this order never changes while they
+    move, new ones are merged in and those that ran off the end of the
+    sequence are removed from the front. Each polymerase may be accompanied by
+    an `RNAPolymerase` object, `None` marks one that has none yet.
+    """
+
+    def __init__(self, position=(), bound=(), was_bound=(), objects=None,
+            *args, **kw_args):
+        """
+        Parameters
+        ----------
+        position: sequence (optional)
+            Element index of each polymerase.
+        bound: sequence (optional)
+            Whether each polymerase is bound to a gene.
+        was_bound: sequence (optional)
+            Whether each polymerase has just finished transcribing the gene
+            it is on.
+        objects: list (optional)
+            Objects accompanying the polymerases.
+        """
+        object.__init__(self)
+        position = numpy.asarray(position, dtype=numpy.intp)
+        order = numpy.argsort(-position, kind="mergesort")
+        self.position = position[order]
+        self.bound = numpy.asarray(bound, dtype=bool).reshape(-1)[order]
+        self.was_bound = numpy.asarray(was_bound, dtype=bool).reshape(-1)[order]
+        if objects is None:
+            objects = [None] * len(position)
+        self.objects = [objects[i] for i in order]
+
+    def __len__(self):
+        return len(self.position)
+
+    def copy(self):
+        """
+        Returns an independent copy of the pool.
+        """
+        pool = PolymerasePool()
+        pool.position = self.position.copy()
+        pool.bound = self.bound.copy()
+        pool.was_bound = self.was_bound.copy()
+        pool.objects = list(self.objects)
+        return pool
+
+    def _select(self, index):
+        self.position = self.position[index]
+        self.bound = self.bound[index]
+        self.was_bound = self.was_bound[index]
+        self.objects = [self.objects[i] for i in\
+                numpy.arange(len(self.objects))[index]]
+
+    def discard(self, length):
+        """
+        Removes all polymerases that ran off the end of a sequence of the
+        given length.
+
+        Returns
+        -------
+        The number of removed polymerases.
+        """
+        # they are all at the front
+        num = numpy.searchsorted(-self.position, -length, side="right")
+        if num > 0:
+            self._select(slice(num, None))
+        return num
+
+    def insert(self, positions, occupied):
+        """
+        Places new unbound polymerases at all given positions that are not
+        occupied, duplicates are placed once.
+
+        Parameters
+        ----------
+        positions: sequence
+            Element indices.
+        occupied: numpy.ndarray
+            Occupancy of the sequence elements, updated in place.
+
+        Returns
+        -------
+        The positions at which polymerases were placed.
+        """
+        positions = numpy.unique(numpy.asarray(positions, dtype=numpy.intp))
+        positions = positions[~occupied[positions]]
+        if len(positions) == 0:
+            return positions
+        occupied[positions] = True
+        position = numpy.concatenate([self.position, positions])
+        order = numpy.argsort(-position, kind="mergesort")
+        self.position = position[order]
+        flags = numpy.zeros(len(positions), dtype=bool)
+        self.bound = numpy.concatenate([self.bound, flags])[order]
+        self.was_bound = numpy.concatenate([self.was_bound, flags])[order]
+        objects = self.objects + [None] * len(positions)
+        self.objects = [objects[i] for i in order]
+        return positions
+
+    def move(self, go, occupied):
+        """
+        Moves polymerases one element forward.
+
+        A polymerase that wants to move does so if the next element is free or
+        is vacated by the polymerase ahead of it in the same step, such that a
+        whole train of adjacent polymerases advances together unless a
+        stationary one in front blocks it. A polymerase on the last element
+        leaves the sequence.
+
+        Parameters
+        ----------
+        go: numpy.ndarray
+            Whether each polymerase attempts to move.
+        occupied: numpy.ndarray
+            Occupancy of the sequence elements, updated in place.
+
+        Returns
+        -------
+        A boolean array marking the polymerases that moved.
+        """
+        pos = self.position
+        if len(pos) == 0:
+            return numpy.zeros(0, dtype=bool)
+        last = len(occupied) - 1
+        leaving = go & (pos == last)
+        adjacent = numpy.zeros(len(pos), dtype=bool)
+        adjacent[1:] = pos[:-1] == pos[1:] + 1
+        ahead = numpy.minimum(pos + 1, last)
+        fail = ~go | (~adjacent & ~leaving & occupied[ahead])
+        # within a train of adjacent polymerases one stuck in front blocks
+        # all behind it
+        failures = numpy.cumsum(fail)
+        base = numpy.maximum.accumulate(numpy.where(~adjacent,
+                failures - fail, 0))
+        moves = go & (failures == base)
+        occupied[pos[moves]] = False
+        occupied[pos[moves & ~leaving] + 1] = True
+        self.was_bound[moves & ~leaving] = False
+        self.position = pos + moves
+        return moves
+
+    def shift(self, steps, length):
+        """
+        Advances all polymerases by the given number of elements as if they
+        moved unobstructed in every step. Those that ran off the end of a
+        sequence of the given length earlier than the last step are removed,
+        those that left in the last step remain at the position `length`
+        until the next call to `discard` like after `move`.
+
+        Returns
+        -------
+        The previous positions of all polymerases.
+        """
+        previous = self.position
+        self.position = previous + steps
+        self.was_bound[previous < length - 1] = False
+        num = numpy.searchsorted(-self.position, -length, side="left")
+        if num > 0:
+            self._select(slice(num, None))
+        return previous
+
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===============
+Promoter Layout
+===============
+
+:Date:
+    2026-10-18
+:File:
+    promoters.py
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+def promoter_states(gene, regulation, bound, num_genes):
+    """
+    Multiplies the regulation of all bound sites of each gene's promoter.
+
+    Parameters
+    ----------
+    gene: numpy.ndarray
+        Index of the gene each promoter site belongs to.
+    regulation: numpy.ndarray
+        Regulation type of each promoter site.
+    bound: numpy.ndarray
+        Bound flags of the promoter sites, optionally with a leading
+        replicate axis.
+    num_genes: int
+        Total number of genes.
+
+    Returns
+    -------
+    The sign of the product for each gene (and replicate).
+    """
+    states = numpy.where(bound, regulation, 0)
+    lead = states.shape[:-1]
+    rows = int(numpy.prod(lead))
+    # offset the gene index of each replicate to count in one go
+    index = (numpy.arange(rows)[:, numpy.newaxis] * num_genes + gene).ravel()
+    states = states.reshape(rows, -1).ravel()
+    zeros = numpy.bincount(index, weights=(states == 0),
+            minlength=rows * num_genes)
+    negative = numpy.bincount(index, weights=(states < 0),
+            minlength=rows * num_genes)
+    result = numpy.where(negative % 2 == 1, -1, 1)
+    result[zeros > 0] = 0
+    return result.reshape(lead + (num_genes,))
+
+
+class PromoterMatrix(object):
+    """
+    Binding factors of all promoter sites as a sparse matrix in compressed
+    sparse row (CSR) format with one row per TF product and one column per
+    promoter site.
+
+    Since every site binds exactly one product, the occupancy of all sites is
+    the product of the concentration vector with the matrix. The per-site
+    arrays `gene`, `ligand`, `factor` and `regulation` describe the same
+    layout in site order.
+    """
+
+    def __init__(self, gene, ligand, factor, regulation, num_genes,
+            num_products, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        gene: sequence
+            Index of the gene each promoter site belongs to.
+        ligand: sequence
+            Index of the product binding each site.
+        factor: sequence
+            Binding factor of each site.
+        regulation: sequence
+            Regulation type of each site.
+        num_genes: int
+            Total number of genes.
+        num_products: int
+            Total number of products (rows).
+        """
+        object.__init__(self)
+        self.gene = numpy.asarray(gene, dtype=numpy.intp)
+        self.ligand = numpy.asarray(ligand, dtype=numpy.intp)
+        self.factor = numpy.asarray(factor, dtype=float)
+        self.regulation = numpy.asarray(regulation, dtype=int)
+        self.num_genes = int(num_genes)
+        self.shape = (int(num_products), len(self.ligand))
+        self.sites_per_gene = numpy.bincount(self.gene,
+                minlength=self.num_genes)
+        self.update()
+
+    def update(self):
+        """
+        Rebuilds the CSR arrays after changes to the per-site arrays.
+        """
+        order = numpy.argsort(self.ligand, kind="mergesort")
+        self.indices = order
+        self.data = self.factor[order]
+        self.indptr = numpy.zeros(self.shape[0] + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(self.ligand, minlength=self.shape[0]),
+                out=self.indptr[1:])
+        self._rows = self.ligand[order]
+
+    def __len__(self):
+        """
+        Number of promoter sites.
+        """
+        return self.shape[1]
+
+    def occupancy(self, concentrations):
+        """
+        Binding factor times ligand concentration for every site.
+
+        Parameters
+        ----------
+        concentrations: numpy.ndarray
+            Concentration vector indexed by product, optionally with a leading
+            replicate axis.
+        """
+        conc = numpy.asarray(concentrations)
+        result = numpy.empty(conc.shape[:-1] + (self.shape[1],), dtype=float)
+        result[..., self.indices] = self.data * conc[..., self._rows]
+        return result
+
+    def bind(self, concentrations, threshold):
+        """
+        Bound state of all sites given the concentrations of their ligands.
+        """
+        return self.occupancy(concentrations) >= threshold
+
+    def to_scipy(self):
+        """
+        Returns the matrix as a `scipy.sparse.csr_matrix`, requires scipy.
+        """
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr),
+                shape=self.shape)
+
+
+def promoter_matrix(genes, index, num_products):
+    """
+    Collects the promoter sites of the given genes in order.
+
+    Parameters
+    ----------
+    genes: iterable
+        `GeneSite`s whose promoters make up the matrix.
+    index: callable
+        Maps a ligand to its row.
+    num_products: int
+        Total number of rows.
+
+    Returns
+    -------
+    A `PromoterMatrix` and the list of sites corresponding to its columns.
+    """
+    genes = list(genes)
+    sites = list()
+    gene = list()
+    for (i, site) in enumerate(genes):
+        sites.extend(site.promoters)
+        gene.extend([i] * len(site.promoters))
+    matrix = PromoterMatrix(gene, [index(site.ligand) for site in sites],
+            [site.factor for site in sites],
+            [site.regulation for site in sites], len(genes), num_products)
+    return (matrix, sites)
+
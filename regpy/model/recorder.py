@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=====================
+Trajectory Recordings
+=====================
+
+:Date:
+    2026-10-18
+:File:
+    recorder.py
+
+Samples of a running sequence are streamed to a flat binary file of fixed
+size records next to a small JSON header. The header names the columns and
+counts the records that have been committed so far so that finished and
+running recordings alike can be opened as read-only memory maps.
+"""
+
+
+import os
+import json
+import logging
+import numpy
+
+from .misc import NullHandler
+from .sequence import GeneSite, BindingSite
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+FORMAT_VERSION = 1
+
+
+def record_dtype(num_products, num_genes, num_sites):
+    """
+    Layout of one sample: the step it was taken at, product concentrations,
+    gene rates and activity, and the positions of polymerases as a flag per
+    sequence element.
+    """
+    return numpy.dtype([
+        ("step", numpy.int64),
+        ("concentrations", numpy.float64, (num_products,)),
+        ("rate", numpy.float64, (num_genes,)),
+        ("active", numpy.bool_, (num_genes,)),
+        ("polymerases", numpy.bool_, (num_sites,))
+    ])
+
+
+def header_path(path):
+    return path + u".json"
+
+
+def _write_header(path, header):
+    tmp = header_path(path) + u".tmp"
+    with open(tmp, "w") as file_h:
+        json.dump(header, file_h, indent=1)
+    os.rename(tmp, header_path(path))
+
+
+class CompiledSource(object):
+    """
+    Reads samples from a `CompiledSequence`.
+    """
+
+    def __init__(self, compiled, *args, **kw_args):
+        object.__init__(self)
+        self.compiled = compiled
+        self.products = [unicode(prod) for prod in compiled.products]
+        self.genes = [gene._name for gene in compiled.genes]
+        self.sites = [site._name for site in compiled.sequence]
+
+    def fill(self, record):
+        compiled = self.compiled
+        record["concentrations"] = compiled.concentrations[:-1]
+        record["rate"] = compiled.gene_rate
+        record["active"] = compiled.gene_active
+        record["polymerases"] = False
+        pos = compiled.polymerases.position
+        record["polymerases"][pos[pos < len(compiled)]] = True
+
+
+class SequenceSource(object):
+    """
+    Reads samples from the objects of a `Sequence`.
+    """
+
+    def __init__(self, sequence, *args, **kw_args):
+        object.__init__(self)
+        self.sequence = sequence
+        self._products = list()
+        for site in sequence:
+            if isinstance(site, GeneSite):
+                candidates = [site.product] + [tf_site.ligand for tf_site in\
+                        site.promoters]
+            elif isinstance(site, BindingSite):
+                candidates = [site.ligand]
+            else:
+                continue
+            for prod in candidates:
+                if prod is not None and prod not in self._products:
+                    self._products.append(prod)
+        self._genes = [site for site in sequence if isinstance(site, GeneSite)]
+        self.products = [unicode(prod) for prod in self._products]
+        self.genes = [gene._name for gene in self._genes]
+        self.sites = [site._name for site in sequence]
+
+    def fill(self, record):
+        conc = self.sequence.concentrations
+        record["concentrations"] = [conc.get(prod, 0.0) for prod in self._products]
+        record["rate"] = [gene.rate for gene in self._genes]
+        record["active"] = [gene._active for gene in self._genes]
+        record["polymerases"] = False
+        num = len(self.sequence)
+        for pos in self.sequence.polymerases.itervalues():
+            if pos < num:
+                record["polymerases"][pos] = True
+
+
+class BaseRecorder(object):
+    """
+    Stepping of recorders that sample a model every `every` steps. Subclasses
+    provide `source`, `every`, `step` and `sample`.
+    """
+
+    def record(self):
+        """
+        Notes that the model advanced by one step, samples it if the step is
+        due. Call `sample` before the first step to include the initial state.
+        """
+        self.step += 1
+        if self.step % self.every == 0:
+            self.sample()
+
+    def run(self, steps):
+        """
+        Advances a `CompiledSequence` by the given number of steps and
+        samples it whenever due. The model jumps ahead between sampling points
+        with `CompiledSequence.advance`.
+        """
+        compiled = self.source.compiled
+        steps = int(steps)
+        while steps > 0:
+            jump = min(self.every - self.step % self.every, steps)
+            compiled.advance(jump)
+            self.step += jump
+            steps -= jump
+            if self.step % self.every == 0:
+                self.sample()
+
+
+class TrajectoryRecorder(BaseRecorder):
+    """
+    Streams samples of a sequence's state to disk every `every` steps.
+
+    Records are written into a memory map of one chunk of the file at a time.
+    Whenever a chunk is full it is flushed and the header updated so that
+    readers see it.
+    """
+
+    def __init__(self, target, path, every=1, chunk=1024, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        target: Sequence or CompiledSequence
+            The model to observe. Products, genes and sites are fixed when
+            the recorder is attached.
+        path: str
+            Location of the data file, the header is stored alongside it.
+        every: int (optional)
+            Sampling interval in steps.
+        chunk: int (optional)
+            Number of records per chunk of the file.
+        """
+        object.__init__(self)
+        if hasattr(target, "products"):
+            self.source = CompiledSource(target)
+        else:
+            self.source = SequenceSource(target)
+        self.path = path
+        self.every = int(every)
+        self.chunk = int(chunk)
+        self.dtype = record_dtype(len(self.source.products),
+                len(self.source.genes), len(self.source.sites))
+        self.step = 0
+        self.rows = 0
+        self.header = {
+            "version": FORMAT_VERSION,
+            "every": self.every,
+            "chunk": self.chunk,
+            "rows": 0,
+            "complete": False,
+            "products": self.source.products,
+            "genes": self.source.genes,
+            "sites": self.source.sites
+        }
+        open(self.path, "wb").close()
+        _write_header(self.path, self.header)
+        self._buffer = None
+        self._start = 0
+        self._filled = 0
+
+    def _map_chunk(self):
+        size = self.dtype.itemsize
+        with open(self.path, "r+b") as file_h:
+            file_h.truncate((self.rows + self.chunk) * size)
+        self._buffer = numpy.memmap(self.path, dtype=self.dtype, mode="r+",
+                offset=self.rows * size, shape=(self.chunk,))
+        self._start = self.rows
+        self._filled = 0
+
+    def flush(self):
+        """
+        Commits all records written so far.
+        """
+        if self._buffer is None:
+            return
+        self._buffer.flush()
+        self.rows = self._start + self._filled
+        self.header["rows"] = self.rows
+        _write_header(self.path, self.header)
+        if self._filled == self.chunk:
+            self._buffer = None
+
+    def sample(self):
+        """
+        Writes the current state regardless of the sampling interval.
+        """
+        if self._buffer is None:
+            self._map_chunk()
+        record = self._buffer[self._filled]
+        record["step"] = self.step
+        self.source.fill(record)
+        self._filled += 1
+        if self._filled == self.chunk:
+            self.flush()
+
+    def close(self):
+        """
+        Commits outstanding records, trims the file and marks the recording
+        as complete.
+        """
+        self.flush()
+        self._buffer = None
+        with open(self.path, "r+b") as file_h:
+            file_h.truncate(self.rows * self.dtype.itemsize)
+        self.header["complete"] = True
+        _write_header(self.path, self.header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class Trajectory(object):
+    """
+    Read-only view of a recording.
+    """
+
+    def __init__(self, path, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        path: str
+            Location of the data file of a finished or running recording.
+        """
+        object.__init__(self)
+        self.path = path
+        with open(header_path(path), "r") as file_h:
+            self.header = json.load(file_h)
+        self.products = self.header["products"]
+        self.genes = self.header["genes"]
+        self.sites = self.header["sites"]
+        self.dtype = record_dtype(len(self.products), len(self.genes),
+                len(self.sites))
+        rows = self.header["rows"]
+        if rows > 0:
+            self.data = numpy.memmap(path, dtype=self.dtype, mode="r",
+                    shape=(rows,))
+        else:
+            self.data = numpy.zeros(0, dtype=self.dtype)
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def complete(self):
+        return self.header["complete"]
+
+    @property
+    def steps(self):
+        return self.data["step"]
+
+    @property
+    def concentrations(self):
+        return self.data["concentrations"]
+
+    @property
+    def rate(self):
+        return self.data["rate"]
+
+    @property
+    def active(self):
+        return self.data["active"]
+
+    @property
+    def polymerases(self):
+        return self.data["polymerases"]
+
+    def column(self, name):
+        """
+        Time course of the concentration of one product by name.
+        """
+        return self.concentrations[:, self.products.index(name)]
+
+
+def open_trajectory(path):
+    """
+    Opens a recording without copying its data.
+    """
+    return Trajectory(path)
+
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Model Registries
+================
+
+:Date:
+    2026-10-18
+:File:
+    registry.py
+
+Sequence elements and gene products are unique per class and name. The
+registry that remembers them, and counts instances to generate default names,
+is scoped: constructors use the innermost registry entered as a context
+manager, or the module's default registry outside of any scope.
+
+    >>> with Registry() as reg:
+    ...     trn = network2trn(network)
+    ...     # build and run the model
+    >>> reg.clear()
+"""
+
+
+import logging
+import weakref
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class Registry(object):
+    """
+    Owns the unique instances of sequence elements and products of a model.
+    """
+
+    def __init__(self, weak=False, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        weak: bool (optional)
+            Only keep weak references to the instances such that they are
+            discarded once the model no longer refers to them.
+        """
+        object.__init__(self)
+        self.weak = bool(weak)
+        if self.weak:
+            self._memory = weakref.WeakValueDictionary()
+        else:
+            self._memory = dict()
+        self._counters = dict()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory
+
+    def has_key(self, key):
+        """
+        Whether an instance is registered under the key (class, name).
+        """
+        return key in self._memory
+
+    def get(self, key, default=None):
+        return self._memory.get(key, default)
+
+    def add(self, instance):
+        """
+        Registers an instance under its class and name.
+        """
+        self._memory[(instance.__class__, instance._name)] = instance
+
+    def count(self, cls):
+        """
+        Returns the next running index of the class, starting at 1.
+        """
+        index = self._counters.get(cls, 1)
+        self._counters[cls] = index + 1
+        return index
+
+    def reserve(self, cls, index):
+        """
+        Ensures that running indices of the class continue after `index`.
+        """
+        self._counters[cls] = max(self._counters.get(cls, 1), index + 1)
+
+    def instances(self, cls=None):
+        """
+        All registered instances, optionally only those of one class and its
+        subclasses.
+        """
+        return [obj for obj in self._memory.values() if cls is None or\
+                isinstance(obj, cls)]
+
+    def clear(self):
+        """
+        Forgets all instances and resets the counters.
+        """
+        self._memory.clear()
+        self._counters.clear()
+
+    def __enter__(self):
+        _scopes.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not _scopes or _scopes[-1] is not self:
+            raise RuntimeError("registry scopes exited out of order")
+        _scopes.pop()
+        return False
+
+
+default_registry = Registry()
+_scopes = list()
+
+
+def current_registry():
+    """
+    Returns the registry new instances are recorded in.
+    """
+    return _scopes[-1] if _scopes else default_registry
+
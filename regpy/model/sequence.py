@@ -18,14 +18,18 @@ Sequence Elements
 """
 
 
-import copy
 import operator
 import numpy
 import logging
-import networkx as nx
 
 from . import mobile
 from .misc import NullHandler, ModelParameters
+from .registry import current_registry
+from .coordinates import CoordinateIndex
+from .promoters import promoter_matrix
+from .logic import GeneLogic, PRODUCT
+from .concentrations import Concentrations
+from .accessibility import nap_layout
 
 
 logger = logging.getLogger(__name__)
@@ -39,14 +43,11 @@ class SequenceElement(object):
     """
     """
 
-    _counter = 1
-    _memory = dict()
-
     def __new__(cls, name=u"", *args, **kw_args):
         """
         Ensures the unique instance policy of all sequence sites.
         """
-        return cls._memory.get((cls, name), object.__new__(cls))
+        return current_registry().get((cls, name), object.__new__(cls))
 
     def __init__(self, name=u"", *args, **kw_args):
         """
@@ -55,11 +56,10 @@ class SequenceElement(object):
         name: str (optional)
             A string uniquely identifying this element among its class.
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         object.__init__(self)
-        self._index = self.__class__._counter
-        self.__class__._counter += 1
+        self._index = current_registry().count(self.__class__)
         if name:
             self._name = name
         else:
@@ -67,7 +67,7 @@ class SequenceElement(object):
         self._length = 0
         self._symbol = u""
         self.occupied = False
-        self.__class__._memory[(self.__class__, self._name)] = self
+        current_registry().add(self)
 
     def __len__(self):
         """
@@ -95,7 +95,7 @@ class EmptySite(SequenceElement):
     def __init__(self, name="", *args, **kw_args):
         """
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         SequenceElement.__init__(self, name, *args, **kw_args)
         self._length = parameters.sequence.empty.length()
@@ -109,7 +109,7 @@ class GeneSite(SequenceElement):
     def __init__(self, name=u"", promoters=False, product=None, *args, **kw_args):
         """
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         SequenceElement.__init__(self, name, *args, **kw_args)
         self._length = parameters.sequence.gene.length()
@@ -131,16 +131,23 @@ class GeneSite(SequenceElement):
         ss = u"%s%s%s" % (promoter, u"|", super(GeneSite, self).__str__()) if promoter else super(GeneSite, self).__str__()
         return ss
 
-    def is_active(self):
+    def is_active(self, state=None):
         """
+        Parameters
+        ----------
+        state: int (optional)
+            Combined regulatory state of the promoter if already known, e.g.,
+            from a `regpy.model.logic.GeneLogic`, otherwise the product of
+            the regulation of all bound sites.
         """
-        states = [tf_site.regulation if tf_site.bound else 0\
-                for tf_site in self.promoters]
-        if not states:
+        if not self.promoters:
             self.rate = parameters.sequence.gene.leakage()
             return True
-#        state = reduce(operator.add, states)
-        state = reduce(operator.mul, states)
+        if state is None:
+            states = [tf_site.regulation if tf_site.bound else 0\
+                    for tf_site in self.promoters]
+#            state = reduce(operator.add, states)
+            state = reduce(operator.mul, states)
         if state > 0:
             self.rate = parameters.sequence.gene.production()
             self._active = True
@@ -164,11 +171,16 @@ class BindingSite(SequenceElement):
     """
     """
 
+    # counts assignments to the ligand, regulation or factor of any binding
+    # site, sequences compare it to notice that their promoter tables are
+    # out of date
+    revision = 0
+
     def __new__(cls, ligand, regulation, name=u"", *args, **kw_args):
         """
         Ensures the unique instance policy of all ligand binding sites.
         """
-        return cls._memory.get((cls, name), SequenceElement.__new__(cls,
+        return current_registry().get((cls, name), SequenceElement.__new__(cls,
                 name, *args, **kw_args))
 
     def __init__(self, ligand, regulation, name=u"", *args, **kw_args):
@@ -178,7 +190,7 @@ class BindingSite(SequenceElement):
         regulation: int
             type of regulation how a bound ligand affects the site
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         SequenceElement.__init__(self, name, *args, **kw_args)
         self.regulation = int(regulation)
@@ -187,6 +199,33 @@ class BindingSite(SequenceElement):
         self.factor = 0.0
         self.bound = False
 
+    @property
+    def ligand(self):
+        return self._ligand
+
+    @ligand.setter
+    def ligand(self, ligand):
+        self._ligand = ligand
+        BindingSite.revision += 1
+
+    @property
+    def regulation(self):
+        return self._regulation
+
+    @regulation.setter
+    def regulation(self, regulation):
+        self._regulation = regulation
+        BindingSite.revision += 1
+
+    @property
+    def factor(self):
+        return self._factor
+
+    @factor.setter
+    def factor(self, factor):
+        self._factor = factor
+        BindingSite.revision += 1
+
     def update_distance(self, index, sequence):
         if index > self.ligand.location:
             sequence = sequence[self.ligand.location:index]
@@ -215,7 +254,7 @@ class TFBindingSite(BindingSite):
              1 activating
 
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BindingSite.__init__(self, ligand, regulation, name, *args, **kw_args)
         self._length = parameters.sequence.tf.length()
@@ -239,13 +278,31 @@ class NAPBindingSite(BindingSite):
              1 enhancing
              2 strongly enhancing
         """
-        if self.__class__._memory.has_key((self.__class__, name)):
+        if current_registry().has_key((self.__class__, name)):
             return
         BindingSite.__init__(self, ligand, regulation, name, *args, **kw_args)
         self._length = parameters.sequence.nap.length()
         self._symbol = u"N"
 
 
+def _site_table(sites):
+    return ([site.ligand for site in sites], [site.regulation for site in\
+            sites], [site.factor for site in sites])
+
+
+def _update_flags(sites, flags, previous):
+    """
+    Sets the bound flag of the sites, only of those whose flag differs from
+    `previous` unless that is None.
+    """
+    if previous is None:
+        changed = range(len(sites))
+    else:
+        changed = numpy.flatnonzero(flags != previous).tolist()
+    for k in changed:
+        sites[k].bound = bool(flags[k])
+
+
 class Sequence(list):
     """
     """
@@ -256,104 +313,549 @@ class Sequence(list):
         ----------
         """
         list.__init__(self, *args, **kw_args)
-        self.concentrations = dict()
+        self._ligand_slots = None
+        self._nap_slots = None
+        self.concentrations = Concentrations()
         self.polymerases = dict()
+        self.coordinates = None
+        self.promoter_matrix = None
+        self._promoter_revision = None
+        self.rule = PRODUCT
+        self.probe = None
 
     def __str__(self):
         return u"|".join(str(item) for item in self)
 
+    @property
+    def rule(self):
+        """
+        How bound TF sites combine into the regulatory state of a gene, see
+        `regpy.model.logic`.
+        """
+        return self._rule
+
+    @rule.setter
+    def rule(self, rule):
+        if self.promoter_matrix is not None:
+            self.gene_logic = GeneLogic.from_matrix(self.promoter_matrix, rule)
+        self._rule = rule
+
+    @property
+    def concentrations(self):
+        """
+        Product concentrations as a `regpy.model.concentrations.Concentrations`
+        mapping, assigned dictionaries are converted.
+        """
+        return self._concentrations
+
+    @concentrations.setter
+    def concentrations(self, concentrations):
+        if not isinstance(concentrations, Concentrations):
+            concentrations = Concentrations(concentrations)
+        self._concentrations = concentrations
+        self._ligand_slots = None
+        self._nap_slots = None
+        # the bound flags of all sites are written again by the next step
+        self.tf_bound = None
+        self.nap_bound = None
+
     def linearise_trn(self, trn):
-        for gene in trn:
-            logger.debug("%s product: %s", repr(gene), repr(gene.product))
-            logger.debug("\t%s", trn.pred[gene])
-            for (regulator, data) in trn.pred[gene].iteritems():
+        """
+        Appends the genes of a TRN to the sequence. Genes and their promoter
+        sites are laid out in the order in which the genes were created, i.e.,
+        the node order of the network given to `network2trn`, rather than in
+        the arbitrary order of the graph's dictionaries.
+        """
+        by_creation = operator.attrgetter("_index")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for gene in sorted(trn, key=by_creation):
+            if debug:
+                logger.debug("%r product: %r", gene, gene.product)
+                logger.debug("\t%s", trn.pred[gene])
+            for regulator in sorted(trn.pred[gene], key=by_creation):
+                data = trn.pred[gene][regulator]
                 tf_site = TFBindingSite(ligand=regulator.product,
                         regulation=data.get("regulation", 0))
-                logger.debug("\t%s added", repr(tf_site))
+                if debug:
+                    logger.debug("\t%r added", tf_site)
                 gene.promoters.append(tf_site)
             self.append(gene)
-            logger.debug("%s", str(self))
+        if debug:
+            logger.debug("%s", self)
 
     def initialise_promoters(self, genes):
         """
+        Gives every TF binding site in the promoters of the genes that has no
+        regulation type yet an activating or inhibitory one with equal
+        probability, drawn all at once.
         """
-        for site in genes:
-            for tf_site in site.promoters:
-                while not tf_site.regulation:
-                    if parameters.rnd_float() < 0.5:
-                        tf_site.regulation = 1
-                    else:
-                        tf_site.regulation = -1
-            # binding site location plays a small role in diffusion
+        sites = [tf_site for site in genes for tf_site in site.promoters\
+                if not tf_site.regulation]
+        if not sites:
+            return
+        activating = parameters.rnd_float(len(sites)) < 0.5
+        for (tf_site, flag) in zip(sites, activating.tolist()):
+            tf_site.regulation = 1 if flag else -1
+        # binding site location plays a small role in diffusion
 #            random.shuffle(site.promoters) # want something deterministic here
 
     def initialise_naps(self, genes):
         """
+        Makes the genes encode new NAPs and appends their binding sites to the
+        sequence.
+
+        The number of sites of each NAP is drawn from
+        `parameters.sequence.nap.nums`, the regulation level of each site
+        uniformly from the non-zero ones of `parameters.sequence.nap.states`
+        levels, all in one go.
         """
+        genes = list(genes)
+        if not genes:
+            return
         num_states = parameters.sequence.nap.states()
-        nap_pdf = [float(i) / num_states for i in range(1, num_states + 1)]
-        for site in genes:
+        # regulation level of each state, neutral ones are never drawn
+        levels = numpy.array([i - 2 for i in range(num_states) if i != 2],
+                dtype=int)
+        cdf = numpy.arange(1, len(levels) + 1, dtype=float) / len(levels)
+        num_sites = parameters.sequence.nap.nums(len(genes))
+        total = int(num_sites.sum())
+        regulation = levels[numpy.minimum(numpy.searchsorted(cdf,
+                parameters.rnd_float(total), side="right"), len(levels) - 1)]
+        regulation = regulation.tolist()
+        sites = list()
+        for (site, num) in zip(genes, num_sites.tolist()):
             nap = mobile.NucleoidAssociatedProtein()
             site.product = nap
-            num_sites = parameters.sequence.nap.num()
-            while not num_sites:
-                num_sites = parameters.sequence.nap.num()
-            for i in range(num_sites):
-                regulation = 0
-                while not regulation:
-                    prob = parameters.rnd_float()
-                    for (i, val) in enumerate(nap_pdf):
-                        if prob <= val:
-                            break
-                    regulation = i - 2
-                nap_site = NAPBindingSite(ligand=nap, regulation=regulation)
-                self.append(nap_site)
+            for reg in regulation[len(sites):len(sites) + num]:
+                sites.append(NAPBindingSite(ligand=nap, regulation=reg))
+        self.extend(sites)
 
     def initialise(self):
         """
+        Computes distances and diffusion factors of all binding sites, those
+        in promoter regions included, in one pass over a cumulative
+        coordinate index of the sequence.
         """
-        for (i, site) in enumerate(self):
+        self.index_binding_sites()
+        if self._binding_sites:
+            self._update_factors(numpy.arange(len(self._binding_sites)))
+        self.compile_promoters()
+
+    def index_binding_sites(self):
+        """
+        Builds the coordinate index and the table of all binding sites that
+        `initialise` and the edit operations `insert_sites`, `delete_sites`
+        and `move_sites` work with. Distances and factors are taken as they
+        are.
+        """
+        self.coordinates = CoordinateIndex(self)
+        self._binding_sites = list()
+        self._binding_index = numpy.zeros(0, dtype=numpy.intp)
+        self._binding_ligand = numpy.zeros(0, dtype=numpy.intp)
+        self._binding_distance = numpy.zeros(0, dtype=int)
+        self._located = list()
+        self._ligand_slot = dict()
+        self._binding_column = None
+        self._binding_nap = None
+        self._track(self, 0)
+
+    def _track(self, elements, start):
+        """
+        Adds the binding sites among and in the promoters of the elements,
+        which begin at index `start`, to the table of binding sites.
+        """
+        sites = list()
+        indices = list()
+        ligands = list()
+        for (i, site) in enumerate(elements, start):
             if isinstance(site, BindingSite):
-                site.update_distance(i, self)
-                # diffusion factor
-                site.factor = site.ligand.association_constant *\
-                        numpy.exp(-site.distance/site.ligand.diffusion_constant)
+                found = [site]
             elif isinstance(site, GeneSite):
-                for tf_site in site.promoters:
-                    tf_site.update_distance(i, self)
-                    # diffusion factor
-                    tf_site.factor = tf_site.ligand.association_constant *\
-                            numpy.exp(-tf_site.distance / tf_site.ligand.diffusion_constant)
-                    logger.debug("%s constant binding factor = %f",
-                            str(tf_site), tf_site.factor)
+                found = site.promoters
+            else:
+                continue
+            for bsite in found:
+                slot = self._ligand_slot.get(bsite.ligand)
+                if slot is None:
+                    slot = len(self._located)
+                    self._ligand_slot[bsite.ligand] = slot
+                    self._located.append(bsite.ligand)
+                sites.append(bsite)
+                indices.append(i)
+                ligands.append(slot)
+        self._binding_sites.extend(sites)
+        self._binding_index = numpy.concatenate([self._binding_index,
+                numpy.array(indices, dtype=numpy.intp)])
+        self._binding_ligand = numpy.concatenate([self._binding_ligand,
+                numpy.array(ligands, dtype=numpy.intp)])
+        self._binding_distance = numpy.concatenate([self._binding_distance,
+                numpy.array([bsite.distance for bsite in sites], dtype=int)])
+        # promoter sites only enter with genes which recompile the promoters,
+        # NAP sites lay out the NAPs anew
+        if self._binding_column is not None:
+            self._binding_column = numpy.concatenate([self._binding_column,
+                    numpy.zeros(len(sites), dtype=numpy.intp) - 1])
+        if self._binding_nap is not None:
+            self._binding_nap = numpy.concatenate([self._binding_nap,
+                    numpy.zeros(len(sites), dtype=numpy.intp) - 1])
+        return len(sites)
+
+    def _untrack(self, keep):
+        self._binding_sites = [site for (site, flag) in\
+                zip(self._binding_sites, keep) if flag]
+        self._binding_index = self._binding_index[keep]
+        self._binding_ligand = self._binding_ligand[keep]
+        self._binding_distance = self._binding_distance[keep]
+        if self._binding_column is not None:
+            self._binding_column = self._binding_column[keep]
+        if self._binding_nap is not None:
+            self._binding_nap = self._binding_nap[keep]
+
+    def _distances(self):
+        locations = numpy.array([ligand.location for ligand in self._located],
+                dtype=int)
+        return self.coordinates.distance(self._binding_index,
+                locations[self._binding_ligand])
+
+    def _update_factors(self, selection, distances=None):
+        """
+        Recomputes distance and diffusion factor of the selected entries of
+        the binding site table.
+
+        Returns
+        -------
+        The new factors.
+        """
+        sites = [self._binding_sites[k] for k in selection]
+        if distances is None:
+            distances = self._distances()[selection]
+        # constants are read once per ligand rather than once per site
+        (slots, inverse) = numpy.unique(self._binding_ligand[selection],
+                return_inverse=True)
+        ligands = [self._located[k] for k in slots.tolist()]
+        association = numpy.array([ligand.association_constant\
+                for ligand in ligands], dtype=float)[inverse]
+        diffusion = numpy.array([ligand.diffusion_constant\
+                for ligand in ligands], dtype=float)[inverse]
+        # diffusion factor
+        factors = association * numpy.exp(-distances / diffusion)
+        for (site, dist, factor) in zip(sites, distances.tolist(),
+                factors.tolist()):
+            site.distance = dist
+            site.factor = factor
+        self._binding_distance[selection] = distances
+        return factors
+
+    def _remap(self, positions):
+        """
+        Moves binding site indices, ligand locations and polymerases
+        according to the mapping `positions` of old to new element indices.
+        """
+        self._binding_index = positions(self._binding_index)
+        if self.promoter_matrix is not None:
+            self._nap_index = positions(self._nap_index)
+            self._gene_index = positions(self._gene_index)
+        locations = numpy.array([ligand.location for ligand in self._located],
+                dtype=int)
+        moved = positions(locations)
+        for k in numpy.flatnonzero(moved != locations):
+            self._located[k].location = int(moved[k])
+        if self.polymerases:
+            rnaps = list(self.polymerases)
+            moved = positions(numpy.array([self.polymerases[rnap] for rnap in\
+                    rnaps], dtype=int))
+            self.polymerases = dict(zip(rnaps, moved.tolist()))
+
+    def _refresh(self, rebuild, relayout=False):
+        """
+        Updates the factors of binding sites whose distance changed, the
+        promoter matrix and the NAP layout. The promoters are compiled again
+        if `rebuild` is set, the NAPs if `relayout` is.
+
+        Returns
+        -------
+        The number of updated binding sites.
+        """
+        distances = self._distances()
+        changed = numpy.flatnonzero(distances != self._binding_distance)
+        # the tables are only up to date after patching them if no site was
+        # changed outside of the edit
+        synced = self._promoter_revision == BindingSite.revision
+        factors = self._update_factors(changed, distances[changed])
+        if rebuild or self.promoter_matrix is None:
+            self.compile_promoters()
+            return len(changed)
+        if relayout:
+            self.compile_naps()
+        else:
+            self._shift_naps(changed, factors)
+        if self._binding_column is None:
+            self._binding_column = numpy.array([self._tf_column.get(site, -1)\
+                    for site in self._binding_sites], dtype=numpy.intp)
+        columns = self._binding_column[changed]
+        promoter = columns >= 0
+        if promoter.any():
+            self.promoter_matrix.factor[columns[promoter]] = factors[promoter]
+            self.promoter_matrix.update()
+        if synced:
+            self._promoter_revision = BindingSite.revision
+        return len(changed)
+
+    def _shift_naps(self, changed, factors):
+        """
+        Moves the NAP sites and genes of the NAP layout to their coordinates
+        after an edit that kept the NAP sites and takes over the new factors
+        of the changed binding sites.
+        """
+        layout = self.nap_layout
+        if len(layout) == 0:
+            # no gene is within reach of any site wherever they are
+            return
+        if self._binding_nap is None:
+            self._binding_nap = numpy.array([self._nap_column.get(site, -1)\
+                    for site in self._binding_sites], dtype=numpy.intp)
+        columns = self._binding_nap[changed]
+        nap = columns >= 0
+        layout.factor[columns[nap]] = factors[nap]
+        layout.relocate(self.coordinates[self._nap_index],
+                self.coordinates[self._gene_index])
+
+    def insert_sites(self, index, sites):
+        """
+        Inserts elements before `index`.
+
+        The coordinate index is updated in place, locations of ligands and
+        polymerases behind the insertion point shift along and only binding
+        sites whose distance to their ligand changed get a new diffusion
+        factor. Requires an initialised sequence, the elements of which
+        must not be changed by list operations in between edits.
+
+        Notes
+        -----
+        Updating the coordinate and binding site tables takes a few
+        vectorised passes over them. The cost of an edit is dominated by the
+        sites whose ligand lies on the other side of the edit, each of them
+        gets a new factor in Python, and by `compile_promoters` which
+        follows every edit that involves a `GeneSite`. The edits phase of
+        `benchmarks/benchmark.py` measures both.
+
+        Returns
+        -------
+        The number of binding sites whose factor was updated.
+        """
+        sites = list(sites)
+        index = int(index)
+        if not 0 <= index <= len(self):
+            raise IndexError("insertion point %d out of range" % index)
+        num = len(sites)
+        self[index:index] = sites
+        self.coordinates.insert(index, [len(site) for site in sites])
+        self._remap(lambda x: x + num * (x >= index))
+        self._track(sites, index)
+        return self._refresh(any(isinstance(site, GeneSite) for site in sites),
+                any(isinstance(site, NAPBindingSite) for site in sites))
+
+    def delete_sites(self, index, count=1):
+        """
+        Removes `count` elements starting at `index`, see `insert_sites`.
+        Polymerases on the removed elements are dropped, ligands located on
+        them are moved to the element following the gap.
+
+        Returns
+        -------
+        The number of binding sites whose factor was updated.
+        """
+        index = int(index)
+        end = index + int(count)
+        if not 0 <= index <= end <= len(self):
+            raise IndexError("elements %d to %d out of range" % (index, end))
+        removed = self[index:end]
+        del self[index:end]
+        self.coordinates.delete(index, end - index)
+        for (rnap, pos) in list(self.polymerases.items()):
+            if index <= pos < end:
+                del self.polymerases[rnap]
+        self._untrack((self._binding_index < index) |\
+                (self._binding_index >= end))
+        self._remap(lambda x: numpy.where(x >= end, x - (end - index),
+                numpy.minimum(x, index)))
+        return self._refresh(any(isinstance(site, GeneSite) for site in\
+                removed), any(isinstance(site, NAPBindingSite) for site in\
+                removed))
+
+    def move_sites(self, index, count, target):
+        """
+        Moves `count` elements starting at `index` such that they begin at
+        `target` in the resulting sequence, see `insert_sites`. Ligands and
+        polymerases located on the moved elements move with them.
+
+        Returns
+        -------
+        The number of binding sites whose factor was updated.
+        """
+        index = int(index)
+        count = int(count)
+        target = int(target)
+        end = index + count
+        if not 0 <= index <= end <= len(self) or\
+                not 0 <= target <= len(self) - count:
+            raise IndexError("cannot move elements %d to %d to %d" % (index,
+                    end, target))
+        block = self[index:end]
+        del self[index:end]
+        self[target:target] = block
+        lengths = self.coordinates.lengths[index:end].copy()
+        self.coordinates.delete(index, count)
+        self.coordinates.insert(target, lengths)
+
+        def positions(x):
+            rest = numpy.where(x >= end, x - count, x)
+            rest = rest + count * (rest >= target)
+            return numpy.where((x >= index) & (x < end), x - index + target,
+                    rest)
+
+        self._remap(positions)
+        return self._refresh(any(isinstance(site, GeneSite) for site in block))
+
+    def compile_promoters(self):
+        """
+        Collects the promoter sites of all genes in a
+        `regpy.model.promoters.PromoterMatrix` that `next` uses to update
+        their bound state in one go. Production and leakage rates of all
+        genes are evaluated here as well. Called by `initialise` and by
+        `next` when the ligand, regulation or factor of a binding site
+        changed since. Needs to be called again when promoter sites are added
+        to or removed from genes or rates change otherwise.
+        """
+        genes = [site for site in self if isinstance(site, GeneSite)]
+        self._ligands = list()
+        index = dict()
+        for gene in genes:
+            for tf_site in gene.promoters:
+                if tf_site.ligand not in index:
+                    index[tf_site.ligand] = len(self._ligands)
+                    self._ligands.append(tf_site.ligand)
+        (self.promoter_matrix, self._tf_sites) = promoter_matrix(genes,
+                index.__getitem__, len(self._ligands))
+        self._tf_column = dict((tf_site, j) for (j, tf_site) in\
+                enumerate(self._tf_sites))
+        self._binding_column = None
+        self.gene_logic = GeneLogic.from_matrix(self.promoter_matrix,
+                self.rule)
+        self._gene_column = dict((gene, i) for (i, gene) in enumerate(genes))
+        self._genes = genes
+        self._gene_production = numpy.array([parameters.sequence.gene.production()\
+                for gene in genes], dtype=float)
+        self._gene_leakage = numpy.array([parameters.sequence.gene.leakage()\
+                for gene in genes], dtype=float)
+        self._ligand_slots = None
+        self.tf_bound = None
+        self.compile_naps()
+        self._promoter_revision = BindingSite.revision
+
+    def _stale_promoters(self):
+        """
+        Whether the promoter or NAP sites differ from the tables compiled by
+        `compile_promoters`. The sites are only compared when a binding site
+        was changed at all since.
+        """
+        if self._promoter_revision == BindingSite.revision:
+            return False
+        matrix = self.promoter_matrix
+        layout = self.nap_layout
+        stale = [tf_site for gene in self._genes for tf_site in\
+                gene.promoters] != self._tf_sites or\
+                _site_table(self._tf_sites) != ([self._ligands[j] for j in\
+                matrix.ligand.tolist()], matrix.regulation.tolist(),
+                matrix.factor.tolist()) or\
+                _site_table(self._nap_sites) != ([self._nap_ligands[j] for j in\
+                layout.ligand.tolist()], layout.regulation.tolist(),
+                layout.factor.tolist())
+        if not stale:
+            self._promoter_revision = BindingSite.revision
+        return stale
+
+    def compile_naps(self):
+        """
+        Collects the NAP binding sites in a
+        `regpy.model.accessibility.NAPLayout` that `next` uses to update
+        their bound state and the accessibility of all genes. Called by
+        `compile_promoters` and by edits that add or remove NAP sites, other
+        edits only move the sites and genes of the layout.
+        """
+        self._nap_ligands = list()
+        index = dict()
+        genes = list()
+        for (i, site) in enumerate(self):
+            if isinstance(site, NAPBindingSite) and site.ligand not in index:
+                index[site.ligand] = len(self._nap_ligands)
+                self._nap_ligands.append(site.ligand)
+            elif isinstance(site, GeneSite):
+                genes.append(i)
+        (self.nap_layout, self._nap_sites, self._nap_index) = nap_layout(self,
+                index.__getitem__, parameters.sequence.nap.window,
+                parameters.sequence.nap.effect, self.coordinates)
+        self._gene_index = numpy.array(genes, dtype=numpy.intp)
+        self._nap_column = dict((site, j) for (j, site) in\
+                enumerate(self._nap_sites))
+        self._binding_nap = None
+        self._nap_slots = None
+        self.nap_bound = None
 
     def next(self):
         """
+        Advances the model by one step. Attach a
+        `regpy.model.instrument.StepProbe` as `probe` to time the phases of
+        the step and observe events.
+
+        The bound flags of all promoter and NAP sites are kept in `tf_bound`
+        and `nap_bound`, only the sites whose flag changed are updated.
         """
-        old = copy.copy(self.concentrations)
-        # update sequence elements
-        for site in self:
-#            logger.debug(str(site))
-            # update TFs in promoter regions
-            if isinstance(site, GeneSite):
-                for tf_site in site.promoters:
-                    conc = old.get(tf_site.ligand, 0.0)
-                    if tf_site.factor * conc >= parameters.sequence.tf.threshold:
-                        tf_site.bound = True
-                    else:
-                        tf_site.bound = False
-##                    logger.debug("[%s] = %f @ %s factor = %f:",
-##                            str(tf_site.ligand), conc, str(tf_site), tf_site.factor)
-#                    if tf_site.bound and\
-#                            parameters.rnd_float() < tf_site.ligand.dissociation_constant:
-##                        logger.debug("\treleased")
-#                        tf_site.bound = False
-#                    elif conc > 0.0 and parameters.rnd_float() < tf_site.factor * conc:
-##                        logger.debug("\tbound")
-#                        tf_site.bound = True
-            # update NAP binding sites
-            elif isinstance(site, NAPBindingSite):
-                pass
+        probe = self.probe
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if probe is not None:
+            probe.step()
+            start = probe.timer()
+        # update TFs in promoter regions
+        if self.promoter_matrix is None or self._stale_promoters():
+            self.compile_promoters()
+        if self._ligand_slots is None:
+            self._ligand_slots = self.concentrations.slots(self._ligands)
+            self._ligand_conc = numpy.zeros(len(self._ligands), dtype=float)
+        conc = self.concentrations.vector(self._ligand_slots,
+                out=self._ligand_conc)
+        bound = self.promoter_matrix.bind(conc, parameters.sequence.tf.threshold)
+        _update_flags(self._tf_sites, bound, self.tf_bound)
+        self.tf_bound = bound
+        states = self.gene_logic.states(bound)
+        # update NAPs and the accessibility of genes
+        if self._nap_slots is None:
+            self._nap_slots = self.concentrations.slots(self._nap_ligands)
+        bound = self.nap_layout.bind(self.concentrations.vector(
+                self._nap_slots), parameters.sequence.nap.threshold)
+        _update_flags(self._nap_sites, bound, self.nap_bound)
+        self.nap_bound = bound
+        access = self.nap_layout.accessibility(bound).tolist()
+        # evaluate `GeneSite.is_active` of all genes with an unbound
+        # polymerase on them at once
+        waiting = [self._gene_column[self[pos]] for (rnap, pos) in\
+                self.polymerases.iteritems() if not rnap.bound and\
+                pos < len(self) and isinstance(self[pos], GeneSite)]
+        genes = numpy.array(waiting, dtype=numpy.intp)
+        rate = numpy.zeros(len(self._genes), dtype=float)
+        active = numpy.zeros(len(self._genes), dtype=bool)
+        rate[genes] = [self._genes[i].rate for i in waiting]
+        active[genes] = [self._genes[i]._active for i in waiting]
+        flags = self.gene_logic.evaluate(states[genes], genes, rate, active,
+                self._gene_production, self._gene_leakage)
+        may_bind = dict()
+        for (i, flag) in zip(waiting, flags.tolist()):
+            gene = self._genes[i]
+            gene.rate = float(rate[i])
+            gene._active = bool(active[i])
+            may_bind[gene] = flag
+        if probe is not None:
+            start = probe.stop("binding", start)
         # update polymerases
 #        rm = set()
 #        last = len(self) - 1
@@ -391,51 +893,97 @@ class Sequence(list):
 #            del self.polymerases[rnap]
         rm = set()
         last = len(self) - 1
-        for (rnap, pos) in self.polymerases.iteritems():
+        # polymerases cannot overtake each other, processing them from the
+        # front of the sequence backwards lets a whole train move in one step
+        # and makes the outcome independent of dictionary order
+        for (rnap, pos) in sorted(self.polymerases.iteritems(),
+                key=operator.itemgetter(1), reverse=True):
             if pos >= len(self):
                 rm.add(rnap)
                 continue
             site = self[pos]
-            logger.debug("%s @ %s:", str(rnap), str(site))
+            if debug:
+                logger.debug("%s @ %s:", rnap, site)
             if rnap.bound:
-                logger.debug("\ttranscribed %s", str(site.product))
-                logger.debug(str(site.rate))
-                self.concentrations[site.product] =\
-                        self.concentrations.get(site.product, 0.0) + site.rate
-                logger.debug("\treleased")
+                if probe is not None:
+                    tick = probe.timer()
+                # genes without product transcribe into nothing
+                if site.product is not None:
+                    self.concentrations.add(site.product,
+                            site.rate * access[self._gene_column[site]])
                 rnap.bound = False
                 rnap.was_bound = True
-            elif isinstance(site, GeneSite) and site.is_active() and\
+                if debug:
+                    logger.debug("\ttranscribed %s at %s", site.product,
+                            site.rate)
+                    logger.debug("\treleased")
+                if probe is not None:
+                    probe.stop("transcription", tick)
+                    probe.emit("transcribed", rnap, site)
+            elif isinstance(site, GeneSite) and may_bind[site] and\
                     not rnap.was_bound:
-                logger.debug("\tbound")
+                if debug:
+                    logger.debug("\tbound")
                 rnap.bound = True
+                if probe is not None:
+                    probe.emit("bound", rnap, site)
             elif pos == last:
-                logger.debug("\tleft")
+                if debug:
+                    logger.debug("\tleft")
                 self.polymerases[rnap] += 1
                 self[pos].occupied = False
+                if probe is not None:
+                    probe.emit("left", rnap)
             elif not self[pos + 1].occupied:
                 # unbound polymerase moves on
-                logger.debug("\tmoved on")
+                if debug:
+                    logger.debug("\tmoved on")
                 self.polymerases[rnap] += 1
                 self[pos].occupied = False
                 self[pos + 1].occupied = True
                 rnap.was_bound = False
+                if probe is not None:
+                    probe.emit("moved", rnap, pos + 1)
         for rnap in rm:
             del self.polymerases[rnap]
+        if probe is not None:
+            start = probe.stop("transport", start)
         # update concentrations
-        logger.debug(str(self.concentrations))
-        for (mol, conc) in self.concentrations.iteritems():
-#            deg = mol.degrade(conc)
-            deg = numpy.ceil(mol.degradation_constant * conc)
-            logger.debug(str(deg))
-            self.concentrations[mol] = max(conc - deg, 0.0)
-        logger.debug(str(self.concentrations))
-        del old
+        if debug:
+            logger.debug("%s", self.concentrations)
+        self.concentrations.degrade()
+        if debug:
+            logger.debug("%s", self.concentrations)
+        if probe is not None:
+            probe.stop("degradation", start)
+
+    def compile(self, stochastic=False, rng=None):
+        """
+        Freezes the initialised sequence into a
+        `regpy.model.compiled.CompiledSequence` that can be stepped much
+        faster than `next`.
+
+        Parameters
+        ----------
+        stochastic: bool (optional)
+            Return a `regpy.model.stochastic.StochasticSequence` instead that
+            draws binding, transcription and degradation events at random.
+        rng: numpy.random.RandomState (optional)
+            Source of random numbers of the stochastic mode.
+        """
+        if stochastic:
+            from .stochastic import StochasticSequence
+            return StochasticSequence(self, rng)
+        from .compiled import CompiledSequence
+        return CompiledSequence(self)
 
     def introduce_polymerase(self):
         """
-        In this function and in 'next', there is no collision check between
-        polymerases yet.
+        Places a new polymerase at the beginning of the sequence if the first
+        site is free. Polymerases never share an element, in `next` one only
+        moves on if the element ahead of it is free or vacated in the same
+        step. For many polymerases at once see
+        `regpy.model.compiled.CompiledSequence.introduce_polymerases`.
         """
         if not self:
             return False
@@ -449,14 +997,17 @@ class Sequence(list):
 
     def reset(self):
         self.polymerases = dict()
-        self.concentrations = dict()
+        self.concentrations = Concentrations()
         for site in self:
             site.reset()
 
 
 def network2trn(network):
     """
+    Requires networkx, for large networks given as edge arrays or adjacency
+    matrices see `regpy.model.ingest` instead.
     """
+    import networkx as nx
     trn = nx.DiGraph(name="TRN")
     mapping = dict()
     for node in network:
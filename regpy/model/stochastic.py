@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+====================
+Stochastic Sequences
+====================
+
+:Date:
+    2026-10-18
+:File:
+    stochastic.py
+"""
+
+
+import copy
+import logging
+import numpy
+
+from .misc import NullHandler, ModelParameters
+from .compiled import CompiledSequence
+from .streams import RandomStream
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+parameters = ModelParameters()
+
+
+class StochasticSequence(CompiledSequence):
+    """
+    Compiled sequence with stochastic binding, transcription and degradation.
+
+    Per step every random event is drawn in one vectorised call per phase:
+
+    * A bound TF site is released with the dissociation probability of its
+      ligand, an unbound one binds with probability factor times
+      concentration.
+    * A bound polymerase is released with the polymerase dissociation
+      probability and transcribes otherwise. An unbound polymerase on an
+      active gene binds with the polymerase association probability, all
+      others try to move on.
+    * Each product loses a binomially distributed number of molecules, see
+      `BaseProduct.degrade`.
+    """
+
+    deterministic = False
+
+    def __init__(self, sequence, rng=None, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        sequence: Sequence
+            A fully initialised sequence.
+        rng: numpy.random.RandomState (optional)
+            Source of random numbers, the generator of the model parameters
+            by default.
+
+        Further arguments are passed on to `CompiledSequence`.
+        """
+        CompiledSequence.__init__(self, sequence, *args, **kw_args)
+        self.rng = parameters.rng if rng is None else rng
+        self.dissociation = numpy.zeros(len(self.concentrations), dtype=float)
+        for (i, product) in enumerate(self.products):
+            self.dissociation[i] = getattr(product, "dissociation_constant", 0.0)
+        self.rnap_association = parameters.mobile.rnap.association()
+        self.rnap_dissociation = parameters.mobile.rnap.dissociation()
+
+    def _bind_transcription_factors(self):
+        conc = self.concentrations[self.promoters.ligand]
+        draw = self.rng.random_sample(len(self.tf_bound))
+        release = draw < self.dissociation[self.promoters.ligand]
+        attach = (conc > 0.0) & (draw < self.promoters.occupancy(self.concentrations))
+        self.tf_bound = numpy.where(self.tf_bound, ~release, attach)
+
+    def _transport(self):
+        pool = self.polymerases
+        pool.discard(len(self))
+        if len(pool) == 0:
+            return
+        pos = pool.position
+        bound = pool.bound
+        draw = self.rng.random_sample(len(pool))
+        # bound polymerases are released or transcribe
+        release = bound & (draw < self.rnap_dissociation)
+        express = bound & ~release
+        genes = self.gene_of_site[pos[express]]
+        products = self.gene_product[genes]
+        numpy.add.at(self.concentrations, products,
+                self.gene_rate[genes] * self.gene_access[genes])
+        self._present[products] = True
+        # unbound polymerases on active genes may bind
+        on_gene = ~bound & (self.gene_of_site[pos] >= 0)
+        binds = numpy.zeros(len(pool), dtype=bool)
+        binds[on_gene] = self._activate(self.gene_of_site[pos[on_gene]]) &\
+                (draw[on_gene] < self.rnap_association)
+        moves = pool.move(~bound & ~binds, self.occupied)
+        pool.bound = express | binds
+        if self.probe is not None:
+            self._count_events(express, binds, moves, pos)
+
+    def _degrade(self):
+        conc = self.concentrations
+        molecules = numpy.floor(conc).astype(numpy.int64)
+        conc -= self.rng.binomial(molecules, self.degradation)
+        numpy.maximum(conc, 0.0, conc)
+        conc[-1] = 0.0
+        self._present[-1] = False
+
+    def _quiet_steps(self, limit):
+        # every step involves random events
+        return 0
+
+    def ensemble(self, replicates):
+        """
+        Not available for stochastic models, an `EnsembleSequence` would
+        advance the replicates deterministically. Use `fork` to obtain
+        independent replicates instead.
+        """
+        raise ValueError("stochastic models cannot be stepped as an ensemble,"\
+                " fork them instead")
+
+    def fork(self, rng=None):
+        """
+        Returns a copy of the model like `CompiledSequence.fork` that draws
+        from its own generator.
+
+        Parameters
+        ----------
+        rng: numpy.random.RandomState (optional)
+            Source of random numbers of the fork, by default a copy of this
+            model's generator in its current state, so that the runs of the
+            model and the fork do not advance each other's draws.
+        """
+        clone = CompiledSequence.fork(self)
+        if rng is None:
+            if isinstance(self.rng, (RandomStream, numpy.random.RandomState)):
+                rng = copy.deepcopy(self.rng)
+            else:
+                # the global generator of numpy.random
+                rng = numpy.random.RandomState()
+                rng.set_state(self.rng.get_state())
+        clone.rng = rng
+        return clone
+
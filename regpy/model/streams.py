@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Random Streams
+==============
+
+:Date:
+    2026-10-18
+:File:
+    streams.py
+
+Every simulation should draw from its own generator rather than the global
+numpy state. A `RandomStream` is identified by a root seed and a path of
+integer keys, children spawned from it extend the path. The Mersenne Twister
+state of each stream is initialised from a SHA-256 digest of seed and path,
+so streams are independent of each other, of the order in which they are
+created and of the process they are used in.
+
+    >>> root = RandomStream(42)
+    >>> streams = root.spawn(8)  # one per replicate or worker
+    >>> parameters.use_rng(streams[0])
+"""
+
+
+import hashlib
+import logging
+import numpy
+
+from .misc import NullHandler
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+def derive_seed(seed, key):
+    """
+    Turns a root seed and a path of keys into a seed array for
+    `numpy.random.RandomState`.
+    """
+    text = u"%d:%s" % (seed, u".".join(u"%d" % k for k in key))
+    digest = hashlib.sha256(text.encode("ascii")).digest()
+    return numpy.frombuffer(digest, dtype=numpy.uint32).copy()
+
+
+class RandomStream(object):
+    """
+    A generator with spawnable independent child streams.
+
+    Scalar uniform draws, the kind that is made one at a time all over the
+    model, are served from a block of pre-generated numbers which is refilled
+    in one vectorised call when it runs out. Exponential scalars are derived
+    from the same block. All other draws pass through to the underlying
+    `numpy.random.RandomState`.
+
+    Notes
+    -----
+    The state returned by `get_state` includes the numbers buffered but not
+    yet consumed, so that restoring it continues with the same draws.
+    """
+
+    def __init__(self, seed=None, key=(), buffer=4096, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        seed: int (optional)
+            Root seed, by default one is drawn from the operating system's
+            entropy.
+        key: tuple (optional)
+            Path of this stream below the root.
+        buffer: int (optional)
+            Number of uniform numbers drawn per block.
+        """
+        object.__init__(self)
+        if seed is None:
+            seed = int(numpy.random.RandomState().randint(numpy.iinfo(
+                    numpy.int32).max))
+        self.seed = int(seed)
+        self.key = tuple(int(k) for k in key)
+        self.buffer = max(int(buffer), 1)
+        self.state = numpy.random.RandomState(derive_seed(self.seed, self.key))
+        self._children = 0
+        self._block = numpy.zeros(0, dtype=float)
+        self._pos = 0
+
+    def __repr__(self):
+        return u"%s(%d, %r)" % (self.__class__.__name__, self.seed, self.key)
+
+    def spawn(self, num):
+        """
+        Returns `num` new independent child streams. Repeated calls continue
+        to return new children.
+        """
+        start = self._children
+        self._children += int(num)
+        return [RandomStream(self.seed, self.key + (i,), self.buffer)\
+                for i in range(start, self._children)]
+
+    def _refill(self):
+        self._block = self.state.random_sample(self.buffer)
+        self._pos = 0
+
+    def random_sample(self, size=None):
+        """
+        Uniform numbers in [0, 1), a scalar comes from the buffer.
+        """
+        if size is not None:
+            return self.state.random_sample(size)
+        if self._pos == len(self._block):
+            self._refill()
+        value = self._block[self._pos]
+        self._pos += 1
+        return value
+
+    def exponential(self, scale=1.0, size=None):
+        if size is not None:
+            return self.state.exponential(scale, size)
+        return -scale * numpy.log1p(-self.random_sample())
+
+    def random_integers(self, low, high=None, size=None):
+        if high is None:
+            (low, high) = (1, low)
+        return self.state.randint(low, high + 1, size)
+
+    def randint(self, low, high=None, size=None):
+        return self.state.randint(low, high, size)
+
+    def binomial(self, n, p, size=None):
+        return self.state.binomial(n, p, size)
+
+    def get_state(self):
+        """
+        The state of the underlying generator as returned by
+        `numpy.random.RandomState.get_state` followed by the buffered block
+        and the position of the next number in it.
+        """
+        return self.state.get_state() + (self._block.copy(), self._pos)
+
+    def set_state(self, state):
+        """
+        Restores a state from `get_state`. A plain `RandomState` state
+        discards the buffered numbers.
+        """
+        self.state.set_state(tuple(state[:5]))
+        if len(state) > 5:
+            self._block = numpy.array(state[5], dtype=float)
+            self._pos = int(state[6])
+        else:
+            self._block = numpy.zeros(0, dtype=float)
+            self._pos = 0
+
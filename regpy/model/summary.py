@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==================
+Summary Statistics
+==================
+
+:Date:
+    2026-10-18
+:File:
+    summary.py
+
+Streaming statistics of a running sequence in constant memory, for runs too
+long to keep their trajectory. Per product the mean, variance, minimum,
+maximum and number of samples above a threshold of the concentration are
+kept, per gene the fraction of samples in which it was active.
+
+Summaries of replicates that ran separately, e.g., in different processes,
+are combined with `merge`:
+
+    >>> total = merge_summaries([load_summary(path) for path in paths])
+"""
+
+
+import logging
+import numpy
+
+from .misc import NullHandler
+from .recorder import (BaseRecorder, CompiledSource, SequenceSource,
+        record_dtype)
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+class OnlineStatistics(object):
+    """
+    Running mean, variance, extremes and threshold counts of a vector of
+    values, updated with Welford's algorithm.
+
+    Two accumulators over the same columns merge into the statistics of all
+    their samples together (Chan et al.'s pairwise update), so the order in
+    which replicates are combined does not matter up to rounding.
+    """
+
+    def __init__(self, size, threshold=0.0, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        size: int
+            Number of columns.
+        threshold: float or numpy.ndarray (optional)
+            Samples strictly above it are counted, per column if an array.
+        """
+        object.__init__(self)
+        self.size = int(size)
+        self.threshold = numpy.zeros(self.size, dtype=float)
+        self.threshold[:] = threshold
+        self.count = 0
+        self.mean = numpy.zeros(self.size, dtype=float)
+        self.m2 = numpy.zeros(self.size, dtype=float)
+        self.minimum = numpy.empty(self.size, dtype=float)
+        self.minimum.fill(numpy.inf)
+        self.maximum = numpy.empty(self.size, dtype=float)
+        self.maximum.fill(-numpy.inf)
+        self.above = numpy.zeros(self.size, dtype=numpy.int64)
+        # scratch space of `update`
+        self._delta = numpy.zeros(self.size, dtype=float)
+        self._work = numpy.zeros(self.size, dtype=float)
+        self._flag = numpy.zeros(self.size, dtype=bool)
+
+    def __len__(self):
+        """
+        Number of columns.
+        """
+        return self.size
+
+    def update(self, values):
+        """
+        Adds one sample of all columns.
+        """
+        self.count += 1
+        delta = numpy.subtract(values, self.mean, out=self._delta)
+        work = numpy.divide(delta, self.count, out=self._work)
+        self.mean += work
+        numpy.subtract(values, self.mean, out=work)
+        work *= delta
+        self.m2 += work
+        numpy.minimum(self.minimum, values, out=self.minimum)
+        numpy.maximum(self.maximum, values, out=self.maximum)
+        self.above += numpy.greater(values, self.threshold, out=self._flag)
+
+    def merge(self, other):
+        """
+        Adds the samples summarised by another accumulator over the same
+        columns and threshold.
+        """
+        if other.size != self.size:
+            raise ValueError("cannot merge statistics of %d and %d columns" %\
+                    (self.size, other.size))
+        if not numpy.array_equal(other.threshold, self.threshold):
+            raise ValueError("cannot merge statistics of different thresholds")
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * (float(other.count) / total)
+        self.m2 += other.m2 + delta * delta * (float(self.count) *\
+                other.count / total)
+        self.count = total
+        numpy.minimum(self.minimum, other.minimum, out=self.minimum)
+        numpy.maximum(self.maximum, other.maximum, out=self.maximum)
+        self.above += other.above
+        return self
+
+    def variance(self, ddof=0):
+        """
+        Variance of every column, `nan` with too few samples.
+        """
+        if self.count - ddof <= 0:
+            return numpy.repeat(numpy.nan, self.size)
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        return numpy.sqrt(self.variance(ddof))
+
+    def fraction_above(self):
+        """
+        Fraction of the samples above the threshold in every column.
+        """
+        if self.count == 0:
+            return numpy.repeat(numpy.nan, self.size)
+        return self.above / float(self.count)
+
+    def to_arrays(self, prefix=u""):
+        """
+        The state of the accumulator as a dictionary of arrays.
+        """
+        return {
+            prefix + u"count": numpy.array(self.count, dtype=numpy.int64),
+            prefix + u"threshold": self.threshold,
+            prefix + u"mean": self.mean,
+            prefix + u"m2": self.m2,
+            prefix + u"minimum": self.minimum,
+            prefix + u"maximum": self.maximum,
+            prefix + u"above": self.above
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix=u""):
+        """
+        Restores an accumulator from the output of `to_arrays`.
+        """
+        stats = cls(len(arrays[prefix + u"mean"]), arrays[prefix + u"threshold"])
+        stats.count = int(arrays[prefix + u"count"])
+        stats.mean[:] = arrays[prefix + u"mean"]
+        stats.m2[:] = arrays[prefix + u"m2"]
+        stats.minimum[:] = arrays[prefix + u"minimum"]
+        stats.maximum[:] = arrays[prefix + u"maximum"]
+        stats.above[:] = arrays[prefix + u"above"]
+        return stats
+
+
+class SummaryRecorder(BaseRecorder):
+    """
+    Accumulates summary statistics of a sequence's state every `every` steps
+    instead of storing the samples, see `regpy.model.recorder` for full
+    trajectories.
+
+    Attributes
+    ----------
+    concentrations: OnlineStatistics
+        Statistics of the product concentrations.
+    activity: OnlineStatistics
+        Statistics of the gene activity flags, the mean is the fraction of
+        samples in which a gene was active.
+    """
+
+    def __init__(self, target, every=1, threshold=0.0, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        target: Sequence or CompiledSequence
+            The model to observe. Products and genes are fixed when the
+            recorder is attached.
+        every: int (optional)
+            Sampling interval in steps.
+        threshold: float or numpy.ndarray (optional)
+            Concentration above which a product counts as abundant, per
+            product if an array.
+        """
+        object.__init__(self)
+        if target is None:
+            self.source = None
+        elif hasattr(target, "products"):
+            self.source = CompiledSource(target)
+        else:
+            self.source = SequenceSource(target)
+        self.every = int(every)
+        self.step = 0
+        if self.source is not None:
+            self.products = self.source.products
+            self.genes = self.source.genes
+            self._record = numpy.zeros((), dtype=record_dtype(
+                    len(self.products), len(self.genes),
+                    len(self.source.sites)))
+            self.concentrations = OnlineStatistics(len(self.products),
+                    threshold)
+            self.activity = OnlineStatistics(len(self.genes), 0.5)
+
+    def sample(self):
+        """
+        Adds the current state regardless of the sampling interval.
+        """
+        record = self._record
+        self.source.fill(record)
+        self.concentrations.update(record["concentrations"])
+        self.activity.update(record["active"])
+
+    def merge(self, other):
+        """
+        Adds the statistics of another recorder of the same model, e.g., of
+        a replicate.
+        """
+        if other.products != self.products or other.genes != self.genes:
+            raise ValueError("cannot merge summaries of different models")
+        self.concentrations.merge(other.concentrations)
+        self.activity.merge(other.activity)
+        self.step += other.step
+        return self
+
+    def save(self, path):
+        """
+        Stores the statistics in a numpy `.npz` archive.
+        """
+        arrays = dict()
+        arrays.update(self.concentrations.to_arrays(u"conc_"))
+        arrays.update(self.activity.to_arrays(u"active_"))
+        numpy.savez(path, products=numpy.array(self.products, dtype=unicode),
+                genes=numpy.array(self.genes, dtype=unicode),
+                every=self.every, step=self.step, **arrays)
+
+
+def load_summary(path):
+    """
+    Reads statistics stored by `SummaryRecorder.save`. The result can be
+    merged with others but not sample a model.
+    """
+    with numpy.load(path) as archive:
+        arrays = dict((key, archive[key]) for key in archive.files)
+    summary = SummaryRecorder(None, int(arrays["every"]))
+    summary.step = int(arrays["step"])
+    summary.products = [unicode(name) for name in arrays["products"]]
+    summary.genes = [unicode(name) for name in arrays["genes"]]
+    summary.concentrations = OnlineStatistics.from_arrays(arrays, u"conc_")
+    summary.activity = OnlineStatistics.from_arrays(arrays, u"active_")
+    return summary
+
+
+def merge_summaries(summaries):
+    """
+    Combines the statistics of several recorders into a new one.
+    """
+    summaries = list(summaries)
+    if not summaries:
+        raise ValueError("no summaries to merge")
+    first = summaries[0]
+    total = SummaryRecorder(None, first.every)
+    total.products = first.products
+    total.genes = first.genes
+    total.concentrations = OnlineStatistics(len(first.products),
+            first.concentrations.threshold)
+    total.activity = OnlineStatistics(len(first.genes),
+            first.activity.threshold)
+    for summary in summaries:
+        total.merge(summary)
+    return total
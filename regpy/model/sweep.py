@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Parameter Sweeps
+================
+
+:Date:
+    2026-10-18
+:File:
+    sweep.py
+
+Runs one network under many parameter settings in a pool of processes.
+Parameters are addressed by their dotted path below `ModelParameters`, e.g.,
+"mobile.tf.association" or "sequence.tf.threshold".
+"""
+
+
+import itertools
+import logging
+import numpy
+
+from .misc import NullHandler, ModelParameters, map_tasks
+from .sequence import Sequence, network2trn
+from .registry import Registry
+from .streams import RandomStream
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(NullHandler())
+
+
+parameters = ModelParameters()
+
+
+class Constant(object):
+    """
+    A picklable replacement for the constant lambdas of the parameter
+    managers.
+    """
+
+    def __init__(self, value, *args, **kw_args):
+        object.__init__(self)
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def __repr__(self):
+        return u"%s(%r)" % (self.__class__.__name__, self.value)
+
+
+def parameter_grid(axes):
+    """
+    Full factorial design over the given parameter values.
+
+    Parameters
+    ----------
+    axes: dict
+        Maps parameter paths to sequences of values.
+
+    Returns
+    -------
+    A list of dictionaries mapping parameter paths to values.
+    """
+    names = sorted(axes)
+    return [dict(zip(names, values)) for values in\
+            itertools.product(*[axes[name] for name in names])]
+
+
+def latin_hypercube(bounds, num, seed=None):
+    """
+    Latin hypercube sample of `num` points within the given bounds.
+
+    Parameters
+    ----------
+    bounds: dict
+        Maps parameter paths to (lower, upper) tuples.
+    num: int
+        Number of design points.
+    seed: int (optional)
+        Seed for the design's random number generator.
+
+    Returns
+    -------
+    A list of dictionaries mapping parameter paths to values.
+    """
+    rng = numpy.random.RandomState(seed)
+    names = sorted(bounds)
+    points = [dict() for i in range(num)]
+    for name in names:
+        (lower, upper) = bounds[name]
+        strata = (rng.permutation(num) + rng.random_sample(num)) / float(num)
+        for (point, value) in zip(points, lower + strata * (upper - lower)):
+            point[name] = float(value)
+    return points
+
+
+def _resolve(path):
+    """
+    Returns the manager and attribute name a parameter path points to.
+    """
+    names = path.split(u".")
+    manager = parameters
+    for name in names[:-1]:
+        manager = getattr(manager, name)
+    if not hasattr(manager, names[-1]):
+        raise AttributeError("unknown model parameter '%s'" % path)
+    return (manager, names[-1])
+
+
+def apply_parameters(point):
+    """
+    Sets the model parameters of a design point. Parameters that are
+    functions in the managers are replaced by a `Constant` of the value.
+
+    Returns
+    -------
+    The previous values so that they can be restored with
+    `restore_parameters`.
+    """
+    previous = dict()
+    for (path, value) in point.iteritems():
+        (manager, name) = _resolve(path)
+        previous[path] = getattr(manager, name)
+        if callable(previous[path]) and not callable(value):
+            value = Constant(value)
+        setattr(manager, name, value)
+    return previous
+
+
+def restore_parameters(previous):
+    """
+    Resets the model parameters to the values returned by `apply_parameters`.
+    """
+    for (path, value) in previous.iteritems():
+        (manager, name) = _resolve(path)
+        setattr(manager, name, value)
+
+
+def build_sequence(network):
+    """
+    Default construction of an initialised sequence from a network.
+    """
+    trn = network2trn(network)
+    seq = Sequence()
+    seq.linearise_trn(trn)
+    seq.initialise_promoters(seq)
+    seq.initialise()
+    return seq
+
+
+def summarise(compiled):
+    """
+    Default measurement at the end of a run: the concentration of each gene's
+    product (zero for genes without one), the activity and the rate of all
+    genes in sequence order.
+    """
+    return {
+        "concentrations": compiled.concentrations[compiled.gene_product].copy(),
+        "active": compiled.gene_active.copy(),
+        "rate": compiled.gene_rate.copy()
+    }
+
+
+def run_point(network, point, seed, steps, introduction=1.0, build=build_sequence,
+        measure=summarise):
+    """
+    Builds and runs the model for one design point in the current process.
+
+    Parameters
+    ----------
+    network: networkx.DiGraph
+        Regulatory network the sequence is built from.
+    point: dict
+        Parameter paths and their values.
+    seed: int or RandomStream
+        The random stream the model draws from during the run, or a seed
+        for a new one.
+    steps: int
+        Number of simulation steps.
+    introduction: float (optional)
+        Probability per step of trying to place a new polymerase.
+    build: callable (optional)
+        Turns the network into an initialised `Sequence`.
+    measure: callable (optional)
+        Extracts the result from the `CompiledSequence` after the run.
+    """
+    if not isinstance(seed, RandomStream):
+        seed = RandomStream(seed)
+    previous = apply_parameters(point)
+    previous_rng = parameters.use_rng(seed)
+    try:
+        # a fresh registry per point keeps long-lived workers from
+        # accumulating the elements of every model they have built
+        with Registry():
+            engine = build(network).compile()
+        for i in range(steps):
+            if parameters.rnd_float() < introduction:
+                engine.introduce_polymerase()
+            engine.next()
+        return measure(engine)
+    finally:
+        parameters.use_rng(previous_rng)
+        restore_parameters(previous)
+
+
+def _run_task(task, network, options):
+    (point, seed) = task
+    return run_point(network, point, seed, **options)
+
+
+class ParameterSweep(object):
+    """
+    Runs a network for every point of a parameter design in a process pool.
+
+    Each point receives its own child of the sweep's random stream up front
+    so that results do not depend on the number of processes or on how
+    points are distributed among them. Results are returned in the order of
+    the design.
+    """
+
+    def __init__(self, network, points, steps, seed=None, introduction=1.0,
+            build=build_sequence, measure=summarise, *args, **kw_args):
+        """
+        Parameters
+        ----------
+        network: networkx.DiGraph
+            Regulatory network the sequences are built from.
+        points: list
+            Design points as returned by `parameter_grid` or
+            `latin_hypercube`.
+        steps: int
+            Number of simulation steps per point.
+        seed: int (optional)
+            Master seed of the sweep.
+        introduction: float (optional)
+            Probability per step of trying to place a new polymerase.
+        build: callable (optional)
+            Module level function turning the network into an initialised
+            `Sequence`.
+        measure: callable (optional)
+            Module level function extracting a result from the
+            `CompiledSequence` after a run.
+        """
+        object.__init__(self)
+        self.network = network
+        self.points = list(points)
+        self.seed = RandomStream(seed).seed
+        self.options = {
+            "steps": int(steps),
+            "introduction": introduction,
+            "build": build,
+            "measure": measure
+        }
+
+    def __len__(self):
+        return len(self.points)
+
+    def run(self, processes=None, chunksize=None):
+        """
+        Parameters
+        ----------
+        processes: int (optional)
+            Number of worker processes, all available cores by default. With
+            a single process the points are run in the current process.
+        chunksize: int (optional)
+            Number of points sent to a worker at a time, by default the
+            points are split into about four chunks per worker.
+
+        Returns
+        -------
+        A list with one result per design point.
+        """
+        tasks = list(zip(self.points,
+                RandomStream(self.seed).spawn(len(self.points))))
+        return map_tasks(_run_task, tasks, (self.network, self.options),
+                processes, chunksize)
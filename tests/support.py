@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=============
+Test Fixtures
+=============
+
+:Date:
+    2026-10-18
+:File:
+    support.py
+
+Small random models and helpers to drive and compare them, shared by the
+regression tests.
+"""
+
+
+import numpy
+
+from regpy.model.misc import ModelParameters
+from regpy.model.sequence import GeneSite, EmptySite, NAPBindingSite
+from regpy.model.mobile import NucleoidAssociatedProtein
+from regpy.model.ingest import edges2sequence
+
+
+parameters = ModelParameters()
+
+
+class ParameterTestMixin(object):
+    """
+    Sets the model parameters the fixtures rely on and restores the previous
+    values after each test.
+    """
+
+    def setUp(self):
+        self._previous = (parameters.sequence.tf.threshold,
+                parameters.mobile.tf.diffusion, parameters.sequence.nap.mean)
+        parameters.sequence.tf.threshold = 0.5
+        parameters.mobile.tf.diffusion = lambda : 3000.0
+        parameters.sequence.nap.mean = 0
+
+    def tearDown(self):
+        (parameters.sequence.tf.threshold, parameters.mobile.tf.diffusion,
+                parameters.sequence.nap.mean) = self._previous
+
+
+def random_sequence(num_genes, num_edges, seed, degradation=0.05,
+        spacers=0):
+    """
+    Builds an initialised sequence of a random regulatory network.
+
+    Parameters
+    ----------
+    num_genes: int
+        Number of genes.
+    num_edges: int
+        Number of regulatory interactions.
+    seed: int
+        Seed of the network, the binding factors and the spacers.
+    degradation: float (optional)
+        Degradation constant of all products.
+    spacers: int (optional)
+        Number of empty and NAP binding sites scattered over the sequence.
+    """
+    rng = numpy.random.RandomState(seed)
+    seq = edges2sequence(rng.randint(num_genes, size=num_edges),
+            rng.randint(num_genes, size=num_edges),
+            rng.choice([-1, 1], size=num_edges), num_genes)
+    nap = NucleoidAssociatedProtein()
+    nap.location = 0
+    for i in range(spacers):
+        site = EmptySite() if rng.random_sample() < 0.5 else\
+                NAPBindingSite(ligand=nap, regulation=1)
+        seq.insert(rng.randint(len(seq) + 1), site)
+    for (i, site) in enumerate(seq):
+        if isinstance(site, GeneSite) and site.product is not None:
+            site.product.location = i
+            site.product.degradation_constant = degradation
+    seq.initialise()
+    for site in seq:
+        if isinstance(site, GeneSite):
+            for tf_site in site.promoters:
+                tf_site.factor = rng.random_sample() * 2.0
+    seq.compile_promoters()
+    return seq
+
+
+def gene_products(seq):
+    return [site.product for site in seq if isinstance(site, GeneSite) and\
+            site.product is not None]
+
+
+def feed(model, amount):
+    """
+    Adds to the concentration of every gene product of a `Sequence` or of
+    every product of a compiled model.
+    """
+    if hasattr(model, "products"):
+        model.concentrations[..., :-1] += amount
+        model._present[..., :-1] = True
+    else:
+        for product in gene_products(model):
+            model.concentrations[product] = model.concentrations.get(product,
+                    0.0) + amount
+
+
+def state(seq):
+    """
+    The complete state of a `Sequence` in a comparable form.
+    """
+    genes = [site for site in seq if isinstance(site, GeneSite)]
+    return {
+        "concentrations": [seq.concentrations.get(product, -1.0)\
+                for product in gene_products(seq)],
+        "occupied": [site.occupied for site in seq],
+        "tf_bound": [tf_site.bound for gene in genes\
+                for tf_site in gene.promoters],
+        "genes": [(gene.rate, gene._active) for gene in genes],
+        "polymerases": sorted((pos, rnap.bound, rnap.was_bound)\
+                for (rnap, pos) in seq.polymerases.iteritems())
+    }
+
+
+def compiled_state(compiled):
+    """
+    The state of a `CompiledSequence` as arrays.
+    """
+    pool = compiled.polymerases
+    inside = pool.position < len(compiled)
+    return {
+        "concentrations": compiled.concentrations,
+        "tf_bound": compiled.tf_bound,
+        "gene_rate": compiled.gene_rate,
+        "gene_active": compiled.gene_active,
+        "occupied": compiled.occupied,
+        "position": pool.position[inside],
+        "bound": pool.bound[inside],
+        "was_bound": pool.was_bound[inside]
+    }
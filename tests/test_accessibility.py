@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===================
+Accessibility Tests
+===================
+
+:Date:
+    2026-10-18
+:File:
+    test_accessibility.py
+
+With a non-zero effect bound NAPs change the transcription rates of genes in
+their window. Both engines must agree on this and the NAP layout must follow
+edits of the sequence.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.misc import ModelParameters
+from regpy.model.registry import Registry
+from regpy.model.sequence import GeneSite, EmptySite, NAPBindingSite
+
+from support import ParameterTestMixin, random_sequence, feed, state
+
+
+parameters = ModelParameters()
+
+
+def build(seed):
+    """
+    A sequence with NAP sites of random factors, the same for equal seeds.
+    """
+    previous = parameters.use_rng(numpy.random.RandomState(seed))
+    try:
+        with Registry():
+            seq = random_sequence(30, 60, seed=seed, spacers=40)
+    finally:
+        parameters.use_rng(previous)
+    rng = numpy.random.RandomState(seed)
+    for site in seq:
+        if isinstance(site, NAPBindingSite):
+            site.factor = rng.random_sample()
+    seq.compile_promoters()
+    return seq
+
+
+def nap_ligands(seq):
+    return list(set(site.ligand for site in seq\
+            if isinstance(site, NAPBindingSite)))
+
+
+def brute_levels(seq, window):
+    """
+    Summed regulation of the bound NAP sites around every gene.
+    """
+    coordinates = numpy.cumsum([0] + [len(site) for site in seq])
+    genes = [coordinates[i] for (i, site) in enumerate(seq)\
+            if isinstance(site, GeneSite)]
+    naps = [(coordinates[i], site.regulation) for (i, site) in enumerate(seq)\
+            if isinstance(site, NAPBindingSite) and site.bound]
+    return [sum(regulation for (position, regulation) in naps\
+            if abs(position - gene) <= window) for gene in genes]
+
+
+def layout_table(layout):
+    return (sorted(zip(layout.position.tolist(), layout.factor.tolist(),
+            layout.regulation.tolist())), layout.gene_position.tolist(),
+            layout.lower.tolist(), layout.upper.tolist())
+
+
+class AccessibilityTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        self._nap = (parameters.sequence.nap.effect,
+                parameters.sequence.nap.window)
+        parameters.sequence.nap.effect = 0.4
+        parameters.sequence.nap.window = 3000
+
+    def tearDown(self):
+        (parameters.sequence.nap.effect, parameters.sequence.nap.window) =\
+                self._nap
+        ParameterTestMixin.tearDown(self)
+
+    def test_effect_in_both_engines(self):
+        reference = build(58)
+        other = build(58)
+        compiled = other.compile()
+        ligands = nap_ligands(reference)
+        self.assertEqual(len(ligands), 1)
+        slot = compiled.products.index(nap_ligands(other)[0])
+        rng = numpy.random.RandomState(59)
+        levels = set()
+        for step in range(300):
+            if rng.random_sample() < 0.6:
+                reference.introduce_polymerase()
+                compiled.introduce_polymerase()
+            if step % 25 == 0:
+                feed(reference, 8.0)
+                feed(compiled, 8.0)
+                amount = rng.random_sample() * 2.0
+                reference.concentrations[ligands[0]] = amount
+                compiled.concentrations[slot] = amount
+                compiled._present[slot] = True
+            reference.next()
+            compiled.next()
+            compiled.write_back()
+            expected = brute_levels(reference, 3000)
+            self.assertEqual(reference.nap_layout.levels(
+                    reference.nap_bound).tolist(), expected)
+            self.assertEqual(state(reference), state(other), step)
+            levels.update(expected)
+        self.assertTrue(len(levels) > 2)
+
+    def test_layout_follows_edits(self):
+        seq = build(60)
+        rng = numpy.random.RandomState(61)
+        nap = nap_ligands(seq)[0]
+        for step in range(60):
+            operation = rng.randint(3)
+            if operation == 0:
+                site = EmptySite() if rng.random_sample() < 0.5 else\
+                        NAPBindingSite(ligand=nap, regulation=-2)
+                seq.insert_sites(rng.randint(len(seq) + 1), [site])
+            elif operation == 1:
+                seq.delete_sites(rng.randint(len(seq)))
+            else:
+                seq.move_sites(rng.randint(len(seq) - 2), 2,
+                        rng.randint(len(seq) - 1))
+            self.assertEqual(seq.nap_layout.factor.tolist(),
+                    [site.factor for site in seq._nap_sites])
+            # moved sites keep their column rather than their order
+            edited = layout_table(seq.nap_layout)
+            seq.compile_naps()
+            self.assertEqual(edited, layout_table(seq.nap_layout),
+                    "layout differs after edit %d" % step)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===============
+Attractor Tests
+===============
+
+:Date:
+    2026-10-18
+:File:
+    test_attractor.py
+"""
+
+
+import unittest
+
+from regpy.model.registry import Registry
+from regpy.model.streams import RandomStream
+from regpy.model.attractor import find_attractor, fingerprint
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+class Drive(object):
+
+    def __init__(self, compiled, period, *args, **kw_args):
+        object.__init__(self)
+        self.compiled = compiled
+        self.period = period
+
+    def __call__(self, step):
+        if step % self.period == 0:
+            self.compiled.introduce_polymerase()
+
+
+class AttractorTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        with Registry():
+            self.sequence = random_sequence(20, 40, seed=37)
+
+    def test_cycle(self):
+        found = self.sequence.compile()
+        brute = self.sequence.compile()
+        for model in (found, brute):
+            feed(model, 3.0)
+        result = find_attractor(found, 5000, Drive(found, 4), period=4)
+        self.assertTrue(result.found)
+        self.assertEqual(len(result.states), result.period)
+        self.assertEqual(result.period % 4, 0)
+        drive = Drive(brute, 4)
+        keys = list()
+        for step in range(result.transient + 2 * result.period + 1):
+            keys.append(fingerprint(brute, step % 4))
+            drive(step)
+            brute.next()
+        self.assertEqual(keys[result.transient],
+                keys[result.transient + result.period])
+        self.assertEqual(keys[result.transient],
+                keys[result.transient + 2 * result.period])
+        # no earlier repetition
+        self.assertEqual(len(set(keys[:result.transient + result.period])),
+                result.transient + result.period)
+        self.assertEqual(fingerprint(found, result.transient % 4),
+                keys[result.transient])
+
+    def test_fixed_point(self):
+        result = find_attractor(self.sequence.compile(), 10)
+        self.assertTrue(result.fixed_point)
+        self.assertEqual((result.transient, result.steps), (0, 1))
+
+    def test_budget(self):
+        compiled = self.sequence.compile()
+        feed(compiled, 3.0)
+        result = find_attractor(compiled, 3, Drive(compiled, 4), period=4)
+        self.assertFalse(result.found)
+        self.assertEqual(result.steps, 3)
+        self.assertEqual(result.states, [])
+
+    def test_stochastic(self):
+        compiled = self.sequence.compile(stochastic=True, rng=RandomStream(38))
+        self.assertRaises(ValueError, find_attractor, compiled, 10)
+        self.assertRaises(ValueError, compiled.find_attractor, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
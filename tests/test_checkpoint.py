@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Checkpoint Tests
+================
+
+:Date:
+    2026-10-18
+:File:
+    test_checkpoint.py
+
+A restored checkpoint must continue exactly like the model it was taken of.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from regpy.model.misc import ModelParameters
+from regpy.model.registry import Registry
+from regpy.model.sequence import GeneSite
+from regpy.model.streams import RandomStream
+from regpy.model.checkpoint import save_checkpoint, load_checkpoint
+
+from support import ParameterTestMixin, random_sequence, feed, state
+
+
+parameters = ModelParameters()
+
+
+class CheckpointTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "checkpoint.npz")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        ParameterTestMixin.tearDown(self)
+
+    def drive(self, seq, rng, steps):
+        for step in range(steps):
+            if rng.random_sample() < 0.6:
+                seq.introduce_polymerase()
+            if step % 25 == 0:
+                feed(seq, 8.0)
+            seq.next()
+
+    def test_round_trip(self):
+        with Registry():
+            seq = random_sequence(30, 60, seed=11)
+            self.drive(seq, numpy.random.RandomState(12), 100)
+            rng = numpy.random.RandomState(13)
+            save_checkpoint(self.path, seq, rng)
+            expected = rng.random_sample(3)
+        restored = load_checkpoint(self.path, rng)
+        self.assertTrue(numpy.array_equal(rng.random_sample(3), expected))
+        self.assertEqual([site._name for site in restored],
+                [site._name for site in seq])
+        self.assertEqual(state(restored), state(seq))
+        for model in (seq, restored):
+            self.drive(model, numpy.random.RandomState(14), 200)
+        self.assertEqual(state(restored), state(seq))
+
+    def test_parameters_rng_untouched(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=39, spacers=20)
+            save_checkpoint(self.path, seq, numpy.random.RandomState(40))
+        previous = parameters.use_rng(numpy.random.RandomState(41))
+        try:
+            expected = parameters.rng.get_state()
+            load_checkpoint(self.path, numpy.random.RandomState(42))
+            state = parameters.rng.get_state()
+        finally:
+            parameters.use_rng(previous)
+        self.assertTrue(numpy.array_equal(state[1], expected[1]))
+        self.assertEqual(state[2:], expected[2:])
+
+    def test_existing_registry(self):
+        with Registry():
+            seq = random_sequence(10, 20, seed=43)
+            save_checkpoint(self.path, seq, numpy.random.RandomState(44))
+        registry = Registry()
+        first = load_checkpoint(self.path, numpy.random.RandomState(44),
+                registry)
+        second = load_checkpoint(self.path, numpy.random.RandomState(44),
+                registry)
+        self.assertTrue(all(a is b for (a, b) in zip(first, second)))
+        self.assertEqual(len(registry), len(registry.instances()))
+        with registry:
+            site = GeneSite()
+        self.assertEqual(site._index,
+                max(gene._index for gene in first if isinstance(gene,
+                GeneSite)) + 1)
+
+    def test_stream_round_trip(self):
+        with Registry():
+            seq = random_sequence(10, 20, seed=15)
+            stream = RandomStream(16, buffer=64)
+            for i in range(37):
+                stream.random_sample()
+            save_checkpoint(self.path, seq, stream)
+            expected = [stream.random_sample() for i in range(100)]
+        load_checkpoint(self.path, stream)
+        self.assertEqual([stream.random_sample() for i in range(100)],
+                expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=====================
+Compiled Engine Tests
+=====================
+
+:Date:
+    2026-10-18
+:File:
+    test_compiled.py
+
+The compiled engine must reproduce `Sequence.next` exactly.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+
+from support import (ParameterTestMixin, random_sequence, feed, state,
+        compiled_state)
+
+
+class CompiledSequenceTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_next_matches_sequence(self):
+        with Registry():
+            reference = random_sequence(30, 60, seed=1)
+            other = random_sequence(30, 60, seed=1)
+            compiled = other.compile()
+            rng = numpy.random.RandomState(3)
+            for step in range(300):
+                if rng.random_sample() < 0.6:
+                    self.assertEqual(reference.introduce_polymerase(),
+                            compiled.introduce_polymerase())
+                if step % 25 == 0:
+                    feed(reference, 8.0)
+                    feed(compiled, 8.0)
+                reference.next()
+                compiled.next()
+                compiled.write_back()
+                self.assertEqual(state(reference), state(other), step)
+
+    def test_advance_matches_next(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=2, degradation=0.01,
+                    spacers=40)
+            stepped = seq.compile()
+            skipped = seq.compile()
+            for block in range(40):
+                feed(stepped, 8.0)
+                feed(skipped, 8.0)
+                stepped.introduce_polymerase()
+                skipped.introduce_polymerase()
+                for i in range(17):
+                    stepped.next()
+                skipped.advance(17)
+                expected = compiled_state(stepped)
+                result = compiled_state(skipped)
+                for (name, value) in expected.iteritems():
+                    self.assertTrue(numpy.array_equal(value, result[name]),
+                            "%s differs after block %d" % (name, block))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===================
+Concentration Tests
+===================
+
+:Date:
+    2026-10-18
+:File:
+    test_concentrations.py
+"""
+
+
+import copy
+import math
+import unittest
+
+from regpy.model.registry import Registry
+from regpy.model.mobile import TranscriptionFactor
+from regpy.model.concentrations import Concentrations
+
+
+class ConcentrationsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = Registry()
+        with self.registry:
+            self.products = [TranscriptionFactor() for i in range(40)]
+        for (i, product) in enumerate(self.products):
+            product.degradation_constant = 0.01 * i
+
+    def test_mapping(self):
+        conc = Concentrations({self.products[0]: 1.0})
+        conc[self.products[1]] = 2.0
+        conc.add(self.products[2], 3.0)
+        conc.slot(self.products[3])
+        self.assertTrue(conc.has_key(self.products[1]))
+        self.assertFalse(conc.has_key(self.products[3]))
+        self.assertEqual(list(conc.iterkeys()), self.products[:3])
+        self.assertEqual(list(conc.itervalues()), [1.0, 2.0, 3.0])
+        self.assertEqual(conc.copy(), dict(zip(self.products[:3],
+                [1.0, 2.0, 3.0])))
+        del conc[self.products[1]]
+        self.assertEqual(len(conc), 2)
+        self.assertRaises(KeyError, conc.__getitem__, self.products[1])
+        self.assertEqual(conc.get(self.products[3], -1.0), -1.0)
+
+    def test_degrade(self):
+        conc = Concentrations(capacity=1)
+        expected = dict()
+        for (i, product) in enumerate(self.products):
+            conc[product] = expected[product] = 10.0 * i
+        for step in range(5):
+            conc.degrade()
+            for product in self.products:
+                value = expected[product]
+                expected[product] = max(value - math.ceil(
+                        product.degradation_constant * value), 0.0)
+            self.assertEqual(conc.copy(), expected)
+
+    def test_changed_constant(self):
+        product = self.products[0]
+        conc = Concentrations()
+        conc[product] = 10.0
+        product.degradation_constant = 0.5
+        conc.degrade()
+        self.assertEqual(conc[product], 5.0)
+        product.degradation_constant = 0.0
+        conc.degrade()
+        self.assertEqual(conc[product], 5.0)
+
+    def test_copy(self):
+        conc = Concentrations(dict((product, 20.0) for product in\
+                self.products[:5]))
+        shallow = copy.copy(conc)
+        shallow[self.products[0]] = 1.0
+        shallow[self.products[5]] = 2.0
+        shallow.degrade()
+        self.assertEqual(conc.copy(), dict((product, 20.0) for product in\
+                self.products[:5]))
+        self.assertEqual(len(shallow), 6)
+        self.assertEqual(shallow[self.products[4]], 20.0 - math.ceil(
+                self.products[4].degradation_constant * 20.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
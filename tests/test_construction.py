@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==================
+Construction Tests
+==================
+
+:Date:
+    2026-10-18
+:File:
+    test_construction.py
+
+Random numbers drawn in bulk while building a model must follow the same
+distributions as drawing them one at a time.
+"""
+
+
+import math
+import unittest
+
+import numpy
+
+from regpy.model.misc import ModelParameters, zero_truncated_binomial
+from regpy.model.registry import Registry
+from regpy.model.sequence import Sequence, GeneSite, NAPBindingSite
+from regpy.model.mobile import NucleoidAssociatedProtein
+from regpy.model.ingest import edges2sequence
+
+
+parameters = ModelParameters()
+
+
+def binomial_pmf(trials, prob):
+    return numpy.array([math.exp(math.lgamma(trials + 1) - math.lgamma(k + 1) -\
+            math.lgamma(trials - k + 1)) * prob ** k * (1.0 - prob) **\
+            (trials - k) for k in range(trials + 1)])
+
+
+class ConstructionTest(unittest.TestCase):
+
+    def setUp(self):
+        nap = parameters.sequence.nap
+        self._previous = (nap.mean, nap.num, nap.nums, nap.states)
+        self._rng = parameters.use_rng(numpy.random.RandomState(62))
+
+    def tearDown(self):
+        nap = parameters.sequence.nap
+        (nap.mean, nap.num, nap.nums, nap.states) = self._previous
+        parameters.use_rng(self._rng)
+
+    def assertFrequencies(self, values, expected, name):
+        """
+        Compares the relative frequency of every value 0, 1, ... with the
+        expected probabilities, allowing five standard errors.
+        """
+        num = len(values)
+        counts = numpy.bincount(values, minlength=len(expected))
+        self.assertEqual(len(counts), len(expected), name)
+        error = 5.0 * numpy.sqrt(expected * (1.0 - expected) / num) + 1e-12
+        frequencies = counts / float(num)
+        self.assertTrue((numpy.abs(frequencies - expected) <= error).all(),
+                "%s: %s instead of %s" % (name, frequencies, expected))
+
+    def test_zero_truncated_binomial(self):
+        for (trials, prob) in ((5, 0.3), (25, 0.08), (3, 0.9)):
+            draws = zero_truncated_binomial(trials, prob, 20000)
+            pmf = binomial_pmf(trials, prob)
+            pmf[0] = 0.0
+            self.assertFrequencies(draws, pmf / pmf.sum(), (trials, prob))
+        self.assertTrue((zero_truncated_binomial(4, 1.0, 10) == 4).all())
+        self.assertRaises(ValueError, zero_truncated_binomial, 0, 0.5, 1)
+        self.assertRaises(ValueError, zero_truncated_binomial, 4, 0.0, 1)
+
+    def test_nap_nums(self):
+        nap = parameters.sequence.nap
+        nap.mean = 1
+        # the default matches rejecting zeros of `num`
+        bulk = nap.nums(20000)
+        single = numpy.zeros(20000, dtype=int)
+        for i in range(len(single)):
+            while not single[i]:
+                single[i] = nap.num()
+        expected = numpy.bincount(single, minlength=6) / float(len(single))
+        self.assertFrequencies(bulk, expected, "default nums")
+        rng = numpy.random.RandomState(63)
+        nap.num = lambda : rng.choice([0, 0, 3])
+        self.assertEqual(nap.nums(50).tolist(), [3] * 50)
+
+    def test_promoter_signs(self):
+        with Registry():
+            rng = numpy.random.RandomState(64)
+            regulation = rng.choice([0, 0, 0, 1, -1], size=8000)
+            seq = edges2sequence(rng.randint(400, size=8000),
+                    rng.randint(400, size=8000), regulation, num_genes=400)
+            before = [tf_site.regulation for gene in seq\
+                    for tf_site in gene.promoters]
+            seq.initialise_promoters(seq)
+        after = [tf_site.regulation for gene in seq\
+                for tf_site in gene.promoters]
+        drawn = [sign for (old, sign) in zip(before, after) if old == 0]
+        self.assertEqual([sign for (old, sign) in zip(before, after) if old],
+                [old for old in before if old])
+        self.assertEqual(set(drawn), set([-1, 1]))
+        self.assertFrequencies(numpy.array(drawn) > 0,
+                numpy.array([0.5, 0.5]), "signs")
+
+    def test_nap_sites(self):
+        nap = parameters.sequence.nap
+        nap.mean = 2
+        nap.states = lambda : 5
+        with Registry():
+            genes = [GeneSite() for i in range(3000)]
+            seq = Sequence(genes)
+            seq.initialise_naps(genes)
+        self.assertTrue(all(isinstance(gene.product,
+                NucleoidAssociatedProtein) for gene in genes))
+        sites = seq[len(genes):]
+        self.assertTrue(all(isinstance(site, NAPBindingSite) for site in sites))
+        # sites of each NAP in the order of the genes
+        index = dict((gene.product, i) for (i, gene) in enumerate(genes))
+        ligands = [index[site.ligand] for site in sites]
+        self.assertEqual(ligands, sorted(ligands))
+        nums = numpy.bincount(ligands, minlength=len(genes))
+        self.assertTrue((nums > 0).all())
+        pmf = binomial_pmf(10, 0.2)
+        pmf[0] = 0.0
+        self.assertFrequencies(nums, pmf / pmf.sum(), "sites per NAP")
+        levels = numpy.array([site.regulation for site in sites])
+        self.assertEqual(set(levels.tolist()), set([-2, -1, 1, 2]))
+        self.assertFrequencies(levels + 2, numpy.array([0.25, 0.25, 0.0,
+                0.25, 0.25]), "levels")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===================
+Sequence Edit Tests
+===================
+
+:Date:
+    2026-10-18
+:File:
+    test_edits.py
+
+Incremental edits of a sequence must leave it as `Sequence.initialise` would.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.sequence import (Sequence, EmptySite, GeneSite,
+        TFBindingSite, NAPBindingSite)
+from regpy.model.mobile import TranscriptionFactor
+
+from support import ParameterTestMixin, random_sequence
+
+
+class SequenceEditTest(ParameterTestMixin, unittest.TestCase):
+
+    def spare(self, seq, rng):
+        kind = rng.randint(3)
+        if kind == 0:
+            return EmptySite()
+        if kind == 1:
+            return NAPBindingSite(ligand=seq._located[0], regulation=-1)
+        gene = GeneSite(product=TranscriptionFactor())
+        gene.promoters.append(TFBindingSite(ligand=seq._located[1],
+                regulation=1))
+        return gene
+
+    def test_edits_match_initialise(self):
+        with Registry():
+            seq = random_sequence(40, 100, seed=3, spacers=20)
+            # diffusion factors instead of the random binding factors
+            seq.initialise()
+            for i in range(5):
+                seq.introduce_polymerase()
+                seq.next()
+            rng = numpy.random.RandomState(6)
+            for step in range(60):
+                operation = rng.randint(3)
+                if operation == 0:
+                    seq.insert_sites(rng.randint(len(seq) + 1),
+                            [self.spare(seq, rng)\
+                            for i in range(rng.randint(1, 4))])
+                elif operation == 1:
+                    seq.delete_sites(rng.randint(len(seq) - 3),
+                            rng.randint(1, 4))
+                else:
+                    count = rng.randint(1, 5)
+                    seq.move_sites(rng.randint(len(seq) - count), count,
+                            rng.randint(len(seq) - count + 1))
+                sites = list(seq._binding_sites)
+                edited = [(site.distance, site.factor) for site in sites]
+                factors = seq.promoter_matrix.factor.copy()
+                offsets = seq.coordinates.offsets.copy()
+                for (rnap, pos) in seq.polymerases.iteritems():
+                    if pos < len(seq):
+                        self.assertTrue(seq[pos].occupied)
+                # initialises the same elements from scratch
+                reference = Sequence(list(seq))
+                reference.initialise()
+                self.assertEqual(len(reference._binding_sites), len(sites))
+                self.assertEqual(edited, [(site.distance, site.factor)\
+                        for site in sites], step)
+                self.assertTrue(numpy.array_equal(factors,
+                        reference.promoter_matrix.factor))
+                self.assertTrue(numpy.array_equal(offsets,
+                        reference.coordinates.offsets))
+
+
+if __name__ == "__main__":
+    unittest.main()
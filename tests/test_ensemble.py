@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Ensemble Tests
+==============
+
+:Date:
+    2026-10-18
+:File:
+    test_ensemble.py
+
+Every replicate of an ensemble must evolve like an independent fork.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+
+from support import (ParameterTestMixin, random_sequence, feed,
+        compiled_state)
+
+
+class EnsembleSequenceTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_rows_match_forks(self):
+        replicates = 5
+        with Registry():
+            compiled = random_sequence(30, 60, seed=4).compile()
+            ensemble = compiled.ensemble(replicates)
+            forks = [compiled.fork() for i in range(replicates)]
+            rng = numpy.random.RandomState(5)
+            for step in range(300):
+                mask = rng.random_sample(replicates) <\
+                        numpy.linspace(0.2, 0.9, replicates)
+                placed = ensemble.introduce_polymerase(mask)
+                for (r, fork) in enumerate(forks):
+                    if mask[r]:
+                        self.assertEqual(fork.introduce_polymerase(),
+                                placed[r])
+                if step % 25 == 0:
+                    for (r, fork) in enumerate(forks):
+                        feed(fork, r + 4.0)
+                        ensemble.concentrations[r, :-1] += r + 4.0
+                        ensemble._present[r, :-1] = True
+                ensemble.next()
+                for fork in forks:
+                    fork.next()
+                for (r, fork) in enumerate(forks):
+                    self.assertTrue(numpy.array_equal(
+                            ensemble.concentrations[r], fork.concentrations))
+                    self.assertTrue(numpy.array_equal(ensemble.tf_bound[r],
+                            fork.tf_bound))
+                    self.assertTrue(numpy.array_equal(ensemble.gene_rate[r],
+                            fork.gene_rate))
+                    self.assertTrue(numpy.array_equal(ensemble.occupied[r],
+                            fork.occupied))
+                    self.assertTrue(numpy.array_equal(
+                            ensemble.polymerase_positions(r),
+                            compiled_state(fork)["position"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
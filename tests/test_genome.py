@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+============
+Genome Tests
+============
+
+:Date:
+    2026-10-18
+:File:
+    test_genome.py
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.sequence import GeneSite
+from regpy.model.compiled import CompiledSequence
+from regpy.model.genome import Genome, split_sequence
+
+from support import ParameterTestMixin, random_sequence, gene_products
+
+
+def drive(model, steps, seed):
+    """
+    Steps a `Genome` or a `CompiledSequence` and returns the concentrations
+    after every step.
+    """
+    rng = numpy.random.RandomState(seed)
+    trajectory = list()
+    for step in range(steps):
+        if rng.random_sample() < 0.7:
+            if isinstance(model, Genome):
+                model.introduce_polymerases()
+            else:
+                model.introduce_polymerase()
+        if step % 50 == 0:
+            model.concentrations[:-1] += 3.0
+            model._present[:-1] = True
+        model.next()
+        trajectory.append(model.concentrations.copy())
+    return numpy.array(trajectory)
+
+
+class GenomeTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_split_distances(self):
+        with Registry():
+            seq = random_sequence(20, 60, seed=1)
+            products = gene_products(seq)
+            total = sum(len(site) for site in seq)
+            chromosomes = split_sequence(seq, [10])
+        home = dict()
+        for (k, chromosome) in enumerate(chromosomes):
+            for (i, site) in enumerate(chromosome):
+                if isinstance(site, GeneSite) and site.product is not None:
+                    self.assertEqual(site.product.location, i)
+                    home[site.product] = k
+        self.assertEqual(sorted(home), sorted(products))
+        foreign = 0
+        for (k, chromosome) in enumerate(chromosomes):
+            for (i, site) in enumerate(chromosome):
+                if not isinstance(site, GeneSite):
+                    continue
+                for tf_site in site.promoters:
+                    ligand = tf_site.ligand
+                    distance = tf_site.distance
+                    if home[ligand] == k:
+                        tf_site.update_distance(i, chromosome)
+                        self.assertEqual(distance, tf_site.distance)
+                    else:
+                        foreign += 1
+                        self.assertEqual(distance, total)
+                    self.assertAlmostEqual(tf_site.factor,
+                            ligand.association_constant *\
+                            numpy.exp(-distance / ligand.diffusion_constant))
+            self.assertEqual(chromosome.promoter_matrix.factor.tolist(),
+                    [tf_site.factor for tf_site in chromosome._tf_sites])
+        self.assertTrue(0 < foreign < 60)
+
+    def test_split_fixed_distance(self):
+        with Registry():
+            seq = random_sequence(20, 60, seed=53)
+            chromosomes = split_sequence(seq, [5, 12], distance=0)
+        for (k, chromosome) in enumerate(chromosomes):
+            for site in chromosome:
+                if not isinstance(site, GeneSite):
+                    continue
+                for tf_site in site.promoters:
+                    if not tf_site.ligand.location < len(chromosome) or\
+                            chromosome[tf_site.ligand.location].product is not\
+                            tf_site.ligand:
+                        self.assertEqual(tf_site.distance, 0)
+        self.assertRaises(ValueError, split_sequence, seq, [12, 5])
+
+    def test_threads(self):
+        with Registry():
+            seq = random_sequence(60, 120, seed=54)
+        results = list()
+        for threads in (1, 3):
+            with Genome(split_sequence(seq, [20, 45]),
+                    threads=threads) as genome:
+                results.append((drive(genome, 300, seed=55),
+                        [compiled.polymerases.position.tolist()\
+                        for compiled in genome.compiled]))
+        self.assertTrue(numpy.array_equal(results[0][0], results[1][0]))
+        self.assertEqual(results[0][1], results[1][1])
+        self.assertTrue(results[0][0].any())
+
+    def test_single_chromosome(self):
+        with Registry():
+            seq = random_sequence(40, 80, seed=56)
+        compiled = CompiledSequence(seq)
+        genome = Genome([seq], threads=1)
+        self.assertEqual(genome.products, compiled.products)
+        self.assertTrue(numpy.array_equal(drive(compiled, 300, seed=57),
+                drive(genome, 300, seed=57)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+===============
+Ingestion Tests
+===============
+
+:Date:
+    2026-10-18
+:File:
+    test_ingest.py
+
+Building a sequence from edge arrays must give the same genes, products and
+promoters in the same order as `network2trn` and `Sequence.linearise_trn`.
+"""
+
+
+import unittest
+
+import numpy
+
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+from regpy.model.registry import Registry
+from regpy.model.sequence import Sequence, network2trn
+from regpy.model.ingest import edges2sequence, adjacency2sequence
+
+
+def layout(seq):
+    return [(gene._name, None if gene.product is None else gene.product._name,
+            [(tf_site._name, tf_site.ligand._name, tf_site.regulation)\
+            for tf_site in gene.promoters]) for gene in seq]
+
+
+def random_edges(num_genes, num_edges, seed):
+    rng = numpy.random.RandomState(seed)
+    return (rng.randint(num_genes, size=num_edges),
+            rng.randint(num_genes, size=num_edges),
+            rng.randint(-1, 2, size=num_edges))
+
+
+class IngestTest(unittest.TestCase):
+
+    @unittest.skipIf(nx is None, "requires networkx")
+    def test_edges_match_network(self):
+        num_genes = 60
+        # duplicate edges where the last regulation wins
+        (source, target, regulation) = random_edges(num_genes, 400, seed=48)
+        network = nx.DiGraph()
+        network.add_nodes_from(range(num_genes))
+        for (u, v, sign) in zip(source, target, regulation):
+            network.add_edge(u, v, regulation=sign)
+        with Registry():
+            expected = Sequence()
+            expected.linearise_trn(network2trn(network))
+        with Registry():
+            seq = edges2sequence(source, target, regulation, num_genes)
+        self.assertEqual(layout(seq), layout(expected))
+
+    def test_adjacency_matches_edges(self):
+        num_genes = 40
+        (source, target, regulation) = random_edges(num_genes, 200, seed=49)
+        matrix = numpy.zeros((num_genes, num_genes), dtype=int)
+        matrix[source, target] = numpy.where(regulation == 0, 1, regulation)
+        (source, target) = numpy.nonzero(matrix)
+        with Registry():
+            expected = edges2sequence(source, target, matrix[source, target],
+                    num_genes)
+        with Registry():
+            seq = adjacency2sequence(matrix)
+        self.assertEqual(layout(seq), layout(expected))
+
+    def test_invalid(self):
+        with Registry():
+            self.assertRaises(ValueError, edges2sequence, [0, 1], [1])
+            self.assertRaises(ValueError, edges2sequence, [0, 3], [1, 2],
+                    num_genes=3)
+            self.assertRaises(ValueError, edges2sequence, [0, -1], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
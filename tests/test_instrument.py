@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=====================
+Instrumentation Tests
+=====================
+
+:Date:
+    2026-10-18
+:File:
+    test_instrument.py
+
+Probes must count the same events for objects and arrays without changing
+the outcome of a run.
+"""
+
+
+import itertools
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.instrument import StepProbe
+
+from support import ParameterTestMixin, random_sequence, feed, state
+
+
+def drive(models, steps, seed):
+    rng = numpy.random.RandomState(seed)
+    for step in range(steps):
+        if rng.random_sample() < 0.6:
+            for model in models:
+                model.introduce_polymerase()
+        if step % 25 == 0:
+            for model in models:
+                feed(model, 8.0)
+        for model in models:
+            model.next()
+
+
+class StepProbeTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_sequence_and_compiled_counts(self):
+        with Registry():
+            probed = random_sequence(30, 60, seed=45, spacers=10)
+            plain = random_sequence(30, 60, seed=45, spacers=10)
+        compiled = probed.compile()
+        probed.probe = StepProbe(timer=itertools.count().next)
+        compiled.probe = StepProbe()
+        transcribed = list()
+        probed.probe.connect("transcribed",
+                lambda rnap, gene: transcribed.append(gene))
+        drive([probed, plain, compiled], 300, seed=46)
+        self.assertEqual(state(probed), state(plain))
+        stats = probed.probe.stats()
+        events = stats["events"]
+        self.assertEqual(stats["steps"], 300)
+        self.assertTrue(events["transcribed"] > 0 and events["left"] > 0)
+        self.assertEqual(events, compiled.probe.stats()["events"])
+        self.assertEqual(len(transcribed), events["transcribed"])
+        self.assertEqual(stats["phases"]["binding"]["calls"], 300)
+        self.assertEqual(stats["phases"]["degradation"]["calls"], 300)
+        self.assertEqual(stats["phases"]["transcription"]["calls"],
+                events["transcribed"])
+        # the counting timer advances by one per reading
+        self.assertEqual(stats["phases"]["binding"]["mean"], 1.0)
+
+    def test_advance_counts(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=47, spacers=40)
+        stepped = seq.compile()
+        skipped = seq.compile()
+        stepped.probe = StepProbe()
+        skipped.probe = StepProbe()
+        for block in range(20):
+            for model in (stepped, skipped):
+                feed(model, 8.0)
+                model.introduce_polymerase()
+            for i in range(7):
+                stepped.next()
+            skipped.advance(7)
+        self.assertEqual(stepped.probe.stats()["events"],
+                skipped.probe.stats()["events"])
+        self.assertEqual(stepped.probe.steps, skipped.probe.steps)
+        self.assertTrue(skipped.probe.calls["skip"] > 0)
+
+    def test_reset_and_hooks(self):
+        probe = StepProbe()
+        seen = list()
+        hook = lambda rnap: seen.append(rnap)
+        probe.connect("left", hook)
+        probe.emit("left", 1)
+        probe.count("left", 3)
+        self.assertEqual((probe.events["left"], seen), (4, [1]))
+        probe.reset()
+        probe.disconnect("left", hook)
+        probe.emit("left", 2)
+        self.assertEqual((probe.events["left"], seen), (1, [1]))
+        self.assertRaises(ValueError, probe.connect, "unknown", hook)
+
+
+if __name__ == "__main__":
+    unittest.main()
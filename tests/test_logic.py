@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Gene Logic Tests
+================
+
+:Date:
+    2026-10-18
+:File:
+    test_logic.py
+
+Every rule must give the state that combining the promoter sites one by one
+gives, and the compiled engine must follow the rule of its sequence.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.sequence import GeneSite
+from regpy.model.logic import GeneLogic, RULES, PRODUCT, SUM, MAJORITY
+
+from support import ParameterTestMixin, random_sequence, feed, state
+
+
+def brute_state(rule, sites):
+    """
+    Combines (regulation, bound) pairs of the sites of one promoter.
+    """
+    if not sites:
+        return 0
+    if rule == PRODUCT:
+        state = 1
+        for (regulation, bound) in sites:
+            state *= regulation if bound else 0
+        return cmp(state, 0)
+    if rule == SUM:
+        return cmp(sum(regulation for (regulation, bound) in sites if bound),
+                0)
+    activators = sum(1 for (regulation, bound) in sites\
+            if bound and regulation > 0)
+    repressors = sum(1 for (regulation, bound) in sites\
+            if bound and regulation < 0)
+    if 2 * activators > len(sites):
+        return 1
+    if 2 * repressors > len(sites):
+        return -1
+    return 0
+
+
+class GeneLogicTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_states_match_brute_force(self):
+        rng = numpy.random.RandomState(50)
+        num_genes = 30
+        gene = numpy.sort(rng.randint(num_genes, size=90))
+        regulation = rng.choice([-1, 1], size=len(gene))
+        bound = rng.random_sample((5, len(gene))) < 0.6
+        for rule in RULES:
+            logic = GeneLogic(gene, regulation, num_genes, rule)
+            states = logic.states(bound)
+            self.assertEqual(states.shape, (5, num_genes))
+            for (row, flags) in enumerate(bound):
+                expected = [brute_state(rule, [(regulation[k], flags[k])\
+                        for k in numpy.flatnonzero(gene == i)])\
+                        for i in range(num_genes)]
+                self.assertEqual(states[row].tolist(), expected, rule)
+                self.assertEqual(logic.states(flags).tolist(), expected)
+        self.assertRaises(ValueError, GeneLogic, gene, regulation, num_genes,
+                u"unknown")
+
+    def test_rules_in_sequence_and_compiled(self):
+        for rule in (SUM, MAJORITY):
+            with Registry():
+                reference = random_sequence(30, 90, seed=51)
+                other = random_sequence(30, 90, seed=51)
+            reference.rule = rule
+            other.rule = rule
+            compiled = other.compile()
+            self.assertEqual(compiled.rule, rule)
+            genes = [site for site in reference if isinstance(site, GeneSite)]
+            seen = set()
+            rng = numpy.random.RandomState(52)
+            for step in range(200):
+                if rng.random_sample() < 0.6:
+                    reference.introduce_polymerase()
+                    compiled.introduce_polymerase()
+                if step % 25 == 0:
+                    feed(reference, 8.0)
+                    feed(compiled, 8.0)
+                reference.next()
+                compiled.next()
+                compiled.write_back()
+                expected = [brute_state(rule, [(tf_site.regulation,
+                        tf_site.bound) for tf_site in gene.promoters])\
+                        for gene in genes]
+                self.assertEqual(reference.gene_logic.states(
+                        reference.tf_bound).tolist(), expected)
+                self.assertEqual(state(reference), state(other),
+                        "%s differs in step %d" % (rule, step))
+                seen.update(expected)
+            self.assertEqual(seen, set([-1, 0, 1]), rule)
+
+
+if __name__ == "__main__":
+    unittest.main()
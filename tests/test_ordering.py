@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+================
+Gene Order Tests
+================
+
+:Date:
+    2026-10-18
+:File:
+    test_ordering.py
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.ordering import GeneOrder, SWAP, MOVE
+
+from support import ParameterTestMixin, random_sequence
+
+
+class GeneOrderTest(ParameterTestMixin, unittest.TestCase):
+
+    def test_delta_matches_cost(self):
+        with Registry():
+            order = GeneOrder(random_sequence(60, 120, seed=7, spacers=20))
+            self.assertTrue(len(order.site_element) > 0)
+            rng = numpy.random.RandomState(8)
+            for i in range(1000):
+                kind = (SWAP, MOVE)[rng.randint(2)]
+                (p, q) = rng.randint(len(order), size=2)
+                before = order.cost()
+                delta = order.delta(kind, p, q)
+                order.make(kind, p, q)
+                after = order.cost()
+                self.assertAlmostEqual(after - before, delta, delta=1e-9 *\
+                        max(1.0, abs(before)))
+
+    def test_make_matches_set_order(self):
+        with Registry():
+            seq = random_sequence(30, 60, seed=9)
+            order = GeneOrder(seq)
+            rng = numpy.random.RandomState(10)
+            for i in range(200):
+                (p, q) = rng.randint(len(order), size=2)
+                order.make((SWAP, MOVE)[i % 2], p, q)
+            reference = GeneOrder(seq)
+            reference.set_order(order.order)
+            self.assertTrue(numpy.array_equal(order.start, reference.start))
+            self.assertAlmostEqual(order.cost(), reference.cost())
+
+
+if __name__ == "__main__":
+    unittest.main()
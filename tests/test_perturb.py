@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==================
+Perturbation Tests
+==================
+
+:Date:
+    2026-10-18
+:File:
+    test_perturb.py
+
+Screens must return one result per target in the order of the targets, the
+same regardless of the number of processes and of the order of the targets.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.misc import ModelParameters
+from regpy.model.registry import Registry
+from regpy.model.streams import RandomStream
+from regpy.model.attractor import fingerprint
+from regpy.model.perturb import (KnockoutScreen, run_perturbation, GENE,
+        SITE, FLIP)
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+parameters = ModelParameters()
+
+
+def same(first, second):
+    return sorted(first) == sorted(second) and\
+            all(numpy.array_equal(first[key], second[key]) for key in first)
+
+
+class KnockoutScreenTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        gene = parameters.sequence.gene
+        self._rates = (gene.production, gene.leakage)
+        gene.production = lambda : 3.0
+        gene.leakage = lambda : 1.0
+        with Registry():
+            self.sequence = random_sequence(20, 40, seed=68, degradation=0.0)
+
+    def tearDown(self):
+        gene = parameters.sequence.gene
+        (gene.production, gene.leakage) = self._rates
+        ParameterTestMixin.tearDown(self)
+
+    def assertScreen(self, model, kind, targets=None):
+        key = fingerprint(model)
+        screen = KnockoutScreen(model, 100, kind, targets, seed=69,
+                introduction=0.6)
+        serial = screen.run(1)
+        self.assertEqual(len(serial), len(screen))
+        parallel = screen.run(3, chunksize=2)
+        self.assertTrue(all(same(a, b) for (a, b) in zip(serial, parallel)))
+        targets = list(screen.targets)
+        screen.targets = targets[::-1]
+        reverse = screen.run(2)[::-1]
+        self.assertTrue(all(same(a, b) for (a, b) in zip(serial, reverse)))
+        # results in the order of the targets
+        for target in targets[:2] + targets[-2:]:
+            stream = screen._stream((1, target))
+            self.assertTrue(same(serial[targets.index(target)],
+                    run_perturbation(model, kind, target, screen.introduce,
+                    rng=stream)))
+        self.assertEqual(fingerprint(model), key)
+        baseline = screen.baseline()
+        self.assertTrue(any(not same(result, baseline) for result in serial))
+        return serial
+
+    def test_deterministic(self):
+        compiled = self.sequence.compile()
+        feed(compiled, 4.0)
+        self.assertScreen(compiled, GENE)
+        for kind in (SITE, FLIP):
+            self.assertScreen(compiled, kind, range(0, len(compiled.tf_sites),
+                    3))
+
+    def test_stochastic(self):
+        compiled = self.sequence.compile(stochastic=True, rng=RandomStream(70))
+        feed(compiled, 4.0)
+        state = compiled.rng.get_state()
+        results = self.assertScreen(compiled, GENE)
+        self.assertTrue(len(set(result["concentrations"].tostring()\
+                for result in results)) > 1)
+        self.assertTrue(numpy.array_equal(compiled.rng.get_state()[1],
+                state[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
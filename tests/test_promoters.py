@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Promoter Tests
+==============
+
+:Date:
+    2026-10-18
+:File:
+    test_promoters.py
+
+`Sequence.next` must bind promoter sites according to their current ligand,
+regulation and factor like evaluating the site objects on every step would.
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.misc import ModelParameters
+from regpy.model.registry import Registry
+from regpy.model.sequence import GeneSite
+from regpy.model.ingest import edges2sequence
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+parameters = ModelParameters()
+
+
+def tf_sites(seq):
+    return [tf_site for site in seq if isinstance(site, GeneSite)\
+            for tf_site in site.promoters]
+
+
+class PromoterTest(ParameterTestMixin, unittest.TestCase):
+
+    def step(self, seq):
+        """
+        Steps the sequence and checks the bound flags of all promoter sites
+        against the concentrations at the beginning of the step.
+        """
+        sites = tf_sites(seq)
+        threshold = parameters.sequence.tf.threshold
+        expected = [tf_site.factor * seq.concentrations.get(tf_site.ligand,
+                0.0) >= threshold for tf_site in sites]
+        seq.next()
+        self.assertEqual([tf_site.bound for tf_site in sites], expected)
+        self.assertEqual(seq.tf_bound.tolist(), expected)
+
+    def test_initialise_promoters_after_initialise(self):
+        with Registry():
+            rng = numpy.random.RandomState(20)
+            seq = edges2sequence(rng.randint(20, size=50),
+                    rng.randint(20, size=50), num_genes=20)
+            seq.initialise()
+            seq.next()
+            self.assertFalse(seq.gene_logic.regulation.any())
+            seq.initialise_promoters(seq)
+            seq.next()
+        regulation = [tf_site.regulation for tf_site in tf_sites(seq)]
+        self.assertTrue(all(regulation))
+        self.assertEqual(seq.gene_logic.regulation.tolist(), regulation)
+        self.assertEqual(seq.promoter_matrix.regulation.tolist(), regulation)
+
+    def test_changed_factor(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=21)
+        feed(seq, 2.0)
+        for i in range(3):
+            self.step(seq)
+        sites = tf_sites(seq)
+        for tf_site in sites[::3]:
+            tf_site.factor = 10.0 if tf_site.bound else 0.0
+        sites[1].regulation = -sites[1].regulation
+        for i in range(3):
+            self.step(seq)
+        self.assertEqual(seq.promoter_matrix.factor.tolist(),
+                [tf_site.factor for tf_site in sites])
+        self.assertEqual(seq.gene_logic.regulation[1], sites[1].regulation)
+
+    def test_flags_follow_binding(self):
+        with Registry():
+            seq = random_sequence(30, 60, seed=22, spacers=10)
+        rng = numpy.random.RandomState(23)
+        for step in range(200):
+            if rng.random_sample() < 0.5:
+                seq.introduce_polymerase()
+            if step % 40 == 0:
+                feed(seq, 4.0)
+            if step == 100:
+                seq.reset()
+                self.assertFalse(any(tf_site.bound for tf_site in\
+                        tf_sites(seq)))
+            if step == 150:
+                compiled = seq.compile()
+                for i in range(5):
+                    compiled.next()
+                compiled.write_back()
+            self.step(seq)
+
+    def test_revision_without_change(self):
+        with Registry():
+            seq = random_sequence(10, 20, seed=24)
+            seq.next()
+            matrix = seq.promoter_matrix
+            for tf_site in tf_sites(seq):
+                tf_site.factor = tf_site.factor
+            seq.next()
+        self.assertTrue(seq.promoter_matrix is matrix)
+
+
+if __name__ == "__main__":
+    unittest.main()
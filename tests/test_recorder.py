@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Recorder Tests
+==============
+
+:Date:
+    2026-10-18
+:File:
+    test_recorder.py
+
+Recordings must read back exactly what was sampled, also while they are
+still being written.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.recorder import TrajectoryRecorder, open_trajectory
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+class TrajectoryRecorderTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        ParameterTestMixin.tearDown(self)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_round_trip(self):
+        with Registry():
+            reference = random_sequence(20, 40, seed=17)
+            compiled = random_sequence(20, 40, seed=17).compile()
+        first = TrajectoryRecorder(reference, self.path("sequence.dat"),
+                every=3, chunk=7)
+        second = TrajectoryRecorder(compiled, self.path("compiled.dat"),
+                every=3, chunk=7)
+        expected = list()
+        rng = numpy.random.RandomState(18)
+        for step in range(1, 101):
+            if rng.random_sample() < 0.5:
+                reference.introduce_polymerase()
+                compiled.introduce_polymerase()
+            if step % 25 == 1:
+                feed(reference, 8.0)
+                feed(compiled, 8.0)
+            reference.next()
+            compiled.next()
+            first.record()
+            second.record()
+            if step % 3 == 0:
+                expected.append((step, compiled.concentrations[:-1].copy(),
+                        compiled.gene_rate.copy()))
+            if step == 50:
+                # only the two full chunks are committed
+                partial = open_trajectory(self.path("compiled.dat"))
+                self.assertFalse(partial.complete)
+                self.assertEqual(len(partial), 14)
+                self.assertEqual(list(partial.steps), [s for (s, c, r) in\
+                        expected[:14]])
+                self.assertTrue(numpy.array_equal(partial.concentrations,
+                        [c for (s, c, r) in expected[:14]]))
+        first.close()
+        second.close()
+        objects = open_trajectory(self.path("sequence.dat"))
+        arrays = open_trajectory(self.path("compiled.dat"))
+        self.assertTrue(arrays.complete)
+        self.assertEqual(len(arrays), len(expected))
+        self.assertEqual(os.path.getsize(self.path("compiled.dat")),
+                len(expected) * arrays.dtype.itemsize)
+        self.assertEqual(list(arrays.steps), [s for (s, c, r) in expected])
+        self.assertTrue(numpy.array_equal(arrays.concentrations,
+                [c for (s, c, r) in expected]))
+        self.assertTrue(numpy.array_equal(arrays.rate,
+                [r for (s, c, r) in expected]))
+        self.assertEqual(len(objects.products), len(arrays.products))
+        for name in ("concentrations", "rate", "active", "polymerases"):
+            self.assertTrue(numpy.array_equal(objects.data[name],
+                    arrays.data[name]), name)
+        self.assertTrue(numpy.array_equal(arrays.column(arrays.products[2]),
+                arrays.concentrations[:, 2]))
+
+    def test_run_matches_record(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=19, spacers=20)
+        stepped = seq.compile()
+        skipped = seq.compile()
+        for model in (stepped, skipped):
+            feed(model, 8.0)
+            for i in range(5):
+                model.introduce_polymerase()
+                model.next()
+        recorder = TrajectoryRecorder(stepped, self.path("stepped.dat"),
+                every=4, chunk=5)
+        recorder.sample()
+        for i in range(61):
+            stepped.next()
+            recorder.record()
+        recorder.close()
+        recorder = TrajectoryRecorder(skipped, self.path("skipped.dat"),
+                every=4, chunk=5)
+        recorder.sample()
+        recorder.run(61)
+        recorder.close()
+        first = open_trajectory(self.path("stepped.dat"))
+        second = open_trajectory(self.path("skipped.dat"))
+        self.assertEqual(len(first), 16)
+        self.assertTrue(numpy.array_equal(first.data, second.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+==============
+Registry Tests
+==============
+
+:Date:
+    2026-10-18
+:File:
+    test_registry.py
+"""
+
+
+import gc
+import unittest
+
+from regpy.model.registry import Registry, current_registry, default_registry
+from regpy.model.sequence import EmptySite, GeneSite
+from regpy.model.mobile import TranscriptionFactor
+
+
+class RegistryTest(unittest.TestCase):
+
+    def test_scopes(self):
+        self.assertTrue(current_registry() is default_registry)
+        with Registry() as outer:
+            first = EmptySite(name=u"spacer")
+            with Registry() as inner:
+                self.assertTrue(current_registry() is inner)
+                second = EmptySite(name=u"spacer")
+                self.assertTrue(EmptySite(name=u"spacer") is second)
+            self.assertTrue(current_registry() is outer)
+            self.assertFalse(first is second)
+            self.assertTrue(EmptySite(name=u"spacer") is first)
+            self.assertEqual(len(outer), 1)
+            self.assertEqual(len(inner), 1)
+        self.assertTrue(current_registry() is default_registry)
+        self.assertFalse((EmptySite, u"spacer") in default_registry)
+
+    def test_counters(self):
+        with Registry() as reg:
+            names = [GeneSite()._name for i in range(3)]
+            reg.reserve(GeneSite, 10)
+            names.append(GeneSite()._name)
+            reg.clear()
+            names.append(GeneSite()._name)
+        self.assertEqual(names, [u"GeneSite_1", u"GeneSite_2", u"GeneSite_3",
+                u"GeneSite_11", u"GeneSite_1"])
+
+    def test_weak(self):
+        with Registry(weak=True) as reg:
+            kept = TranscriptionFactor(name=u"kept")
+            TranscriptionFactor(name=u"dropped")
+            gc.collect()
+            self.assertEqual(reg.instances(TranscriptionFactor), [kept])
+            self.assertTrue(TranscriptionFactor(name=u"kept") is kept)
+            del kept
+            gc.collect()
+            self.assertEqual(len(reg), 0)
+
+    def test_strong(self):
+        with Registry() as reg:
+            TranscriptionFactor(name=u"dropped")
+            gc.collect()
+            self.assertEqual(len(reg.instances(TranscriptionFactor)), 1)
+
+    def test_exit_out_of_order(self):
+        outer = Registry()
+        inner = Registry()
+        outer.__enter__()
+        inner.__enter__()
+        try:
+            self.assertRaises(RuntimeError, outer.__exit__, None, None, None)
+        finally:
+            inner.__exit__(None, None, None)
+            outer.__exit__(None, None, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
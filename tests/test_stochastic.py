@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=======================
+Stochastic Engine Tests
+=======================
+
+:Date:
+    2026-10-18
+:File:
+    test_stochastic.py
+"""
+
+
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.streams import RandomStream
+from regpy.model.ensemble import EnsembleSequence
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+class RecordingStream(object):
+    """
+    Passes draws on to a generator and notes their kind and shape.
+    """
+
+    def __init__(self, rng, *args, **kw_args):
+        object.__init__(self)
+        self.rng = rng
+        self.calls = list()
+
+    def random_sample(self, size=None):
+        self.calls.append(("random_sample", size))
+        return self.rng.random_sample(size)
+
+    def binomial(self, trials, prob, size=None):
+        self.calls.append(("binomial", numpy.shape(trials)))
+        return self.rng.binomial(trials, prob, size)
+
+
+def drive(models, steps, seed):
+    rng = numpy.random.RandomState(seed)
+    for step in range(steps):
+        if rng.random_sample() < 0.6:
+            for model in models:
+                model.introduce_polymerase()
+        if step % 25 == 0:
+            for model in models:
+                feed(model, 20.0)
+        for model in models:
+            model.next()
+
+
+class StochasticSequenceTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        with Registry():
+            self.sequence = random_sequence(30, 60, seed=25)
+
+    def assertSameState(self, first, second):
+        for name in ("concentrations", "tf_bound", "gene_rate", "gene_active",
+                "occupied"):
+            self.assertTrue(numpy.array_equal(getattr(first, name),
+                    getattr(second, name)), name)
+        self.assertTrue(numpy.array_equal(first.polymerases.position,
+                second.polymerases.position))
+
+    def test_equal_streams(self):
+        first = self.sequence.compile(stochastic=True, rng=RandomStream(26))
+        second = self.sequence.compile(stochastic=True, rng=RandomStream(26))
+        drive([first, second], 200, seed=27)
+        self.assertSameState(first, second)
+        self.assertTrue(first.concentrations.any())
+
+    def test_forks(self):
+        model = self.sequence.compile(stochastic=True, rng=RandomStream(28))
+        drive([model], 50, seed=29)
+        copied = model.fork()
+        same = [model.fork(RandomStream(30)), model.fork(RandomStream(30))]
+        other = model.fork(RandomStream(31))
+        drive([model, copied] + same + [other], 150, seed=32)
+        self.assertSameState(model, copied)
+        self.assertSameState(*same)
+        self.assertFalse(numpy.array_equal(same[0].concentrations,
+                other.concentrations))
+
+    def test_draw_shapes(self):
+        stream = RecordingStream(RandomStream(33))
+        model = self.sequence.compile(stochastic=True, rng=stream)
+        rng = numpy.random.RandomState(34)
+        for step in range(100):
+            if rng.random_sample() < 0.6:
+                model.introduce_polymerase()
+            if step % 25 == 0:
+                feed(model, 20.0)
+            pool = model.polymerases.position
+            active = numpy.count_nonzero(pool < len(model))
+            del stream.calls[:]
+            model.next()
+            expected = [("random_sample", len(model.tf_bound))]
+            if active > 0:
+                expected.append(("random_sample", active))
+            expected.append(("binomial", model.concentrations.shape))
+            self.assertEqual(stream.calls, expected)
+
+    def test_no_binding_without_ligand(self):
+        model = self.sequence.compile(stochastic=True, rng=RandomStream(35))
+        model.next()
+        self.assertFalse(model.tf_bound.any())
+        self.assertTrue((model.concentrations == 0.0).all())
+
+    def test_no_ensemble(self):
+        model = self.sequence.compile(stochastic=True, rng=RandomStream(36))
+        self.assertRaises(ValueError, model.ensemble, 3)
+        self.assertRaises(ValueError, EnsembleSequence, model, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
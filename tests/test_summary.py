@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=======================
+Summary Statistic Tests
+=======================
+
+:Date:
+    2026-10-18
+:File:
+    test_summary.py
+
+Merged statistics must equal those of one pass over all samples.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from regpy.model.registry import Registry
+from regpy.model.summary import (OnlineStatistics, SummaryRecorder,
+        load_summary, merge_summaries)
+
+from support import ParameterTestMixin, random_sequence, feed
+
+
+def accumulate(samples, threshold):
+    stats = OnlineStatistics(samples.shape[1], threshold)
+    for values in samples:
+        stats.update(values)
+    return stats
+
+
+class SummaryTest(ParameterTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        ParameterTestMixin.setUp(self)
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        ParameterTestMixin.tearDown(self)
+
+    def assertMatches(self, stats, samples, threshold):
+        self.assertEqual(stats.count, len(samples))
+        self.assertTrue(numpy.array_equal(stats.minimum, samples.min(axis=0)))
+        self.assertTrue(numpy.array_equal(stats.maximum, samples.max(axis=0)))
+        self.assertTrue(numpy.array_equal(stats.above,
+                (samples > threshold).sum(axis=0)))
+        self.assertTrue(numpy.allclose(stats.mean, samples.mean(axis=0),
+                rtol=1e-12, atol=1e-12))
+        self.assertTrue(numpy.allclose(stats.variance(),
+                samples.var(axis=0), rtol=1e-10, atol=1e-12))
+        self.assertTrue(numpy.allclose(stats.variance(1),
+                samples.var(axis=0, ddof=1), rtol=1e-10, atol=1e-12))
+
+    def test_merge_matches_single_pass(self):
+        rng = numpy.random.RandomState(65)
+        samples = numpy.vstack([rng.poisson(50.0, size=(400, 7)),
+                1e6 + rng.random_sample((300, 7))])
+        threshold = numpy.linspace(0.0, 1e6, 7)
+        cuts = [0, 1, 57, 58, 300, 611, len(samples)]
+        parts = [accumulate(samples[start:end], threshold)\
+                for (start, end) in zip(cuts[:-1], cuts[1:])]
+        forward = OnlineStatistics(7, threshold)
+        for part in parts:
+            forward.merge(part)
+        backward = OnlineStatistics(7, threshold)
+        for part in reversed(parts):
+            backward.merge(part)
+        self.assertMatches(forward, samples, threshold)
+        self.assertMatches(backward, samples, threshold)
+        self.assertMatches(accumulate(samples, threshold), samples, threshold)
+        # merging nothing changes nothing
+        before = forward.to_arrays()
+        forward.merge(OnlineStatistics(7, threshold))
+        for (key, value) in forward.to_arrays().iteritems():
+            self.assertTrue(numpy.array_equal(value, before[key]), key)
+        self.assertRaises(ValueError, forward.merge, OnlineStatistics(6))
+        self.assertRaises(ValueError, forward.merge, OnlineStatistics(7))
+
+    def test_replicates(self):
+        with Registry():
+            seq = random_sequence(20, 40, seed=66)
+        paths = list()
+        samples = list()
+        for replicate in range(3):
+            compiled = seq.compile()
+            recorder = SummaryRecorder(compiled, every=2, threshold=4.0)
+            rng = numpy.random.RandomState(67 + replicate)
+            for step in range(100 * (replicate + 1)):
+                if rng.random_sample() < 0.6:
+                    compiled.introduce_polymerase()
+                if step % 25 == 0:
+                    feed(compiled, 8.0)
+                compiled.next()
+                recorder.record()
+                if recorder.step % 2 == 0:
+                    samples.append(compiled.concentrations[:-1].copy())
+            paths.append(os.path.join(self.path, "%d.npz" % replicate))
+            recorder.save(paths[-1])
+            loaded = load_summary(paths[-1])
+            for (name, stats) in (("concentrations", recorder.concentrations),
+                    ("activity", recorder.activity)):
+                expected = stats.to_arrays()
+                for (key, value) in getattr(loaded,
+                        name).to_arrays().iteritems():
+                    self.assertTrue(numpy.array_equal(value, expected[key]),
+                            key)
+        total = merge_summaries(load_summary(path) for path in paths)
+        self.assertEqual(total.step, 600)
+        self.assertEqual(total.products, loaded.products)
+        self.assertMatches(total.concentrations, numpy.array(samples), 4.0)
+        self.assertTrue(total.concentrations.above.any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+"""
+=====================
+Parameter Sweep Tests
+=====================
+
+:Date:
+    2026-10-18
+:File:
+    test_sweep.py
+
+Sweep results must not depend on the number of processes and must come back
+in the order of the design.
+"""
+
+
+import unittest
+
+import numpy
+import networkx as nx
+
+from regpy.model.misc import ModelParameters
+from regpy.model.streams import RandomStream
+from regpy.model.sweep import (ParameterSweep, parameter_grid,
+        latin_hypercube, run_point)
+
+
+parameters = ModelParameters()
+
+
+def random_network(num_nodes, prob, seed):
+    net = nx.gnp_random_graph(num_nodes, prob, directed=True, seed=seed)
+    for (u, v) in net.edges():
+        net[u][v]["regulation"] = 0
+    return net
+
+
+class ParameterSweepTest(unittest.TestCase):
+
+    def setUp(self):
+        self.network = random_network(30, 0.1, seed=2)
+        self.points = parameter_grid({
+                "mobile.tf.degradation": [0.0, 0.05],
+                "sequence.tf.threshold": [0.1, 0.5]})
+        self.points += latin_hypercube({"mobile.tf.association": (0.1, 1.0)},
+                3, seed=1)
+
+    def assertResultsEqual(self, expected, result):
+        self.assertEqual(len(expected), len(result))
+        for (first, second) in zip(expected, result):
+            self.assertEqual(sorted(first), sorted(second))
+            for name in first:
+                self.assertTrue(numpy.array_equal(first[name], second[name]),
+                        name)
+
+    def test_design(self):
+        self.assertEqual(len(self.points), 7)
+        self.assertEqual(self.points[1], {"mobile.tf.degradation": 0.0,
+                "sequence.tf.threshold": 0.5})
+        values = sorted(point["mobile.tf.association"]\
+                for point in self.points[4:])
+        # one value per stratum
+        self.assertEqual([int((value - 0.1) / 0.3) for value in values],
+                [0, 1, 2])
+
+    def test_processes_do_not_matter(self):
+        threshold = parameters.sequence.tf.threshold
+        degradation = parameters.mobile.tf.degradation
+        sweep = ParameterSweep(self.network, self.points, 100, seed=7)
+        serial = sweep.run(processes=1)
+        self.assertResultsEqual(serial, sweep.run(processes=3, chunksize=2))
+        self.assertResultsEqual(serial, ParameterSweep(self.network,
+                self.points, 100, seed=7).run(processes=2))
+        self.assertEqual(parameters.sequence.tf.threshold, threshold)
+        self.assertTrue(parameters.mobile.tf.degradation is degradation)
+
+    def test_design_order(self):
+        sweep = ParameterSweep(self.network, self.points, 100, seed=7)
+        results = sweep.run(processes=2, chunksize=1)
+        streams = RandomStream(7).spawn(len(self.points))
+        for i in (0, 3, 6):
+            self.assertResultsEqual([results[i]], [run_point(self.network,
+                    self.points[i], streams[i], 100)])
+
+
+if __name__ == "__main__":
+    unittest.main()